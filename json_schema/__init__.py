@@ -5,12 +5,22 @@ A modern, object-oriented JSON schema validator with a focus on
 maintainability, clarity, and robust error reporting.
 """
 
+import importlib
+import logging
+
 from .api import ErrorCode, JsonValidator, ValidationError, ValidationResult
-from .schema_compiler import SchemaCompiler
-from .validator import Validator
 from .utils import JsonPointer
 from .version import __version__
 
+# Library code should not emit log output unless the application configures it
+logging.getLogger("json_schema").addHandler(logging.NullHandler())
+
+# Attributes whose modules are only imported on first access
+_LAZY_ATTRIBUTES = {
+    "SchemaCompiler": ".schema_compiler",
+    "Validator": ".validator"
+}
+
 __all__ = [
     "ErrorCode",
     "JsonPointer",
@@ -20,3 +30,22 @@ __all__ = [
     "ValidationResult",
     "Validator"
 ]
+
+
+def __getattr__(name: str):
+    """
+    Import lazily loaded attributes on first access.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        The requested attribute
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
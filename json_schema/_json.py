@@ -0,0 +1,81 @@
+"""
+JSON parsing helpers.
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON document as bytes or text
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def dumps_canonical(data: Any) -> bytes:
+    """
+    Serialize JSON data with sorted keys and no insignificant whitespace.
+
+    Structurally equal documents serialize to the same bytes, which makes
+    the result suitable for hashing.
+
+    Args:
+        data: JSON data to serialize
+
+    Returns:
+        Serialized document as UTF-8 bytes
+
+    Raises:
+        TypeError: If the data contains values that are not JSON serializable
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            # Fall through for inputs orjson rejects, e.g. non-string keys
+            pass
+
+    return json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def load(filepath: Union[str, Path]) -> Any:
+    """
+    Read and parse a JSON file.
+
+    The whole file is read at once, which is faster than the incremental
+    decoding done by json.load.
+
+    Args:
+        filepath: Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If the file contains invalid JSON
+    """
+    return loads(Path(filepath).read_bytes())
@@ -2,9 +2,13 @@
 Public API for the Enhanced JSON Schema Validator.
 """
 
+import hashlib
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, Union, Tuple
+from typing import Any, Callable, Dict, List, Optional, Union, Tuple
+
+from . import _json
 
 
 class ErrorCode(Enum):
@@ -39,7 +43,7 @@ class ErrorCode(Enum):
     CUSTOM_ERROR = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationError:
     """
     Represents a validation error with structured information.
@@ -47,23 +51,41 @@ class ValidationError:
     Attributes:
         code: The error code identifying the type of error
         path: JSON Pointer to the value that failed validation
-        message: Human-readable error message
+        message: Human-readable error message, or a callable that builds it
+            on demand; errors in a ValidationResult always hold a string
         schema_path: JSON Pointer to the schema location that triggered the error
         value: The value that failed validation
         constraint: The constraint that was violated
+        property_name: Name of the property the error is about, for errors
+            about a property of the object at path (e.g. an additional property)
     """
     code: ErrorCode
     path: str
-    message: str
+    message: Union[str, Callable[[], str]]
     schema_path: Optional[str] = None
     value: Any = None
     constraint: Any = None
+    property_name: Optional[str] = None
+
+    @property
+    def formatted(self) -> str:
+        """
+        Get the error message, building it first if it is deferred.
+
+        Returns:
+            Human-readable error message
+        """
+        message = self.message
+        if callable(message):
+            message = message()
+            self.message = message
+        return message
 
     def __str__(self) -> str:
-        return f"Error at '{self.path}': {self.message}"
+        return f"Error at '{self.path}': {self.formatted}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """
     Result of schema validation.
@@ -87,6 +109,9 @@ class JsonValidator:
     against a JSON Schema.
     """
 
+    # Maximum number of compiled schemas kept in the compile cache
+    COMPILE_CACHE_SIZE = 128
+
     def __init__(self, verbose: bool = False):
         """
         Initialize a new JSON validator.
@@ -101,19 +126,115 @@ class JsonValidator:
         self.schema_compiler = SchemaCompiler()
         self.validator = Validator(verbose=verbose)
 
-    def validate(self, data: Any, schema: Dict[str, Any]) -> ValidationResult:
+        # Schema id -> (schema, compiled constraint), in LRU order
+        self._compiled_cache: "OrderedDict[int, Tuple[Dict[str, Any], Any]]" = OrderedDict()
+
+        # Structural schema digest -> compiled constraint, in LRU order
+        self._digest_cache: "OrderedDict[bytes, Any]" = OrderedDict()
+
+    def compile(self, schema: Dict[str, Any]) -> Any:
+        """
+        Compile a JSON schema into a constraint tree, reusing cached results.
+
+        Compiled schemas are cached by the identity of the schema object, so
+        repeated validations against the same schema skip recompilation.
+        On an identity miss, a digest of the schema contents is checked as
+        well, so a structurally equal schema (e.g. one reloaded from disk)
+        reuses the existing constraint tree. A schema must not be mutated
+        after it has been compiled.
+
+        Args:
+            schema: The JSON schema to compile
+
+        Returns:
+            Root constraint of the compiled schema
+        """
+        key = id(schema)
+        entry = self._compiled_cache.get(key)
+        if entry is not None:
+            self._compiled_cache.move_to_end(key)
+            return entry[1]
+
+        digest = self._schema_digest(schema)
+        compiled_schema = None
+        if digest is not None:
+            compiled_schema = self._digest_cache.get(digest)
+
+        if compiled_schema is not None:
+            self._digest_cache.move_to_end(digest)
+        else:
+            compiled_schema = self.schema_compiler.compile(schema)
+            if digest is not None:
+                self._digest_cache[digest] = compiled_schema
+                if len(self._digest_cache) > self.COMPILE_CACHE_SIZE:
+                    self._digest_cache.popitem(last=False)
+
+        # Keep a reference to the schema so its id cannot be reused while cached
+        self._compiled_cache[key] = (schema, compiled_schema)
+        if len(self._compiled_cache) > self.COMPILE_CACHE_SIZE:
+            self._compiled_cache.popitem(last=False)
+
+        return compiled_schema
+
+    @staticmethod
+    def _schema_digest(schema: Dict[str, Any]) -> Optional[bytes]:
+        """
+        Compute a structural digest of a schema.
+
+        Args:
+            schema: The JSON schema to digest
+
+        Returns:
+            16-byte digest, or None if the schema is not JSON serializable
+        """
+        try:
+            data = _json.dumps_canonical(schema)
+        except (TypeError, ValueError):
+            return None
+
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    def validate(self, data: Any, schema: Dict[str, Any], fail_fast: bool = False) -> ValidationResult:
         """
         Validate data against a JSON schema.
 
         Args:
             data: The data to validate
-            schema: The JSON schema to validate against
+            schema: The JSON schema to validate against, or a constraint
+                tree previously returned by compile()
+            fail_fast: Whether to stop checking a value at its first error;
+                invalid data then reports only some of its errors
 
         Returns:
             ValidationResult containing validation status and any errors
         """
         # Compile the schema into a constraint tree
-        compiled_schema = self.schema_compiler.compile(schema)
+        if isinstance(schema, dict):
+            compiled_schema = self.compile(schema)
+        else:
+            compiled_schema = schema
 
         # Validate the data against the compiled schema
-        return self.validator.validate(data, compiled_schema)
+        return self.validator.validate(data, compiled_schema, fail_fast=fail_fast)
+
+    def is_valid(self, data: Any, schema: Dict[str, Any]) -> bool:
+        """
+        Check whether data is valid against a JSON schema.
+
+        This is faster than validate() because validation stops at the
+        first error and no error objects or messages are constructed.
+
+        Args:
+            data: The data to validate
+            schema: The JSON schema to validate against, or a constraint
+                tree previously returned by compile()
+
+        Returns:
+            True if the data is valid, False otherwise
+        """
+        if isinstance(schema, dict):
+            compiled_schema = self.compile(schema)
+        else:
+            compiled_schema = schema
+
+        return self.validator.validate(data, compiled_schema, collect_errors=False).valid
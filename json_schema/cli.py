@@ -16,13 +16,9 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, Optional, List
 
+from . import _json
 from .api import JsonValidator
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(levelname)s: %(message)s",
-)
 logger = logging.getLogger("enhanced_validator")
 
 
@@ -44,12 +40,11 @@ def load_json(filepath: Path) -> Dict[str, Any]:
     if filepath and (isinstance(filepath, str) and len(filepath) > 0) and not Path(filepath).exists():
         raise FileNotFoundError(f"File not found: {filepath}")
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        try:
-            return json.load(f)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON in {filepath}: {e}")
-            raise
+    try:
+        return _json.load(filepath)
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse JSON in {filepath}: {e}")
+        raise
 
 
 def parse_args() -> argparse.Namespace:
@@ -78,8 +73,17 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> int:
     """Main entry point for the script."""
+    # Set up logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(levelname)s: %(message)s",
+    )
+
     args = parse_args()
 
+    if args.verbose:
+        logging.getLogger("json_schema").setLevel(logging.DEBUG)
+
     data_file_path = Path(args.data_file)
     schema_file_path = Path(args.schema_file)
 
@@ -96,11 +100,12 @@ def main() -> int:
         logger.error(f"Schema error: {str(e)}")
         return 1
 
-    # Create validator
+    # Create validator and compile the schema once up front
     validator = JsonValidator(verbose=args.verbose)
+    compiled_schema = validator.compile(schema)
 
     # Validate data
-    result = validator.validate(data, schema)
+    result = validator.validate(data, compiled_schema)
 
     # Report results
     if result.valid:
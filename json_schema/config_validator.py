@@ -3,16 +3,65 @@
 Project configuration validator implementation.
 """
 
+import functools
 import json
 import logging
 import os
+import re
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Union, Any, Set
 
+from . import _json
 from .schema_validator import JsonSchemaValidator
 
 logger = logging.getLogger("json_schema")
 
+# Platforms accepted in file groups, and their listing for error messages
+_PLATFORMS = ("any", "windows", "apple", "linux", "posix")
+_VALID_PLATFORMS = frozenset(_PLATFORMS)
+_VALID_PLATFORMS_STR = ", ".join(_PLATFORMS)
+
+# Project keys that hold file groups, booleans and path prefixes
+_FILE_SECTIONS = frozenset({"includes", "module_includes", "sources", "module_sources"})
+_BOOLEAN_FIELDS = frozenset({"library", "executable", "install"})
+_PREFIX_FIELDS = frozenset({"include_prefix", "source_prefix"})
+
+# Prefix key used by each file section, and the default value of each prefix
+_SECTION_PREFIX_KEYS = {
+    "includes": "include_prefix",
+    "module_includes": "include_prefix",
+    "sources": "source_prefix",
+    "module_sources": "source_prefix",
+}
+_DEFAULT_PREFIXES = {
+    "include_prefix": "${CMAKE_CURRENT_LIST_DIR}/include",
+    "source_prefix": "${CMAKE_CURRENT_LIST_DIR}/src",
+}
+
+# Matches a CMake variable reference such as ${CMAKE_CURRENT_LIST_DIR}
+_CMAKE_VAR_RE = re.compile(r"\$\{([^}]*)\}")
+
+
+@functools.lru_cache(maxsize=32)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a JSON file, caching the result per file version.
+
+    The modification time and size are part of the cache key so that a
+    changed file is parsed again. Cached documents are shared between
+    callers and must not be mutated.
+
+    Args:
+        path_str: Path to the JSON file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+
+    Returns:
+        Parsed JSON data
+    """
+    return _json.load(path_str)
+
 
 class ConfigValidator:
     """Validates project configuration files against a schema with custom rules."""
@@ -22,7 +71,8 @@ class ConfigValidator:
         check_file_existence: bool = False,
         verbose: bool = False,
         base_dir: Optional[Path] = None,
-        cmake_vars: Optional[Dict[str, str]] = None
+        cmake_vars: Optional[Dict[str, str]] = None,
+        precompiled_schema: Optional[Any] = None
     ):
         """
         Initialize the configuration validator.
@@ -32,19 +82,22 @@ class ConfigValidator:
             verbose: If True, log additional details during validation
             base_dir: Base directory for resolving relative file paths
             cmake_vars: Dictionary of CMake variables for expanding in prefixes
+            precompiled_schema: Schema to validate against, as returned by
+                compile_schema(); if given, validate() ignores its schema_file
         """
         self.check_file_existence = check_file_existence
-        self.base_dir = base_dir or Path.cwd()
+        self.base_dir = Path.cwd() if base_dir is None else base_dir
         self.verbose = verbose
         self.schema_validator = JsonSchemaValidator(verbose=verbose)
         self.cmake_vars = cmake_vars or {}
+        self._compiled_schema = precompiled_schema
 
-        # Default CMake variables
-        if "CMAKE_CURRENT_LIST_DIR" not in self.cmake_vars:
-            self.cmake_vars["CMAKE_CURRENT_LIST_DIR"] = str(self.base_dir)
+        # Prefix directory -> relative paths of its contents, reset per validate() call
+        self._listing_cache: Dict[str, Optional[Set[str]]] = {}
 
-        if verbose:
-            logger.setLevel(logging.DEBUG)
+        # Default CMake variables, only needed to resolve file prefixes
+        if check_file_existence and "CMAKE_CURRENT_LIST_DIR" not in self.cmake_vars:
+            self.cmake_vars["CMAKE_CURRENT_LIST_DIR"] = str(self.base_dir)
 
     def load_json(self, filepath: Union[str, Path]) -> Dict[str, Any]:
         """
@@ -61,12 +114,13 @@ class ConfigValidator:
             json.JSONDecodeError: If the file contains invalid JSON
         """
         filepath = Path(filepath)
-        if not filepath.exists():
+        try:
+            stat = filepath.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {filepath}")
 
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _load_json_cached(str(filepath.resolve()), stat.st_mtime_ns, stat.st_size)
         except json.JSONDecodeError as e:
             # Enhance the error message with file information
             raise json.JSONDecodeError(
@@ -75,6 +129,26 @@ class ConfigValidator:
                 e.pos
             ) from e
 
+    def compile_schema(self, schema_file: Union[str, Path]) -> Any:
+        """
+        Load and compile a schema once for reuse by every validate() call.
+
+        Args:
+            schema_file: Path to the schema file
+
+        Returns:
+            The compiled schema
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            json.JSONDecodeError: If the file contains invalid JSON
+        """
+        schema = self.load_json(schema_file)
+
+        compile_schema = getattr(self.schema_validator, "compile", None)
+        self._compiled_schema = compile_schema(schema) if compile_schema is not None else schema
+        return self._compiled_schema
+
     def _expand_cmake_vars(self, path_str: str) -> str:
         """
         Expand CMake variables in a path string.
@@ -85,51 +159,114 @@ class ConfigValidator:
         Returns:
             Expanded path string
         """
-        # Simple CMake variable expansion
-        result = path_str
-        for var_name, var_value in self.cmake_vars.items():
-            result = result.replace(f"${{{var_name}}}", var_value)
+        # Most paths contain no variables at all
+        if "${" not in path_str:
+            return path_str
 
-        return result
+        # Expand known variables in a single pass, leaving unknown ones as-is
+        cmake_vars = self.cmake_vars
+        return _CMAKE_VAR_RE.sub(
+            lambda m: cmake_vars.get(m.group(1), m.group(0)), path_str)
 
-    def _get_file_prefix(self, project_config: Dict[str, Any], section: str) -> Path:
+    def _expand_file_prefixes(self, project_config: Dict[str, Any]) -> Dict[str, Path]:
         """
-        Get the appropriate prefix path for a file section.
+        Expand and resolve the file prefixes of a project.
 
         Args:
             project_config: Project configuration data
+
+        Returns:
+            Dictionary mapping each prefix key to its absolute prefix path
+        """
+        prefixes = {}
+        for prefix_key, default_prefix in _DEFAULT_PREFIXES.items():
+            # Get prefix from project config or use default; a prefix of the
+            # wrong type is reported separately
+            prefix_str = project_config.get(prefix_key, default_prefix)
+            if type(prefix_str) is not str:
+                prefix_str = default_prefix
+
+            prefix_path = Path(self._expand_cmake_vars(prefix_str))
+
+            # If relative, make it relative to base_dir
+            if not prefix_path.is_absolute():
+                prefix_path = self.base_dir / prefix_path
+
+            prefixes[prefix_key] = prefix_path
+
+        return prefixes
+
+    def _get_file_prefix(self, prefixes: Dict[str, Path], section: str) -> Path:
+        """
+        Get the appropriate prefix path for a file section.
+
+        Args:
+            prefixes: Expanded prefixes of the project, as returned by
+                _expand_file_prefixes()
             section: File section name (e.g., 'includes', 'sources')
 
         Returns:
             Path object for the prefix
         """
-        # Determine which prefix to use based on section
-        if section in ["includes", "module_includes"]:
-            prefix_key = "include_prefix"
-            default_prefix = "${CMAKE_CURRENT_LIST_DIR}/include"
-        elif section in ["sources", "module_sources"]:
-            prefix_key = "source_prefix"
-            default_prefix = "${CMAKE_CURRENT_LIST_DIR}/src"
-        else:
+        prefix_key = _SECTION_PREFIX_KEYS.get(section)
+        if prefix_key is None:
             # For unknown sections, use base directory
             return self.base_dir
 
-        # Get prefix from project config or use default
-        prefix_str = project_config.get(prefix_key, default_prefix)
+        return prefixes[prefix_key]
 
-        # Expand CMake variables
-        expanded_prefix = self._expand_cmake_vars(prefix_str)
+    def _list_prefix(self, prefix_path: Path) -> Optional[Set[str]]:
+        """
+        List the contents of a prefix directory.
 
-        # Convert to Path
-        prefix_path = Path(expanded_prefix)
+        The directory is walked once and the listing is reused for every
+        file checked against the same prefix.
 
-        # If relative, make it relative to base_dir
-        if not prefix_path.is_absolute():
-            prefix_path = self.base_dir / prefix_path
+        Args:
+            prefix_path: Prefix directory to list
+
+        Returns:
+            Set of '/'-separated paths relative to the prefix, or None if
+            the prefix is not a directory
+        """
+        key = str(prefix_path)
+        if key in self._listing_cache:
+            return self._listing_cache[key]
+
+        listing: Optional[Set[str]] = None
+        if prefix_path.is_dir():
+            listing = set()
+            for root, dirs, files in os.walk(prefix_path):
+                rel_root = os.path.relpath(root, prefix_path)
+                rel_root = "" if rel_root == os.curdir else rel_root.replace(os.sep, "/") + "/"
+                for name in dirs:
+                    listing.add(rel_root + name)
+                for name in files:
+                    listing.add(rel_root + name)
+
+        self._listing_cache[key] = listing
+        return listing
+
+    def _file_exists(self, prefix_path: Path, file_path: str) -> bool:
+        """
+        Check whether a file exists under a prefix directory.
 
-        return prefix_path
+        Args:
+            prefix_path: Prefix directory
+            file_path: File path relative to the prefix
 
-    def _validate_project(self, project_path: str, project_config: Dict[str, Any]) -> List[str]:
+        Returns:
+            True if the file exists
+        """
+        listing = self._list_prefix(prefix_path)
+        if listing is not None and file_path in listing:
+            return True
+
+        # Paths that are not in canonical relative form, or that live behind
+        # symlinked directories, are not in the listing; ask the filesystem
+        return (prefix_path / file_path).exists()
+
+    def _validate_project(self, project_path: str, project_config: Dict[str, Any]) -> Iterator[str]:
         """
         Validate a single project configuration.
 
@@ -137,60 +274,40 @@ class ConfigValidator:
             project_path: Path to the project in the configuration
             project_config: Project configuration data
 
-        Returns:
-            List of validation errors for this project
+        Yields:
+            Validation errors for this project
         """
-        errors = []
-
-        # Type validations for critical fields
-        for field in ["library", "executable", "install"]:
-            if field in project_config and not isinstance(project_config[field], bool):
-                errors.append(
-                    f"Project '{project_path}': '{field}' must be a boolean, not {type(project_config[field]).__name__}"
-                )
-
-        # Validate path prefixes if they exist
-        for prefix_key in ["include_prefix", "source_prefix"]:
-            if prefix_key in project_config:
-                prefix_value = project_config[prefix_key]
-                if not isinstance(prefix_value, str):
-                    errors.append(
-                        f"Project '{project_path}': '{prefix_key}' must be a string, not {type(prefix_value).__name__}"
-                    )
+        # Prefixes are only needed to locate files on disk
+        prefixes = self._expand_file_prefixes(
+            project_config) if self.check_file_existence else None
+
+        # Dispatch on each key in a single pass. Parsed JSON only contains
+        # exact builtin types, so checks use type() rather than isinstance()
+        for key, value in project_config.items():
+            if key in _FILE_SECTIONS:
+                if type(value) is list:
+                    yield from self._validate_file_section(
+                        project_path, key, value, prefixes)
+            elif key in _BOOLEAN_FIELDS:
+                if type(value) is not bool:
+                    yield f"Project '{project_path}': '{key}' must be a boolean, not {type(value).__name__}"
+            elif key in _PREFIX_FIELDS:
+                if type(value) is not str:
+                    yield f"Project '{project_path}': '{key}' must be a string, not {type(value).__name__}"
                 elif self.check_file_existence:
-                    # Try to expand and resolve the prefix
+                    prefix_path = prefixes[key]
                     try:
-                        expanded_prefix = self._expand_cmake_vars(
-                            prefix_value)
-                        prefix_path = Path(expanded_prefix)
-                        if not prefix_path.is_absolute():
-                            prefix_path = self.base_dir / prefix_path
-
                         # Warn if the directory doesn't exist
                         if not prefix_path.exists():
                             logger.warning(
-                                f"Warning: Directory for '{prefix_key}' doesn't exist: {prefix_path}")
+                                f"Warning: Directory for '{key}' doesn't exist: {prefix_path}")
                         elif not prefix_path.is_dir():
-                            errors.append(
-                                f"Project '{project_path}': '{prefix_key}' is not a directory: {prefix_path}"
-                            )
+                            yield f"Project '{project_path}': '{key}' is not a directory: {prefix_path}"
                     except Exception as e:
-                        errors.append(
-                            f"Project '{project_path}': Failed to resolve '{prefix_key}': {str(e)}"
-                        )
-
-        # Check file sections
-        file_sections = ["includes", "module_includes",
-                         "sources", "module_sources"]
-        for section in file_sections:
-            if section in project_config and isinstance(project_config[section], list):
-                errors.extend(self._validate_file_section(
-                    project_path, section, project_config[section], project_config))
-
-        return errors
+                        yield f"Project '{project_path}': Failed to resolve '{key}': {str(e)}"
 
     def _validate_file_section(self, project_path: str, section: str, groups: List[Dict[str, Any]],
-                               project_config: Dict[str, Any]) -> List[str]:
+                               prefixes: Optional[Dict[str, Path]]) -> Iterator[str]:
         """
         Validate a file section in the project.
 
@@ -198,26 +315,30 @@ class ConfigValidator:
             project_path: Path to the project
             section: Section name (includes, sources, etc.)
             groups: List of file groups
-            project_config: Full project configuration
+            prefixes: Expanded prefixes of the project, or None when file
+                existence is not checked
 
-        Returns:
-            List of validation errors
+        Yields:
+            Validation errors
         """
-        errors = []
         file_paths: Set[str] = set()
-        valid_platforms = ["any", "windows", "apple", "linux", "posix"]
+        add_file_path = file_paths.add
+        intern = sys.intern
+
+        # The prefix only depends on the project and section, not on the file
+        prefix_path = self._get_file_prefix(
+            prefixes, section) if self.check_file_existence else None
 
         for i, group in enumerate(groups):
             group_path = f"{project_path}/{section}[{i}]"
 
             # Check platform field
             if "platform" not in group:
-                errors.append(
-                    f"Error at '{group_path}': Missing 'platform' field")
-            elif group["platform"] not in valid_platforms:
-                errors.append(
+                yield f"Error at '{group_path}': Missing 'platform' field"
+            elif type(group["platform"]) is not str or group["platform"] not in _VALID_PLATFORMS:
+                yield (
                     f"Error at '{group_path}': Invalid platform '{group['platform']}', " +
-                    f"must be one of: {', '.join(valid_platforms)}"
+                    f"must be one of: {_VALID_PLATFORMS_STR}"
                 )
 
             # Check for at least one visibility section (public/private)
@@ -226,86 +347,70 @@ class ConfigValidator:
                 if visibility in group:
                     has_visibility = True
 
-                    if not isinstance(group[visibility], list):
-                        errors.append(
-                            f"Error at '{group_path}/{visibility}': Must be an array")
+                    if type(group[visibility]) is not list:
+                        yield f"Error at '{group_path}/{visibility}': Must be an array"
                         continue
 
                     # Check file paths
                     for file_path in group[visibility]:
-                        if not isinstance(file_path, str):
-                            errors.append(
+                        if type(file_path) is not str:
+                            yield (
                                 f"Error at '{group_path}/{visibility}': File path must be a string, " +
                                 f"not {type(file_path).__name__}"
                             )
                             continue
 
-                        # Check for duplicate file paths
+                        # Check for duplicate file paths; interned strings
+                        # let repeated paths compare by identity
+                        file_path = intern(file_path)
                         if file_path in file_paths:
-                            errors.append(
-                                f"Duplicate file path at '{group_path}/{visibility}': {file_path}")
-                        file_paths.add(file_path)
+                            yield f"Duplicate file path at '{group_path}/{visibility}': {file_path}"
+                        add_file_path(file_path)
 
                         # Verify file existence if requested
                         if self.check_file_existence:
-                            # Get appropriate prefix for this section
-                            prefix_path = self._get_file_prefix(
-                                project_config, section)
-
-                            # Construct full path with prefix
-                            full_path = prefix_path / file_path
-
-                            if full_path.exists():
+                            if self._file_exists(prefix_path, file_path):
                                 logger.debug(f"found: '{group_path}/{visibility}': {file_path}")
                             else:
-                                errors.append(
-                                    f"File not found: '{full_path}' referenced in '{group_path}/{visibility}'"
-                                )
+                                yield f"File not found: '{prefix_path / file_path}' referenced in '{group_path}/{visibility}'"
 
             if not has_visibility:
-                errors.append(
-                    f"Error at '{group_path}': Must have either 'public' or 'private' section")
-
-        return errors
+                yield f"Error at '{group_path}': Must have either 'public' or 'private' section"
 
-    def _perform_custom_validations(self, data: Dict[str, Any]) -> List[str]:
+    def _perform_custom_validations(self, data: Dict[str, Any]) -> Iterator[str]:
         """
         Perform custom validations not covered by the schema.
 
         Args:
             data: The project configuration data
 
-        Returns:
-            List of validation errors
+        Yields:
+            Validation errors
         """
-        errors = []
-
         # Validate each project
         for project_name, project_config in data.items():
-            if not isinstance(project_config, dict):
-                errors.append(
-                    f"Project '{project_name}' has invalid configuration (not an object)")
+            if type(project_config) is not dict:
+                yield f"Project '{project_name}' has invalid configuration (not an object)"
                 continue
 
             # Validate this project's configuration
-            project_errors = self._validate_project(
-                project_name, project_config)
-            errors.extend(project_errors)
+            yield from self._validate_project(project_name, project_config)
 
-        return errors
-
-    def validate(self, data_file: Union[str, Path], schema_file: Union[str, Path]) -> List[str]:
+    def validate(self, data_file: Union[str, Path],
+                 schema_file: Optional[Union[str, Path]] = None) -> List[str]:
         """
         Validate a JSON configuration file against a schema.
 
         Args:
             data_file: Path to the data file to validate
-            schema_file: Path to the schema file
+            schema_file: Path to the schema file; not read when a schema
+                has already been compiled with compile_schema()
 
         Returns:
             List of validation errors
         """
-        errors = []
+        # Directory listings may be stale by the next call
+        self._listing_cache.clear()
 
         # Load JSON files
         try:
@@ -315,20 +420,24 @@ class ConfigValidator:
         except json.JSONDecodeError as e:
             return [str(e)]
 
-        try:
-            schema = self.load_json(schema_file)
-        except FileNotFoundError as e:
-            return [f"Schema file not found: {e}"]
-        except json.JSONDecodeError as e:
-            return [f"Invalid schema JSON: {e}"]
+        if self._compiled_schema is not None:
+            schema = self._compiled_schema
+        elif schema_file is None:
+            return ["No schema file provided"]
+        else:
+            try:
+                schema = self.load_json(schema_file)
+            except FileNotFoundError as e:
+                return [f"Schema file not found: {e}"]
+            except json.JSONDecodeError as e:
+                return [f"Invalid schema JSON: {e}"]
 
         # Perform schema validation
         schema_errors = self.schema_validator.validate(data, schema)
-        errors.extend(schema_errors)
+        errors = list(schema_errors)
 
         # Only perform custom validations if schema validation passed
-        if not schema_errors:
-            custom_errors = self._perform_custom_validations(data)
-            errors.extend(custom_errors)
+        if not errors:
+            errors.extend(self._perform_custom_validations(data))
 
         return errors
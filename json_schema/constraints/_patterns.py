@@ -0,0 +1,134 @@
+"""
+Matchers for the regular expressions of pattern and patternProperties.
+
+Most patterns in real schemas are trivial ("any string", "a literal prefix",
+"a length range"), which plain string operations check much faster than the
+regex engine. Everything else is searched with the compiled regex.
+"""
+
+import re
+from typing import Any, Callable, Sequence
+
+from ._regex_cache import compile_pattern
+
+# Matcher of a pattern, returning a truthy value if the pattern is found in
+# the string, with the semantics of re.search
+Matcher = Callable[[str], Any]
+
+# Literal prefix, optionally followed by anything ("^x-", "^x-.*")
+_PREFIX_RE = re.compile(r"\^([A-Za-z0-9_\-]+)(?:\.\*)?")
+
+# Length range of a single line ("^.{2}$", "^.{2,}$", "^.{2,8}$")
+_LENGTH_RE = re.compile(r"\^\.\{(\d+)(?:(,)(\d*))?\}\$")
+
+# Patterns that are found in every string
+_ANY_PATTERNS = frozenset(("", ".*", "^.*", ".*$"))
+
+
+def match_any(value: str) -> bool:
+    """
+    Match any string.
+
+    Args:
+        value: String to match
+
+    Returns:
+        True
+    """
+    return True
+
+
+def _match_nonempty(value: str) -> bool:
+    # "." matches anything but a newline
+    return len(value) > value.count("\n")
+
+
+def compile_matcher(pattern: str) -> Matcher:
+    """
+    Compile a pattern into a matcher.
+
+    Patterns found in every string compile to match_any, so callers can
+    skip matching altogether by comparing against it.
+
+    Args:
+        pattern: Regular expression
+
+    Returns:
+        Matcher for the pattern
+
+    Raises:
+        re.error: If the pattern is not a valid regular expression
+    """
+    # Compiled even when not needed, so invalid patterns are always reported
+    search = compile_pattern(pattern).search
+
+    if pattern in _ANY_PATTERNS:
+        return match_any
+
+    if pattern == ".+":
+        return _match_nonempty
+
+    match = _PREFIX_RE.fullmatch(pattern)
+    if match:
+        prefix = match.group(1)
+        return lambda value: value.startswith(prefix)
+
+    match = _LENGTH_RE.fullmatch(pattern)
+    if match:
+        min_length = int(match.group(1))
+        if match.group(2) is None:
+            max_length = min_length
+        elif match.group(3):
+            max_length = int(match.group(3))
+        else:
+            max_length = None
+
+        def match_length(value: str) -> bool:
+            # "$" also matches before a trailing newline
+            if value.endswith("\n"):
+                value = value[:-1]
+            if "\n" in value or len(value) < min_length:
+                return False
+            return max_length is None or len(value) <= max_length
+        return match_length
+
+    return search
+
+
+def compile_alternation_matcher(patterns: Sequence[str]) -> Matcher:
+    """
+    Compile patterns into a matcher that matches where any of them does.
+
+    Patterns without capturing groups are searched as a single alternation,
+    so the regex engine makes one pass over the string. Patterns whose
+    groups would be renumbered by the alternation are matched one by one.
+
+    Args:
+        patterns: Regular expressions
+
+    Returns:
+        Matcher for the patterns
+
+    Raises:
+        re.error: If a pattern is not a valid regular expression
+    """
+    matchers = [compile_matcher(pattern) for pattern in patterns]
+    if len(matchers) == 1:
+        return matchers[0]
+
+    if match_any in matchers:
+        return match_any
+
+    if all(compile_pattern(pattern).groups == 0 for pattern in patterns):
+        try:
+            return compile_pattern("|".join(f"(?:{pattern})" for pattern in patterns)).search
+        except re.error:
+            # Flags such as (?x) are only allowed at the start of a pattern
+            pass
+
+    def match_some(value: str) -> bool:
+        for matcher in matchers:
+            if matcher(value):
+                return True
+        return False
+    return match_some
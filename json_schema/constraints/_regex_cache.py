@@ -0,0 +1,32 @@
+"""
+Process-wide cache of compiled regular expressions.
+"""
+
+import re
+from functools import lru_cache
+from typing import Pattern
+
+# Maximum number of compiled patterns kept
+_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def compile_pattern(pattern: str) -> Pattern:
+    """
+    Compile a regular expression, reusing the result for equal patterns.
+
+    Schemas tend to repeat the same few patterns, so constraints built from
+    separate schemas share one compiled regex per pattern. The cache holds
+    more patterns than the re module's own one and is not shared with
+    unrelated regex use elsewhere in the process.
+
+    Args:
+        pattern: Regular expression
+
+    Returns:
+        Compiled regular expression
+
+    Raises:
+        re.error: If the pattern is not a valid regular expression
+    """
+    return re.compile(pattern)
@@ -2,12 +2,33 @@
 Array constraint implementation.
 """
 
-from typing import Any, Optional
+import json
+from typing import Any, List, Optional
 
-from .base import TypeConstraint, ValidationContext, Constraint
+from .base import Predicate, TypeConstraint, ValidationContext, Constraint
 from ..api import ErrorCode
 
 
+def _unique_key(item: Any) -> Any:
+    """
+    Get a hashable key identifying an array item for uniqueness checks.
+    
+    Args:
+        item: Array item
+        
+    Returns:
+        Key that is equal for equal JSON values
+    """
+    # Tag booleans, since True == 1 and False == 0 in Python
+    key = (isinstance(item, bool), item)
+    try:
+        hash(key)
+    except TypeError:
+        # Arrays and objects are compared by their canonical JSON form
+        key = (None, json.dumps(item, sort_keys=True, separators=(",", ":"), default=str))
+    return key
+
+
 class ArrayConstraint(TypeConstraint):
     """
     Constraint for validating array values.
@@ -31,6 +52,8 @@ class ArrayConstraint(TypeConstraint):
         self.min_items = min_items
         self.max_items = max_items
         self.unique_items = unique_items
+
+        super().__init__()
     
     @property
     def json_type(self) -> str:
@@ -53,7 +76,7 @@ class ArrayConstraint(TypeConstraint):
         if self.min_items is not None and len(value) < self.min_items:
             context.add_error(
                 ErrorCode.ARRAY_TOO_SHORT,
-                f"Array has {len(value)} items, but minimum is {self.min_items}",
+                lambda: f"Array has {len(value)} items, but minimum is {self.min_items}",
                 value=value,
                 constraint=self
             )
@@ -63,49 +86,90 @@ class ArrayConstraint(TypeConstraint):
         if self.max_items is not None and len(value) > self.max_items:
             context.add_error(
                 ErrorCode.ARRAY_TOO_LONG,
-                f"Array has {len(value)} items, but maximum is {self.max_items}",
+                lambda: f"Array has {len(value)} items, but maximum is {self.max_items}",
                 value=value,
                 constraint=self
             )
             valid = False
+        
+        # The length is already wrong, so skip the per-item work
+        if not valid and context.fail_fast:
+            return False
             
         # Check unique_items
         if self.unique_items and len(value) > 1:
-            try:
-                # Use JSON serialization for comparison
-                unique_items = set()
-                for i, item in enumerate(value):
-                    item_str = str(item)  # Simple string representation
-                    if item_str in unique_items:
-                        context.add_error(
-                            ErrorCode.ARRAY_ITEMS_NOT_UNIQUE,
-                            f"Array items must be unique (duplicate at index {i})",
-                            value=value,
-                            constraint=self
-                        )
-                        valid = False
-                        break
-                    unique_items.add(item_str)
-            except (TypeError, ValueError):
-                # Fall back to a simpler approach
-                if len(value) != len(set(map(str, value))):
+            seen = set()
+            for i, item in enumerate(value):
+                key = _unique_key(item)
+                if key in seen:
                     context.add_error(
                         ErrorCode.ARRAY_ITEMS_NOT_UNIQUE,
-                        "Array items must be unique",
+                        lambda i=i: f"Array items must be unique (duplicate at index {i})",
                         value=value,
                         constraint=self
                     )
                     valid = False
+                    break
+                seen.add(key)
+            
+            if not valid and context.fail_fast:
+                return False
         
         # Validate items
         if self.items is not None:
+            # Push and pop the path directly; this loop runs once per item
+            validate_item = self.items.validate
             for i, item in enumerate(value):
-                with context.with_path(i):
-                    if not self.items.validate(item, context):
-                        valid = False
+                context.push_path(i)
+                try:
+                    item_valid = validate_item(item, context)
+                finally:
+                    context.pop_path()
+
+                if not item_valid:
+                    valid = False
+                    if context.fail_fast:
+                        break
         
         return valid
     
+    def _compile_type_specific(self) -> Optional[List[Predicate]]:
+        """
+        Compile the array-specific checks into predicates.
+
+        Returns:
+            List of predicates, or None if the items constraint cannot
+            be compiled
+        """
+        checks = []
+
+        min_items = self.min_items
+        if min_items is not None:
+            checks.append(lambda value: len(value) >= min_items)
+
+        max_items = self.max_items
+        if max_items is not None:
+            checks.append(lambda value: len(value) <= max_items)
+
+        if self.unique_items:
+            def all_unique(value: Any) -> bool:
+                seen = set()
+                for item in value:
+                    key = _unique_key(item)
+                    if key in seen:
+                        return False
+                    seen.add(key)
+                return True
+            checks.append(all_unique)
+
+        if self.items is not None:
+            item_ok = self.items.predicate()
+            if item_ok is None:
+                return None
+            checks.append(lambda value: all(map(item_ok, value)))
+
+        return checks
+    
     def __str__(self) -> str:
         """String representation of the constraint."""
         parts = []
@@ -2,11 +2,187 @@
 Base constraint classes for the Enhanced JSON Schema Validator.
 """
 
+import functools
+import sys
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union, Set
+from types import MappingProxyType
+from typing import (
+    AbstractSet, Any, Callable, Dict, FrozenSet, Iterator, List, Mapping, Optional,
+    Sequence, Tuple, Union
+)
 
 from ..api import ValidationError, ErrorCode
-from ..utils import JsonPointer
+from ..utils import JsonPointer, TypeUtils
+
+
+@functools.lru_cache(maxsize=1024)
+def _index_part(index: int) -> str:
+    """
+    Convert an array index to a path part, reusing recent conversions.
+
+    Args:
+        index: Array index
+
+    Returns:
+        Index as a string
+    """
+    return str(index)
+
+
+def _path_part(part: Any) -> str:
+    """
+    Convert a path segment to a shared string.
+
+    Property names are interned so repeated names share one object and
+    compare by identity in type hint lookups.
+
+    Args:
+        part: Path segment
+
+    Returns:
+        Path segment as a string
+    """
+    if type(part) is str:
+        return sys.intern(part)
+    if type(part) is int:
+        return _index_part(part)
+    return str(part)
+
+
+# Verdict-only check of a value, without a context or error reporting
+Predicate = Callable[[Any], bool]
+
+
+def _all_predicates(predicates: List[Predicate]) -> Predicate:
+    """
+    Combine predicates into one that passes only if all of them pass.
+
+    Predicates are evaluated in order and evaluation stops at the first
+    failure, so earlier predicates can guard later ones (e.g. a type check
+    before a length check).
+
+    Args:
+        predicates: Predicates to combine
+
+    Returns:
+        Combined predicate
+    """
+    if not predicates:
+        return lambda value: True
+    if len(predicates) == 1:
+        return predicates[0]
+
+    predicates = tuple(predicates)
+
+    def check(value: Any) -> bool:
+        for predicate in predicates:
+            if not predicate(value):
+                return False
+        return True
+
+    return check
+
+
+def _escape_part(part: str) -> str:
+    """
+    Escape a path part for use in a JSON Pointer.
+
+    Args:
+        part: Path segment
+
+    Returns:
+        Escaped path segment
+    """
+    # Most parts need no escaping, which is cheaper to check than to do
+    if "~" in part or "/" in part:
+        return JsonPointer.escape_part(part)
+    return part
+
+
+def _pointer_prefixes(parts: List[str]) -> List[str]:
+    """
+    Build the JSON Pointers of every prefix of a path.
+
+    Args:
+        parts: Path segments
+
+    Returns:
+        List of pointers, from the empty pointer to the full path
+    """
+    prefixes = [""]
+    for part in parts:
+        prefixes.append(prefixes[-1] + "/" + _escape_part(part))
+    return prefixes
+
+
+class _ShortCircuit(Exception):
+    """Raised to abort validation on the first error when errors are not collected."""
+
+
+class PropertyScope:
+    """
+    Immutable set of property names, made of the sets added to it.
+
+    Adding a set makes a new scope that shares the sets of this one, so
+    scopes can be saved and restored by reference and nothing is copied
+    as references and nested schemas add their properties.
+    """
+
+    __slots__ = ("layers",)
+
+    def __init__(self, layers: Tuple[FrozenSet[str], ...] = ()):
+        """
+        Initialize a new property scope.
+
+        Args:
+            layers: Sets of property names in the scope
+        """
+        self.layers = layers
+
+    def push(self, property_names: FrozenSet[str]) -> "PropertyScope":
+        """
+        Get a scope that also contains a set of property names.
+
+        Args:
+            property_names: Property names to add
+
+        Returns:
+            New scope, or this scope if the set is already in it
+        """
+        for layer in self.layers:
+            # Schemas add the same set each time they validate an object
+            if layer is property_names:
+                return self
+        return PropertyScope(self.layers + (property_names,))
+
+    def __contains__(self, property_name: Any) -> bool:
+        for layer in self.layers:
+            if property_name in layer:
+                return True
+        return False
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(frozenset().union(*self.layers))
+
+    def __bool__(self) -> bool:
+        return any(self.layers)
+
+    def __repr__(self) -> str:
+        return f"PropertyScope({sorted(self)})"
+
+
+# Shared empty placeholders for context fields that most validations never
+# fill in; the real containers are only created on first write
+_NO_ERRORS: Tuple[ValidationError, ...] = ()
+_NO_TYPE_HINTS: Mapping[str, str] = MappingProxyType({})
+_NO_PARENT_PROPERTIES = PropertyScope()
+
+# Per-thread free list of released validation contexts
+_context_pool = threading.local()
+
+# Maximum number of released contexts kept per thread
+_CONTEXT_POOL_SIZE = 8
 
 
 class ValidationContext:
@@ -16,21 +192,151 @@ class ValidationContext:
     This class maintains state during the validation process,
     including the current path, error collection, and type hints.
     """
+
+    __slots__ = (
+        "errors", "collect_errors", "fail_fast", "failed",
+        "_path_parts", "_schema_path_parts", "_path_prefixes", "_schema_path_prefixes",
+        "verbose", "type_hints", "root_schema", "parent_properties",
+        "_path_pool", "_schema_path_pool",
+    )
     
-    def __init__(self, verbose: bool = False):
+    def __init__(self, 
+                verbose: bool = False, 
+                collect_errors: bool = True,
+                fail_fast: bool = False):
         """
         Initialize a new validation context.
         
         Args:
             verbose: Whether to include additional details in errors
-        """
-        self.errors: List[ValidationError] = []
-        self.path_parts: List[str] = []
-        self.schema_path_parts: List[str] = []
+            collect_errors: Whether to record errors; if False, the first
+                error aborts validation by raising _ShortCircuit
+            fail_fast: Whether constraints may stop checking a value
+                after its first failure
+        """
+        self.errors: Sequence[ValidationError] = _NO_ERRORS
+        self.collect_errors = collect_errors
+        self.fail_fast = fail_fast or not collect_errors
+        self.failed = False
+        self._path_parts: List[str] = []
+        self._schema_path_parts: List[str] = []
+
+        # JSON Pointers of each prefix of the paths above; the last entry
+        # is the pointer for the full path
+        self._path_prefixes: List[str] = [""]
+        self._schema_path_prefixes: List[str] = [""]
         self.verbose = verbose
-        self.type_hints: Dict[str, str] = {}
+        self.type_hints: Mapping[str, str] = _NO_TYPE_HINTS
         self.root_schema: Optional[Dict[str, Any]] = None
-        self.parent_properties: Set[str] = set()  # Track properties defined in parent schemas
+        self.parent_properties: PropertyScope = _NO_PARENT_PROPERTIES  # Track properties defined in parent schemas
+
+        # Released path context managers, reused by with_path/with_schema_path
+        self._path_pool: List["PathContext"] = []
+        self._schema_path_pool: List["SchemaPathContext"] = []
+        
+    @classmethod
+    def acquire(cls,
+                verbose: bool = False,
+                collect_errors: bool = True,
+                fail_fast: bool = False) -> "ValidationContext":
+        """
+        Get a reset context from the current thread's pool, or a new one.
+
+        Contexts obtained this way should be returned with release().
+
+        Args:
+            verbose: Whether to include additional details in errors
+            collect_errors: Whether to record errors
+            fail_fast: Whether constraints may stop checking a value
+                after its first failure
+
+        Returns:
+            Validation context
+        """
+        pool = getattr(_context_pool, "contexts", None)
+        if pool:
+            context = pool.pop()
+            context.reset(verbose, collect_errors, fail_fast)
+            return context
+
+        return cls(verbose=verbose, collect_errors=collect_errors, fail_fast=fail_fast)
+
+    def release(self) -> None:
+        """
+        Return this context to the current thread's pool.
+
+        The context must not be used afterwards. Its errors list is not
+        reused, so it may still be referenced by a validation result.
+        """
+        pool = getattr(_context_pool, "contexts", None)
+        if pool is None:
+            pool = _context_pool.contexts = []
+
+        if len(pool) < _CONTEXT_POOL_SIZE:
+            pool.append(self)
+
+    def reset(self,
+              verbose: bool = False,
+              collect_errors: bool = True,
+              fail_fast: bool = False) -> None:
+        """
+        Reset this context to the state of a newly created one.
+
+        Args:
+            verbose: Whether to include additional details in errors
+            collect_errors: Whether to record errors
+            fail_fast: Whether constraints may stop checking a value
+                after its first failure
+        """
+        # The previous errors list may be owned by a validation result
+        self.errors = _NO_ERRORS
+        self.collect_errors = collect_errors
+        self.fail_fast = fail_fast or not collect_errors
+        self.failed = False
+        self._path_parts.clear()
+        self._schema_path_parts.clear()
+        del self._path_prefixes[1:]
+        del self._schema_path_prefixes[1:]
+        self.verbose = verbose
+        self.type_hints = _NO_TYPE_HINTS
+        self.root_schema = None
+        self.parent_properties = _NO_PARENT_PROPERTIES
+
+    @property
+    def path_parts(self) -> List[str]:
+        """
+        Get the parts of the current path.
+
+        The list must only be changed through push_path/pop_path, or by
+        assigning a new list, so that the path pointer stays in sync.
+
+        Returns:
+            List of path segments
+        """
+        return self._path_parts
+
+    @path_parts.setter
+    def path_parts(self, parts: List[str]) -> None:
+        self._path_parts = parts
+        self._path_prefixes = _pointer_prefixes(parts)
+
+    @property
+    def schema_path_parts(self) -> List[str]:
+        """
+        Get the parts of the current schema path.
+
+        The list must only be changed through push_schema_path/pop_schema_path,
+        or by assigning a new list, so that the path pointer stays in sync.
+
+        Returns:
+            List of schema path segments
+        """
+        return self._schema_path_parts
+
+    @schema_path_parts.setter
+    def schema_path_parts(self, parts: List[str]) -> None:
+        self._schema_path_parts = parts
+        self._schema_path_prefixes = _pointer_prefixes(parts)
         
     @property
     def path(self) -> str:
@@ -40,7 +346,7 @@ class ValidationContext:
         Returns:
             JSON Pointer string for the current path
         """
-        return JsonPointer.from_parts(self.path_parts)
+        return self._path_prefixes[-1]
         
     @property
     def schema_path(self) -> str:
@@ -50,7 +356,7 @@ class ValidationContext:
         Returns:
             JSON Pointer string for the current schema path
         """
-        return JsonPointer.from_parts(self.schema_path_parts)
+        return self._schema_path_prefixes[-1]
         
     def push_path(self, part: Any) -> None:
         """
@@ -59,12 +365,15 @@ class ValidationContext:
         Args:
             part: Path segment to add
         """
-        self.path_parts.append(str(part))
+        part = _path_part(part)
+        self._path_parts.append(part)
+        self._path_prefixes.append(self._path_prefixes[-1] + "/" + _escape_part(part))
         
     def pop_path(self) -> None:
         """Remove the last path part from the current path."""
-        if self.path_parts:
-            self.path_parts.pop()
+        if self._path_parts:
+            self._path_parts.pop()
+            self._path_prefixes.pop()
             
     def push_schema_path(self, part: Any) -> None:
         """
@@ -73,37 +382,97 @@ class ValidationContext:
         Args:
             part: Path segment to add
         """
-        self.schema_path_parts.append(str(part))
+        part = _path_part(part)
+        self._schema_path_parts.append(part)
+        self._schema_path_prefixes.append(
+            self._schema_path_prefixes[-1] + "/" + _escape_part(part))
         
     def pop_schema_path(self) -> None:
         """Remove the last path part from the current schema path."""
-        if self.schema_path_parts:
-            self.schema_path_parts.pop()
+        if self._schema_path_parts:
+            self._schema_path_parts.pop()
+            self._schema_path_prefixes.pop()
             
     def add_error(self, 
                 code: ErrorCode, 
-                message: str, 
+                message: Union[str, Callable[[], str]], 
                 value: Any = None,
-                constraint: Any = None) -> None:
+                constraint: Any = None,
+                property_name: Optional[str] = None) -> None:
         """
         Add a validation error to the context.
         
         Args:
             code: Error code
-            message: Error message
+            message: Error message, or a callable that builds it on demand
             value: Value that failed validation
             constraint: Constraint that was violated
+            property_name: Name of the property the error is about, if any
         """
+        if not self.collect_errors:
+            # Only the verdict is needed, so skip building the error
+            self.failed = True
+            raise _ShortCircuit()
+
         error = ValidationError(
             code=code,
             path=self.path,
             message=message,
             schema_path=self.schema_path,
             value=value,
-            constraint=constraint
+            constraint=constraint,
+            property_name=property_name
         )
-        self.errors.append(error)
-        
+        if self.errors is _NO_ERRORS:
+            self.errors = [error]
+        else:
+            self.errors.append(error)
+
+    def validate_isolated(self,
+                          validate: Callable[[Any, "ValidationContext"], bool],
+                          value: Any) -> Tuple[bool, Sequence[ValidationError]]:
+        """
+        Validate a value and undo everything the validation recorded.
+
+        Logical constraints use this to check a branch against this context
+        in place of a copy. Errors are collected even when the context was
+        created with collect_errors=False, as a failing branch does not
+        necessarily fail the validation. Properties the branch adds to
+        parent_properties are dropped again, as are its type hints, which
+        are only ever added, so popping the newest entries removes them.
+
+        Args:
+            validate: Validate function of the sub-constraint
+            value: Value to validate
+
+        Returns:
+            Tuple of the sub-constraint's verdict and the errors it added
+        """
+        error_count = len(self.errors)
+        hint_count = len(self.type_hints)
+        parent_properties = self.parent_properties
+        collect_errors = self.collect_errors
+
+        self.collect_errors = True
+        try:
+            valid = validate(value, self)
+        finally:
+            self.collect_errors = collect_errors
+            self.parent_properties = parent_properties
+
+            type_hints = self.type_hints
+            for _ in range(len(type_hints) - hint_count):
+                type_hints.popitem()
+
+            errors = self.errors
+            if len(errors) == error_count:
+                added = _NO_ERRORS
+            else:
+                added = errors[error_count:]
+                del errors[error_count:]
+
+        return valid, added
+
     def with_path(self, part: Any):
         """
         Context manager for adding a path part temporarily.
@@ -114,6 +483,12 @@ class ValidationContext:
         Returns:
             Context manager
         """
+        pool = self._path_pool
+        if pool:
+            path_context = pool.pop()
+            path_context.part = part
+            return path_context
+
         return PathContext(self, part)
         
     def with_schema_path(self, part: Any):
@@ -126,6 +501,12 @@ class ValidationContext:
         Returns:
             Context manager
         """
+        pool = self._schema_path_pool
+        if pool:
+            path_context = pool.pop()
+            path_context.part = part
+            return path_context
+
         return SchemaPathContext(self, part)
         
     def get_type_hint(self, path: str) -> Optional[str]:
@@ -148,6 +529,8 @@ class ValidationContext:
             path: JSON Pointer path
             type_hint: Type hint to add
         """
+        if self.type_hints is _NO_TYPE_HINTS:
+            self.type_hints = {}
         self.type_hints[path] = type_hint
     
     def add_parent_property(self, property_name: str) -> None:
@@ -157,16 +540,21 @@ class ValidationContext:
         Args:
             property_name: Name of property defined in parent schema
         """
-        self.parent_properties.add(property_name)
+        self.parent_properties = self.parent_properties.push(frozenset((property_name,)))
     
-    def add_parent_properties(self, property_names: Set[str]) -> None:
+    def add_parent_properties(self, property_names: AbstractSet[str]) -> None:
         """
         Add multiple property names to the parent properties set.
         
         Args:
             property_names: Set of property names defined in parent schema
         """
-        self.parent_properties.update(property_names)
+        if not property_names:
+            return
+
+        if not isinstance(property_names, frozenset):
+            property_names = frozenset(property_names)
+        self.parent_properties = self.parent_properties.push(property_names)
     
     def __str__(self) -> str:
         """String representation of the validation context."""
@@ -175,6 +563,8 @@ class ValidationContext:
 
 class PathContext:
     """Context manager for temporarily adding a path part."""
+
+    __slots__ = ("context", "part")
     
     def __init__(self, context: ValidationContext, part: Any):
         """
@@ -193,12 +583,15 @@ class PathContext:
         return self.context
         
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Remove the path part when exiting the context."""
+        """Remove the path part and return this object to the pool."""
         self.context.pop_path()
+        self.context._path_pool.append(self)
 
 
 class SchemaPathContext:
     """Context manager for temporarily adding a schema path part."""
+
+    __slots__ = ("context", "part")
     
     def __init__(self, context: ValidationContext, part: Any):
         """
@@ -217,8 +610,9 @@ class SchemaPathContext:
         return self.context
         
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Remove the schema path part when exiting the context."""
+        """Remove the schema path part and return this object to the pool."""
         self.context.pop_schema_path()
+        self.context._schema_path_pool.append(self)
 
 
 class Constraint(ABC):
@@ -228,6 +622,29 @@ class Constraint(ABC):
     This is the foundation of the constraint hierarchy, defining
     the interface for all constraint types.
     """
+
+    # _validation_order_tuple backs the validation_order property;
+    # _predicate caches the result of compile_predicate()
+    __slots__ = ("_validation_order_tuple", "_predicate")
+
+    @property
+    def validation_order(self) -> Optional[Tuple["Constraint", ...]]:
+        """
+        Get the dependency order the schema compiler attached to this constraint.
+
+        Only root constraints are given one.
+
+        Returns:
+            Tuple of constraints, or None if there is no order
+        """
+        try:
+            return self._validation_order_tuple
+        except AttributeError:
+            return None
+
+    @validation_order.setter
+    def validation_order(self, validation_order: Optional[Sequence["Constraint"]]) -> None:
+        self._validation_order_tuple = tuple(validation_order) if validation_order else None
     
     @abstractmethod
     def validate(self, value: Any, context: ValidationContext) -> bool:
@@ -242,6 +659,49 @@ class Constraint(ABC):
             True if validation succeeds, False otherwise
         """
         pass
+
+    def predicate(self) -> Optional[Predicate]:
+        """
+        Get the compiled predicate for this constraint, compiling it once.
+
+        Must only be called once the constraint tree is fully built.
+
+        Returns:
+            Predicate, or None if this constraint cannot be compiled
+        """
+        try:
+            return self._predicate
+        except AttributeError:
+            self._predicate = self.compile_predicate()
+            return self._predicate
+
+    def compile_predicate(self) -> Optional[Predicate]:
+        """
+        Compile this constraint into a verdict-only predicate.
+
+        The predicate returns the same verdict as validate() but reports no
+        errors, which makes it much cheaper when only validity is needed.
+        Constraints whose validation depends on context state (parent
+        properties, type hints, references) return None, and callers fall
+        back to validate().
+
+        Returns:
+            Predicate, or None if this constraint cannot be compiled
+        """
+        return None
+
+    def accepted_json_types(self) -> Optional[FrozenSet[str]]:
+        """
+        Get the JSON types of the values this constraint can accept.
+
+        Values of any other type (as given by TypeUtils.get_json_type) are
+        always rejected, which lets logical operators skip such branches.
+        Must only be called once the constraint tree is fully built.
+
+        Returns:
+            Set of JSON type names, or None if values of any type may be accepted
+        """
+        return None
     
     def __str__(self) -> str:
         """String representation of the constraint."""
@@ -252,12 +712,56 @@ class Constraint(ABC):
         return self.__str__()
 
 
+# JSON type name -> predicate checking that a Python value has that type
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "array": lambda v: isinstance(v, list),
+    "object": lambda v: isinstance(v, dict),
+    "null": lambda v: v is None,
+}
+
+
+# Schema type -> JSON types of the values it accepts; numbers include integers
+_ACCEPTED_JSON_TYPES: Dict[str, FrozenSet[str]] = {
+    json_type: frozenset(TypeUtils.get_effective_types(json_type)) for json_type in _TYPE_CHECKS
+}
+
+
+# Names of the Python types that parsed JSON values can have
+_TYPE_NAMES: Dict[type, str] = {
+    str: "str",
+    int: "int",
+    float: "float",
+    bool: "bool",
+    list: "list",
+    dict: "dict",
+    type(None): "NoneType",
+}
+
+
 class TypeConstraint(Constraint, ABC):
     """
     Base class for type-specific constraints.
     
     Type constraints validate values of a specific type.
     """
+
+    __slots__ = ("_type_ok", "_type_error_msg")
+    
+    def __init__(self):
+        """
+        Initialize a new type constraint.
+
+        Subclasses must call this after setting any attributes that
+        json_type depends on.
+        """
+        # Resolve the type check once instead of on every validation
+        json_type = self.json_type
+        self._type_ok = _TYPE_CHECKS[json_type]
+        self._type_error_msg = f"Expected {json_type}, got "
     
     @property
     @abstractmethod
@@ -299,67 +803,41 @@ class TypeConstraint(Constraint, ABC):
         Returns:
             True if the value has the correct type, False otherwise
         """
-        # Map JSON type to Python type for validation
-        expected_type = self.json_type
-        
-        if expected_type == "string" and not isinstance(value, str):
-            context.add_error(
-                ErrorCode.TYPE_ERROR,
-                f"Expected string, got {type(value).__name__}",
-                value=value,
-                constraint=self
-            )
-            return False
-        elif expected_type == "number" and not (isinstance(value, (int, float)) and not isinstance(value, bool)):
-            context.add_error(
-                ErrorCode.TYPE_ERROR,
-                f"Expected number, got {type(value).__name__}",
-                value=value,
-                constraint=self
-            )
-            return False
-        elif expected_type == "integer" and not (isinstance(value, int) and not isinstance(value, bool)):
-            context.add_error(
-                ErrorCode.TYPE_ERROR,
-                f"Expected integer, got {type(value).__name__}",
-                value=value,
-                constraint=self
-            )
-            return False
-        elif expected_type == "boolean" and not isinstance(value, bool):
-            context.add_error(
-                ErrorCode.TYPE_ERROR,
-                f"Expected boolean, got {type(value).__name__}",
-                value=value,
-                constraint=self
-            )
-            return False
-        elif expected_type == "array" and not isinstance(value, list):
-            context.add_error(
-                ErrorCode.TYPE_ERROR,
-                f"Expected array, got {type(value).__name__}",
-                value=value,
-                constraint=self
-            )
-            return False
-        elif expected_type == "object" and not isinstance(value, dict):
-            context.add_error(
-                ErrorCode.TYPE_ERROR,
-                f"Expected object, got {type(value).__name__}",
-                value=value,
-                constraint=self
-            )
-            return False
-        elif expected_type == "null" and value is not None:
-            context.add_error(
-                ErrorCode.TYPE_ERROR,
-                f"Expected null, got {type(value).__name__}",
-                value=value,
-                constraint=self
-            )
-            return False
-            
-        return True
+        if self._type_ok(value):
+            return True
+
+        context.add_error(
+            ErrorCode.TYPE_ERROR,
+            self._type_error_msg + (_TYPE_NAMES.get(type(value)) or type(value).__name__),
+            value=value,
+            constraint=self
+        )
+        return False
+    
+    def compile_predicate(self) -> Optional[Predicate]:
+        """
+        Compile this constraint into a verdict-only predicate.
+
+        Returns:
+            Predicate checking the type followed by the type-specific checks,
+            or None if the type-specific checks cannot be compiled
+        """
+        checks = self._compile_type_specific()
+        if checks is None:
+            return None
+
+        return _all_predicates([self._type_ok] + checks)
+
+    def _compile_type_specific(self) -> Optional[List[Predicate]]:
+        """
+        Compile the type-specific checks into predicates.
+
+        The predicates may assume the value already has the correct type.
+
+        Returns:
+            List of predicates, or None if the checks cannot be compiled
+        """
+        return None
     
     @abstractmethod
     def _validate_type_specific(self, value: Any, context: ValidationContext) -> bool:
@@ -378,6 +856,15 @@ class TypeConstraint(Constraint, ABC):
         """
         pass
     
+    def accepted_json_types(self) -> Optional[FrozenSet[str]]:
+        """
+        Get the JSON types of the values this constraint can accept.
+
+        Returns:
+            Set of JSON type names
+        """
+        return _ACCEPTED_JSON_TYPES[self.json_type]
+    
     def accepts_type(self, json_type: str) -> bool:
         """
         Check if this constraint accepts a specific JSON type.
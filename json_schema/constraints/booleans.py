@@ -2,20 +2,41 @@
 Boolean constraint implementation.
 """
 
-from typing import Any
+from typing import Any, List, Optional
 
-from .base import TypeConstraint, ValidationContext
+from .base import Predicate, TypeConstraint, ValidationContext
 
 
 class BooleanConstraint(TypeConstraint):
     """
     Constraint for validating boolean values.
     """
+
+    __slots__ = ()
     
     @property
     def json_type(self) -> str:
         return "boolean"
     
+    def validate(self, value: Any, context: ValidationContext) -> bool:
+        """
+        Validate a value against this boolean constraint.
+
+        There are no boolean-specific checks, so only the type is checked.
+
+        Args:
+            value: Value to validate
+            context: Validation context
+
+        Returns:
+            True if validation succeeds, False otherwise
+        """
+        if type(value) is bool:
+            return True
+
+        # Report the type error
+        return self._validate_type(value, context)
+    
     def _validate_type_specific(self, value: Any, context: ValidationContext) -> bool:
         """
         Validate boolean-specific constraints.
@@ -30,6 +51,15 @@ class BooleanConstraint(TypeConstraint):
         # No additional constraints for booleans
         return True
     
+    def _compile_type_specific(self) -> Optional[List[Predicate]]:
+        """
+        Compile the type-specific checks into predicates.
+
+        Returns:
+            Empty list, as there are no type-specific checks
+        """
+        return []
+    
     def __str__(self) -> str:
         """String representation of the constraint."""
         return "BooleanConstraint()"
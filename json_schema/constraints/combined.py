@@ -2,9 +2,46 @@
 Combined constraint implementation.
 """
 
-from typing import Any, List
+from typing import Any, Callable, FrozenSet, Optional, Sequence, Tuple
 
-from .base import Constraint, ValidationContext
+from .arrays import ArrayConstraint
+from .base import Constraint, Predicate, ValidationContext, _all_predicates
+from .booleans import BooleanConstraint
+from .consts import ConstConstraint
+from .enums import EnumConstraint
+from .nulls import NullConstraint
+from .numbers import NumberConstraint
+from .objects import ObjectConstraint
+from .strings import StringConstraint
+from .types import TypeConstraintImpl
+
+# Relative cost of checking a constraint; constraints not listed here
+# (logical operators, references) are the most expensive
+_CONSTRAINT_COSTS = {
+    TypeConstraintImpl: 0,
+    BooleanConstraint: 0,
+    NullConstraint: 0,
+    ConstConstraint: 1,
+    EnumConstraint: 1,
+    NumberConstraint: 2,
+    StringConstraint: 3,
+    ArrayConstraint: 4,
+    ObjectConstraint: 5,
+}
+_MAX_COST = 6
+
+
+def _constraint_cost(constraint: Constraint) -> int:
+    """
+    Estimate the relative cost of checking a constraint.
+
+    Args:
+        constraint: Constraint to estimate
+
+    Returns:
+        Cost rank, lower is cheaper
+    """
+    return _CONSTRAINT_COSTS.get(type(constraint), _MAX_COST)
 
 
 class CombinedConstraint(Constraint):
@@ -13,15 +50,40 @@ class CombinedConstraint(Constraint):
     
     This is used for schemas that have multiple validations at the same level.
     """
+
+    __slots__ = ("_constraints", "_validators", "_cheap_first")
     
-    def __init__(self, constraints: List[Constraint]):
+    def __init__(self, constraints: Sequence[Constraint]):
         """
         Initialize a new combined constraint.
         
         Args:
-            constraints: List of constraints to combine
+            constraints: Constraints to combine
         """
         self.constraints = constraints
+
+    @property
+    def constraints(self) -> Tuple[Constraint, ...]:
+        """
+        Get the combined constraints.
+
+        Returns:
+            Tuple of constraints, in the order errors are reported
+        """
+        return self._constraints
+
+    @constraints.setter
+    def constraints(self, constraints: Sequence[Constraint]) -> None:
+        self._constraints = constraints = tuple(constraints)
+
+        # Bind the validate methods up front so the loops below skip the
+        # attribute lookup on every call
+        self._validators: Tuple[Callable[[Any, ValidationContext], bool], ...] = tuple(
+            constraint.validate for constraint in constraints)
+
+        # Fail-fast validation only needs a verdict, so cheap checks go first
+        self._cheap_first: Tuple[Callable[[Any, ValidationContext], bool], ...] = tuple(
+            constraint.validate for constraint in sorted(constraints, key=_constraint_cost))
     
     def validate(self, value: Any, context: ValidationContext) -> bool:
         """
@@ -34,14 +96,58 @@ class CombinedConstraint(Constraint):
         Returns:
             True if all constraints pass, False otherwise
         """
+        validators = self._validators
+        if not validators:
+            # Empty schemas accept any value
+            return True
+
+        if context.fail_fast:
+            # The remaining errors are not needed after the first failure
+            for validate in self._cheap_first:
+                if not validate(value, context):
+                    return False
+            return True
+
         valid = True
         
-        for constraint in self.constraints:
-            if not constraint.validate(value, context):
+        for validate in validators:
+            if not validate(value, context):
                 valid = False
         
         return valid
     
+    def compile_predicate(self) -> Optional[Predicate]:
+        """
+        Compile this constraint into a verdict-only predicate.
+
+        Returns:
+            Predicate requiring all combined constraints to pass, or None
+            if any of them cannot be compiled
+        """
+        predicates = []
+        for constraint in sorted(self._constraints, key=_constraint_cost):
+            predicate = constraint.predicate()
+            if predicate is None:
+                return None
+            predicates.append(predicate)
+
+        return _all_predicates(predicates)
+    
+    def accepted_json_types(self) -> Optional[FrozenSet[str]]:
+        """
+        Get the JSON types of the values this constraint can accept.
+
+        Returns:
+            Types accepted by every combined constraint that restricts the
+            type, or None if none of them do
+        """
+        accepted = None
+        for constraint in self._constraints:
+            types = constraint.accepted_json_types()
+            if types is not None:
+                accepted = types if accepted is None else accepted & types
+        return accepted
+    
     def __str__(self) -> str:
         """String representation of the constraint."""
         return f"CombinedConstraint(constraints={len(self.constraints)})"
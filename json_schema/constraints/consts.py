@@ -2,16 +2,38 @@
 Const constraint implementation.
 """
 
-from typing import Any
+from typing import Any, Optional
 
-from .base import Constraint, ValidationContext
+from .base import Constraint, Predicate, ValidationContext
 from ..api import ErrorCode
 
 
+def _const_check(const: Any) -> Predicate:
+    """
+    Build the comparison for a constant value.
+
+    Booleans compare equal to 0 and 1 in Python, but not in JSON, so
+    booleans and numbers are kept apart when the constant is one of them.
+
+    Args:
+        const: Constant value to match
+
+    Returns:
+        Predicate checking whether a value equals the constant
+    """
+    if type(const) is bool:
+        return lambda value: value is const
+    if type(const) in (int, float):
+        return lambda value: type(value) is not bool and value == const
+    return lambda value: value == const
+
+
 class ConstConstraint(Constraint):
     """
     Constraint that validates a value against a constant.
     """
+
+    __slots__ = ("value", "_check", "_mismatch_prefix")
     
     def __init__(self, value: Any):
         """
@@ -21,6 +43,10 @@ class ConstConstraint(Constraint):
             value: Constant value to match
         """
         self.value = value
+        self._check = _const_check(value)
+
+        # Format the constant once rather than on every mismatch
+        self._mismatch_prefix = f"Expected constant value {value}, got "
     
     def validate(self, value: Any, context: ValidationContext) -> bool:
         """
@@ -34,18 +60,27 @@ class ConstConstraint(Constraint):
             True if validation succeeds, False otherwise
         """
         # Check if the value equals the const value
-        if value == self.value:
+        if self._check(value):
             return True
         
         # Value doesn't match
         context.add_error(
             ErrorCode.CONST_MISMATCH,
-            f"Expected constant value {self.value}, got {value}",
+            lambda: self._mismatch_prefix + str(value),
             value=value,
             constraint=self
         )
         return False
     
+    def compile_predicate(self) -> Optional[Predicate]:
+        """
+        Compile this constraint into a verdict-only predicate.
+
+        Returns:
+            Predicate comparing a value with the constant
+        """
+        return self._check
+    
     def __str__(self) -> str:
         """String representation of the constraint."""
         return f"ConstConstraint(value={self.value})"
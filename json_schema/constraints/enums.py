@@ -2,25 +2,66 @@
 Enum constraint implementation.
 """
 
-from typing import Any, List
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
-from .base import Constraint, ValidationContext
+from .base import Constraint, Predicate, ValidationContext
 from ..api import ErrorCode
 
 
+# Types whose members share a bucket, since 1 and 1.0 are the same JSON number
+_NUMBER_TYPES = (int, float)
+
+# Builtin types of JSON values; subclasses of these (e.g. str enums) may hash
+# differently from the builtin values they equal, so they are never bucketed
+_BUILTIN_TYPES = frozenset((type(None), bool, int, float, str, list, dict))
+
+
 class EnumConstraint(Constraint):
     """
     Constraint that validates a value against an enumeration.
     """
+
+    __slots__ = ("values", "_by_type", "_scanned", "_mismatch_suffix")
     
-    def __init__(self, values: List[Any]):
+    def __init__(self, values: Sequence[Any]):
         """
         Initialize a new enum constraint.
         
         Args:
-            values: List of allowed values
+            values: Allowed values
         """
-        self.values = values
+        self.values: Tuple[Any, ...] = tuple(values)
+
+        # Hashable members of builtin types are grouped into sets by type, so
+        # a value is only looked up among members of its own type (booleans
+        # stay apart from 0 and 1). Other members (arrays, objects and
+        # subclass instances) are compared one by one
+        buckets: Dict[type, List[Any]] = {}
+        scanned = []
+        for enum_value in self.values:
+            member_type = type(enum_value)
+            if member_type not in _BUILTIN_TYPES:
+                scanned.append(enum_value)
+                continue
+            try:
+                hash(enum_value)
+            except TypeError:
+                scanned.append(enum_value)
+                continue
+            if member_type in _NUMBER_TYPES:
+                member_type = int
+            buckets.setdefault(member_type, []).append(enum_value)
+
+        self._by_type: Dict[type, FrozenSet[Any]] = {
+            member_type: frozenset(members) for member_type, members in buckets.items()
+        }
+        if int in self._by_type:
+            self._by_type[float] = self._by_type[int]
+        self._scanned: Tuple[Any, ...] = tuple(scanned)
+
+        # Format the enumeration once rather than on every mismatch; values
+        # are listed in JSON array style
+        self._mismatch_suffix = f"' not in enumeration: {list(self.values)}"
     
     def validate(self, value: Any, context: ValidationContext) -> bool:
         """
@@ -33,23 +74,55 @@ class EnumConstraint(Constraint):
         Returns:
             True if validation succeeds, False otherwise
         """
-        # Check if the value is in the enum
-        for enum_value in self.values:
-            if value == enum_value:
-                return True
+        if self._contains(value):
+            return True
         
         # Value not in enum
         context.add_error(
             ErrorCode.ENUM_MISMATCH,
-            f"Value '{value}' not in enumeration: {self.values}",
+            lambda: f"Value '{value}" + self._mismatch_suffix,
             value=value,
             constraint=self
         )
         return False
     
+    def _contains(self, value: Any) -> bool:
+        """
+        Check whether a value is a member of the enumeration.
+
+        Args:
+            value: Value to look up
+
+        Returns:
+            True if the value is in the enumeration
+        """
+        if type(value) in _BUILTIN_TYPES:
+            bucket = self._by_type.get(type(value))
+            if bucket is not None and value in bucket:
+                return True
+            members = self._scanned
+        else:
+            # Subclass instances may not hash like the members they equal
+            members = self.values
+
+        is_bool = isinstance(value, bool)
+        for enum_value in members:
+            if value == enum_value and isinstance(enum_value, bool) == is_bool:
+                return True
+        return False
+
+    def compile_predicate(self) -> Optional[Predicate]:
+        """
+        Compile this constraint into a verdict-only predicate.
+
+        Returns:
+            Predicate checking enumeration membership
+        """
+        return self._contains
+    
     def __str__(self) -> str:
         """String representation of the constraint."""
-        return f"EnumConstraint(values={self.values})"
+        return f"EnumConstraint(values={list(self.values)})"
     
     def __repr__(self) -> str:
         """Detailed representation of the enum constraint."""
@@ -2,28 +2,165 @@
 Logical constraint implementations.
 """
 
-from typing import Any, Dict, List, Optional, Union, Set, Pattern, Tuple
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Union, Set, Pattern, Tuple
 
-from .base import Constraint, ValidationContext
+from .base import Constraint, Predicate, ValidationContext, _all_predicates
+from .numbers import NumberConstraint
 from .objects import ObjectConstraint
 from ..api import ErrorCode
 from ..utils import TypeUtils
 
 
-class AllOfConstraint(Constraint):
+# A branch of a logical constraint: the constraint, the function validating
+# it, and whether that function follows the constraint's validation order
+_Branch = Tuple[Constraint, Callable[[Any, ValidationContext], bool], bool]
+
+
+def _branch(constraint: Constraint) -> _Branch:
     """
-    Constraint that requires a value to satisfy all sub-constraints.
+    Resolve how a branch of a logical constraint is validated.
+
+    Args:
+        constraint: Branch constraint
+
+    Returns:
+        Branch triple
     """
+    validation_order = constraint.validation_order
+    if validation_order is None:
+        return constraint, constraint.validate, False
+
+    def validate_in_order(value: Any, context: ValidationContext) -> bool:
+        for sub_constraint in validation_order:
+            if not sub_constraint.validate(value, context):
+                return False
+        return True
+    return constraint, validate_in_order, True
+
+
+class _BranchingConstraint(Constraint):
+    """
+    Base class for logical constraints over a list of sub-constraints.
+    """
+
+    # Schema keyword of the operator, used in error messages
+    keyword = ""
 
     def __init__(self, constraints: List[Constraint]):
         """
-        Initialize a new all-of constraint.
+        Initialize a new logical constraint.
 
         Args:
-            constraints: List of constraints that must all be satisfied
+            constraints: List of sub-constraints
         """
         self.constraints = constraints
 
+    @property
+    def constraints(self) -> List[Constraint]:
+        """
+        Get the sub-constraints.
+
+        Returns:
+            List of sub-constraints
+        """
+        return self._constraints
+
+    @constraints.setter
+    def constraints(self, constraints: List[Constraint]) -> None:
+        self._constraints = constraints
+
+        # The compiler fills in the branches after construction, so details
+        # derived from them are computed on first use
+        self._object_properties: Optional[FrozenSet[str]] = None
+        self._ordered_branches: Optional[Tuple[_Branch, ...]] = None
+        self._indices_by_type: Dict[Optional[str], Tuple[int, ...]] = {}
+        self._prefixes: Optional[Tuple[str, ...]] = None
+        self._segments: Optional[Tuple[str, ...]] = None
+
+    def _branches(self) -> Tuple[_Branch, ...]:
+        """
+        Get the branches with the functions that validate them.
+
+        Returns:
+            Tuple of (constraint, validate function, whether the function
+            follows the constraint's validation order) triples
+        """
+        branches = self._ordered_branches
+        if branches is None:
+            branches = self._ordered_branches = tuple(
+                _branch(constraint) for constraint in self._constraints)
+        return branches
+
+    def _error_prefixes(self) -> Tuple[str, ...]:
+        """
+        Get the prefixes for the errors reported from each branch.
+
+        Returns:
+            Tuple of prefixes such as "allOf[0]: ", indexed by branch
+        """
+        prefixes = self._prefixes
+        if prefixes is None:
+            prefixes = self._prefixes = tuple(
+                f"{self.keyword}[{i}]: " for i in range(len(self._constraints)))
+        return prefixes
+
+    def _schema_segments(self) -> Tuple[str, ...]:
+        """
+        Get the schema path segments of the branches.
+
+        Returns:
+            Tuple of segments such as "allOf/0", indexed by branch
+        """
+        segments = self._segments
+        if segments is None:
+            segments = self._segments = tuple(
+                f"{self.keyword}/{i}" for i in range(len(self._constraints)))
+        return segments
+
+    def _candidate_indices(self, json_type: Optional[str]) -> Tuple[int, ...]:
+        """
+        Get the indices of the branches that may accept values of a JSON type.
+
+        Args:
+            json_type: JSON type of the value, or None for all branches
+
+        Returns:
+            Tuple of branch indices, in schema order
+        """
+        indices = self._indices_by_type.get(json_type)
+        if indices is None:
+            indices = []
+            for i, (constraint, _, ordered) in enumerate(self._branches()):
+                # Branches with their own validation order run more than
+                # the constraint itself, so they are always tried
+                accepted = None if ordered else constraint.accepted_json_types()
+                if json_type is None or accepted is None or json_type in accepted:
+                    indices.append(i)
+            indices = self._indices_by_type[json_type] = tuple(indices)
+        return indices
+
+    def _branch_object_properties(self) -> FrozenSet[str]:
+        """
+        Get the properties defined by object constraints among the branches.
+
+        Returns:
+            Set of property names
+        """
+        properties = self._object_properties
+        if properties is None:
+            properties = self._object_properties = frozenset().union(*(
+                constraint.properties.keys() for constraint in self._constraints
+                if isinstance(constraint, ObjectConstraint) and constraint.properties))
+        return properties
+
+
+class AllOfConstraint(_BranchingConstraint):
+    """
+    Constraint that requires a value to satisfy all sub-constraints.
+    """
+
+    keyword = "allOf"
+
     def validate(self, value: Any, context: ValidationContext) -> bool:
         """
         Validate a value against this all-of constraint.
@@ -42,68 +179,79 @@ class AllOfConstraint(Constraint):
         if json_type != "unknown":
             context.add_type_hint(context.path, json_type)
         
-        # Special handling for objects with properties
+        # Properties defined by object constraints in allOf belong to the parent
         if json_type == "object":
-            # Collect all defined properties from object constraints in allOf
-            all_properties = set()
-            for constraint in self.constraints:
-                if isinstance(constraint, ObjectConstraint) and constraint.properties:
-                    all_properties.update(constraint.properties.keys())
-            
-            # Add these to the parent_properties set in the context
+            all_properties = self._branch_object_properties()
             if all_properties:
                 context.add_parent_properties(all_properties)
         
         # Validate against each constraint
-        for i, constraint in enumerate(self.constraints):
-            with context.with_schema_path(f"allOf/{i}"):
-                # Use an isolated error context to collect sub-constraint errors
-                sub_context = ValidationContext(verbose=context.verbose)
-                sub_context.path_parts = context.path_parts.copy()
-                sub_context.schema_path_parts = context.schema_path_parts.copy()
-                sub_context.root_schema = context.root_schema  # Ensure root schema is propagated
-                
-                # Propagate any type hints
-                for path, type_hint in context.type_hints.items():
-                    sub_context.add_type_hint(path, type_hint)
-                
-                # Propagate parent properties
-                sub_context.parent_properties = context.parent_properties.copy()
-                
-                # Check if this constraint has a validation order
-                sub_result = False
-                if hasattr(constraint, "validation_order") and getattr(constraint, "validation_order"):
-                    # Use the validation order
-                    sub_result = True
-                    for sub_constraint in constraint.validation_order:
-                        if not sub_constraint.validate(value, sub_context):
-                            sub_result = False
-                            break
-                else:
-                    # Use standard validation
-                    sub_result = constraint.validate(value, sub_context)
+        segments = self._schema_segments()
+        for i, (_, validate, _) in enumerate(self._branches()):
+            context.push_schema_path(segments[i])
+            try:
+                # Validate in place and take the sub-constraint errors back out
+                sub_result, sub_errors = context.validate_isolated(validate, value)
                 
                 if not sub_result:
                     valid = False
 
                     # Add the collected errors to the main context
-                    for error in sub_context.errors:
+                    prefixes = self._error_prefixes()
+                    for error in sub_errors:
                         # Skip additionalProperty errors for properties defined in parent schemas
                         if error.code == ErrorCode.ADDITIONAL_PROPERTY_NOT_ALLOWED:
-                            import re
-                            match = re.search(r"'([^']+)'", error.message)
-                            if match and match.group(1) in context.parent_properties:
+                            if error.property_name in context.parent_properties:
                                 continue
                         
                         context.add_error(
                             error.code,
-                            f"allOf[{i}]: {error.message}",
+                            prefixes[i] + error.formatted,
                             value=error.value,
-                            constraint=error.constraint
+                            constraint=error.constraint,
+                            property_name=error.property_name
                         )
 
+                    # Later branches cannot change the verdict
+                    if context.fail_fast:
+                        return False
+            finally:
+                context.pop_schema_path()
+
         return valid
 
+    def compile_predicate(self) -> Optional[Predicate]:
+        """
+        Compile this constraint into a verdict-only predicate.
+
+        Number constraints among the branches are fused into a single one,
+        which is checked first.
+
+        Returns:
+            Predicate requiring all branches to pass, or None if any of them
+            cannot be compiled
+        """
+        numbers = []
+        others = []
+        for constraint, _, ordered in self._branches():
+            if ordered:
+                return None
+            (numbers if type(constraint) is NumberConstraint else others).append(constraint)
+
+        if len(numbers) > 1:
+            fused = NumberConstraint.intersection(numbers)
+            if fused is not None:
+                numbers = [fused]
+
+        predicates = []
+        for constraint in numbers + others:
+            predicate = constraint.predicate()
+            if predicate is None:
+                return None
+            predicates.append(predicate)
+
+        return _all_predicates(predicates)
+
     def __str__(self) -> str:
         """String representation of the constraint."""
         return f"AllOfConstraint(constraints={len(self.constraints)})"
@@ -113,19 +261,44 @@ class AllOfConstraint(Constraint):
         return f"AllOfConstraint(constraints={[str(c) for c in self.constraints]})"
 
 
-class AnyOfConstraint(Constraint):
+class AnyOfConstraint(_BranchingConstraint):
     """
     Constraint that requires a value to satisfy at least one sub-constraint.
+
+    Branches are tried in the order they have matched most often so far,
+    since only the first match is needed.
     """
 
-    def __init__(self, constraints: List[Constraint]):
+    keyword = "anyOf"
+
+    @_BranchingConstraint.constraints.setter
+    def constraints(self, constraints: List[Constraint]) -> None:
+        _BranchingConstraint.constraints.fset(self, constraints)
+
+        # Branch indices in the order they are tried, per value type as in
+        # _candidate_indices, and how often each branch has matched; built
+        # on first use like the other branch details
+        self._probe_orders: Dict[Optional[str], Tuple[int, ...]] = {}
+        self._hit_counts: Optional[List[int]] = None
+
+    def _record_hit(self, json_type: Optional[str], order: Tuple[int, ...], position: int) -> None:
         """
-        Initialize a new any-of constraint.
+        Count a match and move the branch ahead of a less successful one.
 
         Args:
-            constraints: List of constraints, at least one of which must be satisfied
+            json_type: Value type the probe order is for
+            order: Probe order the match was found with
+            position: Position of the matching branch in that order
         """
-        self.constraints = constraints
+        hit_counts = self._hit_counts
+        i = order[position]
+        hit_counts[i] += 1
+
+        if position and hit_counts[i] > hit_counts[order[position - 1]]:
+            # Swap into a new tuple so concurrent validations never see a
+            # half-updated order
+            self._probe_orders[json_type] = (order[:position - 1] + (i, order[position - 1])
+                                             + order[position + 1:])
 
     def validate(self, value: Any, context: ValidationContext) -> bool:
         """
@@ -143,56 +316,41 @@ class AnyOfConstraint(Constraint):
         if json_type != "unknown":
             context.add_type_hint(context.path, json_type)
 
-        # Special handling for objects with properties
+        # Properties defined by object constraints in anyOf belong to the parent
         if json_type == "object":
-            # Collect all defined properties from object constraints in anyOf
-            all_properties = set()
-            for constraint in self.constraints:
-                if isinstance(constraint, ObjectConstraint) and constraint.properties:
-                    all_properties.update(constraint.properties.keys())
-            
-            # Add these to the parent_properties set in the context
+            all_properties = self._branch_object_properties()
             if all_properties:
                 context.add_parent_properties(all_properties)
                 
         # Track all sub-constraint errors
         all_errors = []
 
+        # Without verbose details only the anyOf error itself is reported,
+        # so branches that reject the value's type need not be tried
+        branches = self._branches()
+        key = None if context.verbose or json_type == "unknown" else json_type
+        probe_order = self._probe_orders.get(key)
+        if probe_order is None:
+            if self._hit_counts is None:
+                self._hit_counts = [0] * len(branches)
+            probe_order = self._probe_orders[key] = self._candidate_indices(key)
+
         # Check each constraint separately
-        for i, constraint in enumerate(self.constraints):
-            with context.with_schema_path(f"anyOf/{i}"):
-                # Use an isolated error context to collect sub-constraint errors
-                sub_context = ValidationContext(verbose=context.verbose)
-                sub_context.path_parts = context.path_parts.copy()
-                sub_context.schema_path_parts = context.schema_path_parts.copy()
-                # Important for resolving references
-                sub_context.root_schema = context.root_schema
-
-                # Propagate any type hints
-                for path, type_hint in context.type_hints.items():
-                    sub_context.add_type_hint(path, type_hint)
-                
-                # Propagate parent properties
-                sub_context.parent_properties = context.parent_properties.copy()
-                
-                # If this branch has a specified validation order, use it
-                if hasattr(constraint, "validation_order") and getattr(constraint, "validation_order"):
-                    # Validate using the ordered constraints
-                    branch_valid = True
-                    for sub_constraint in constraint.validation_order:
-                        if not sub_constraint.validate(value, sub_context):
-                            branch_valid = False
-                            break
-                    
-                    if branch_valid:
-                        return True  # This branch passed
-                else:
-                    # Use standard validation for this branch
-                    if constraint.validate(value, sub_context):
-                        return True  # At least one constraint passed
+        segments = self._schema_segments()
+        for position, i in enumerate(probe_order):
+            context.push_schema_path(segments[i])
+            try:
+                # Validate in place and take the sub-constraint errors back out
+                branch_valid, sub_errors = context.validate_isolated(branches[i][1], value)
+
+                if branch_valid:
+                    self._record_hit(key, probe_order, position)
+                    return True  # At least one constraint passed
                 
                 # Store the errors for this sub-constraint
-                all_errors.append((i, sub_context.errors))
+                all_errors.append((i, sub_errors))
+            finally:
+                context.pop_schema_path()
 
         # If we got here, no constraints matched
         context.add_error(
@@ -202,23 +360,24 @@ class AnyOfConstraint(Constraint):
             constraint=self
         )
 
-        # Add details about why each constraint failed
+        # Add details about why each constraint failed, in schema order
         if context.verbose:
+            all_errors.sort(key=lambda branch_errors: branch_errors[0])
+            prefixes = self._error_prefixes()
             for i, errors in all_errors:
                 for error in errors:
                     # Skip additionalProperty errors for properties defined in parent schemas
                     # or in other anyOf branches
                     if error.code == ErrorCode.ADDITIONAL_PROPERTY_NOT_ALLOWED:
-                        import re
-                        match = re.search(r"'([^']+)'", error.message)
-                        if match and match.group(1) in context.parent_properties:
+                        if error.property_name in context.parent_properties:
                             continue
                     
                     context.add_error(
                         error.code,
-                        f"anyOf[{i}]: {error.message}",
+                        prefixes[i] + error.formatted,
                         value=error.value,
-                        constraint=error.constraint
+                        constraint=error.constraint,
+                        property_name=error.property_name
                     )
 
         return False
@@ -233,19 +392,12 @@ class AnyOfConstraint(Constraint):
 
 
 
-class OneOfConstraint(Constraint):
+class OneOfConstraint(_BranchingConstraint):
     """
     Constraint that requires a value to satisfy exactly one sub-constraint.
     """
 
-    def __init__(self, constraints: List[Constraint]):
-        """
-        Initialize a new one-of constraint.
-
-        Args:
-            constraints: List of constraints, exactly one of which must be satisfied
-        """
-        self.constraints = constraints
+    keyword = "oneOf"
 
     def validate(self, value: Any, context: ValidationContext) -> bool:
         """
@@ -263,15 +415,9 @@ class OneOfConstraint(Constraint):
         if json_type != "unknown":
             context.add_type_hint(context.path, json_type)
         
-        # Special handling for objects with properties
+        # Properties defined by object constraints in oneOf belong to the parent
         if json_type == "object":
-            # Collect all defined properties from object constraints in oneOf
-            all_properties = set()
-            for constraint in self.constraints:
-                if isinstance(constraint, ObjectConstraint) and constraint.properties:
-                    all_properties.update(constraint.properties.keys())
-            
-            # Add these to the parent_properties set in the context
+            all_properties = self._branch_object_properties()
             if all_properties:
                 context.add_parent_properties(all_properties)
         
@@ -281,40 +427,36 @@ class OneOfConstraint(Constraint):
         # Track all sub-constraint errors
         all_errors = []
 
+        # Without verbose details the per-branch errors are not reported,
+        # so branches that reject the value's type need not be tried
+        branches = self._branches()
+        candidates = self._candidate_indices(
+            None if context.verbose or json_type == "unknown" else json_type)
+
         # Check each constraint
-        for i, constraint in enumerate(self.constraints):
-            with context.with_schema_path(f"oneOf/{i}"):
-                # Use an isolated error context to collect sub-constraint errors
-                sub_context = ValidationContext(verbose=context.verbose)
-                sub_context.path_parts = context.path_parts.copy()
-                sub_context.schema_path_parts = context.schema_path_parts.copy()
-                sub_context.root_schema = context.root_schema
-
-                # Propagate any type hints
-                for path, type_hint in context.type_hints.items():
-                    sub_context.add_type_hint(path, type_hint)
-                
-                # Propagate parent properties
-                sub_context.parent_properties = context.parent_properties.copy()
-                
-                # If this branch has a specified validation order, use it
-                if hasattr(constraint, "validation_order") and getattr(constraint, "validation_order"):
-                    # Validate using the ordered constraints
-                    branch_valid = True
-                    for sub_constraint in constraint.validation_order:
-                        if not sub_constraint.validate(value, sub_context):
-                            branch_valid = False
-                            break
-                    
-                    if branch_valid:
-                        matching_constraints.append(i)
-                else:
-                    # Validate against the sub-constraint
-                    if constraint.validate(value, sub_context):
-                        matching_constraints.append(i)
-                    else:
-                        # Store the errors for this sub-constraint
-                        all_errors.append((i, sub_context.errors))
+        segments = self._schema_segments()
+        for position, i in enumerate(candidates):
+            _, validate, ordered = branches[i]
+            context.push_schema_path(segments[i])
+            try:
+                # Validate in place and take the sub-constraint errors back out
+                branch_valid, sub_errors = context.validate_isolated(validate, value)
+
+                if branch_valid:
+                    matching_constraints.append(i)
+                elif not ordered:
+                    # Store the errors for this sub-constraint
+                    all_errors.append((i, sub_errors))
+
+                # A second match already decides the verdict; only verbose
+                # validation goes on to list every matching schema
+                if len(matching_constraints) > 1 and (context.fail_fast or not context.verbose):
+                    stopped_early = position < len(candidates) - 1
+                    break
+            finally:
+                context.pop_schema_path()
+        else:
+            stopped_early = False
         
         # Check if exactly one constraint matched
         if len(matching_constraints) == 0:
@@ -327,27 +469,28 @@ class OneOfConstraint(Constraint):
 
             # Add details about why each constraint failed
             if context.verbose:
+                prefixes = self._error_prefixes()
                 for i, errors in all_errors:
                     for error in errors:
                         # Skip additionalProperty errors for properties defined in parent schemas
                         if error.code == ErrorCode.ADDITIONAL_PROPERTY_NOT_ALLOWED:
-                            import re
-                            match = re.search(r"'([^']+)'", error.message)
-                            if match and match.group(1) in context.parent_properties:
+                            if error.property_name in context.parent_properties:
                                 continue
                         
                         context.add_error(
                             error.code,
-                            f"oneOf[{i}]: {error.message}",
+                            prefixes[i] + error.formatted,
                             value=error.value,
-                            constraint=error.constraint
+                            constraint=error.constraint,
+                            property_name=error.property_name
                         )
 
             return False
         elif len(matching_constraints) > 1:
             context.add_error(
                 ErrorCode.ONE_OF_MULTIPLE_MATCHES,
-                f"Value matches {len(matching_constraints)} schemas, but should match exactly one",
+                f"Value matches {'at least ' if stopped_early else ''}{len(matching_constraints)} schemas, "
+                "but should match exactly one",
                 value=value,
                 constraint=self
             )
@@ -388,6 +531,25 @@ class NotConstraint(Constraint):
         """
         self.constraint = constraint
 
+    @property
+    def constraint(self) -> Optional[Constraint]:
+        """
+        Get the sub-constraint.
+
+        Returns:
+            Constraint that must not be satisfied
+        """
+        return self._constraint
+
+    @constraint.setter
+    def constraint(self, constraint: Optional[Constraint]) -> None:
+        self._constraint = constraint
+
+        # Predicate (if the sub-constraint has one) and validate function of
+        # the sub-constraint, resolved on first use as the compiler attaches
+        # the sub-constraint after construction
+        self._sub_check: Optional[Tuple[Optional[Predicate], Callable[[Any, ValidationContext], bool]]] = None
+
     def validate(self, value: Any, context: ValidationContext) -> bool:
         """
         Validate a value against this not constraint.
@@ -415,31 +577,20 @@ class NotConstraint(Constraint):
             )
             return False
 
-        # Use an isolated error context to check if the sub-constraint passes
-        sub_context = ValidationContext(verbose=context.verbose)
-        sub_context.path_parts = context.path_parts.copy()
-        sub_context.schema_path_parts = context.schema_path_parts.copy()
-        sub_context.root_schema = context.root_schema
+        sub_check = self._sub_check
+        if sub_check is None:
+            _, validate, ordered = _branch(self._constraint)
+            sub_check = self._sub_check = (None if ordered else self._constraint.predicate(), validate)
+        predicate, validate = sub_check
 
-        # Propagate any type hints
-        for path, type_hint in context.type_hints.items():
-            sub_context.add_type_hint(path, type_hint)
-        
-        # Propagate parent properties
-        sub_context.parent_properties = context.parent_properties.copy()
-        
         with context.with_schema_path("not"):
-            # Check if the constraint is not satisfied
-            # If this constraint has a validation order, use it
-            sub_result = False
-            if hasattr(self.constraint, "validation_order") and getattr(self.constraint, "validation_order"):
-                sub_result = True
-                for sub_constraint in self.constraint.validation_order:
-                    if not sub_constraint.validate(value, sub_context):
-                        sub_result = False
-                        break
+            # The errors of the sub-constraint are never reported, so its
+            # predicate is enough when it has one
+            if predicate is not None:
+                sub_result = predicate(value)
             else:
-                sub_result = self.constraint.validate(value, sub_context)
+                # Check the sub-constraint in place, discarding its errors
+                sub_result, _ = context.validate_isolated(validate, value)
             
             if sub_result:
                 context.add_error(
@@ -453,6 +604,25 @@ class NotConstraint(Constraint):
         # Constraint was not satisfied, which is what we want
         return True
 
+    def compile_predicate(self) -> Optional[Predicate]:
+        """
+        Compile this not constraint into a predicate.
+
+        Returns:
+            Predicate negating the predicate of the sub-constraint, or None
+            if the sub-constraint cannot be compiled
+        """
+        if self._constraint is None or _branch(self._constraint)[2]:
+            return None
+
+        sub_predicate = self._constraint.predicate()
+        if sub_predicate is None:
+            return None
+
+        def check(value: Any) -> bool:
+            return not sub_predicate(value)
+        return check
+
     def __str__(self) -> str:
         """String representation of the constraint."""
         return f"NotConstraint(constraint={self.constraint})"
@@ -2,20 +2,59 @@
 Null constraint implementation.
 """
 
-from typing import Any
+from typing import Any, Dict, List, Optional, Sequence
 
-from .base import TypeConstraint, ValidationContext
+from .base import Constraint, Predicate, TypeConstraint, ValidationContext
 
 
 class NullConstraint(TypeConstraint):
     """
     Constraint for validating null values.
+
+    Null constraints have no settings, so one shared instance is used,
+    NullConstraint.INSTANCE.
     """
+
+    __slots__ = ()
+
+    # Shared instance of each class
+    _instances: Dict[type, "NullConstraint"] = {}
+
+    def __new__(cls) -> "NullConstraint":
+        instance = cls._instances.get(cls)
+        if instance is None:
+            instance = cls._instances[cls] = super().__new__(cls)
+        return instance
+
+    @TypeConstraint.validation_order.setter
+    def validation_order(self, validation_order: Optional[Sequence[Constraint]]) -> None:
+        # A shared instance must not carry the order of one compiled schema
+        # into the others; a lone null check has nothing to order anyway
+        pass
     
     @property
     def json_type(self) -> str:
         return "null"
     
+    def validate(self, value: Any, context: ValidationContext) -> bool:
+        """
+        Validate a value against this null constraint.
+
+        There are no null-specific checks, so only the type is checked.
+
+        Args:
+            value: Value to validate
+            context: Validation context
+
+        Returns:
+            True if validation succeeds, False otherwise
+        """
+        if value is None:
+            return True
+
+        # Report the type error
+        return self._validate_type(value, context)
+    
     def _validate_type_specific(self, value: Any, context: ValidationContext) -> bool:
         """
         Validate null-specific constraints.
@@ -30,6 +69,15 @@ class NullConstraint(TypeConstraint):
         # No additional constraints for null
         return True
     
+    def _compile_type_specific(self) -> Optional[List[Predicate]]:
+        """
+        Compile the type-specific checks into predicates.
+
+        Returns:
+            Empty list, as there are no type-specific checks
+        """
+        return []
+    
     def __str__(self) -> str:
         """String representation of the constraint."""
         return "NullConstraint()"
@@ -37,3 +85,6 @@ class NullConstraint(TypeConstraint):
     def __repr__(self) -> str:
         """Detailed representation of the null constraint."""
         return self.__str__()
+
+
+NullConstraint.INSTANCE = NullConstraint()
@@ -2,12 +2,93 @@
 Number constraint implementation.
 """
 
-from typing import Any, Optional
+import math
+from fractions import Fraction
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+from weakref import WeakValueDictionary
 
-from .base import TypeConstraint, ValidationContext
+from .base import Constraint, Predicate, TypeConstraint, ValidationContext
 from ..api import ErrorCode
 
 
+def _float_multiple_check(multiple_of: Any) -> Predicate:
+    """
+    Build a multipleOf check using floating point modulo with a tolerance.
+
+    Args:
+        multiple_of: Divisor
+
+    Returns:
+        Predicate checking whether a number is a multiple of the divisor
+    """
+    if isinstance(multiple_of, float):
+        def is_multiple(value: Any) -> bool:
+            remainder = value % multiple_of
+            return remainder < 1e-10 or abs(remainder - multiple_of) < 1e-10
+    else:
+        def is_multiple(value: Any) -> bool:
+            if isinstance(value, float):
+                remainder = value % multiple_of
+                return remainder < 1e-10 or abs(remainder - multiple_of) < 1e-10
+            return value % multiple_of == 0
+    return is_multiple
+
+
+# Rounding error allowed when scaling a float by a multipleOf denominator,
+# in units in the last place of the product
+_MULTIPLE_ULPS = 4
+
+
+def _multiple_check(multiple_of: Any) -> Predicate:
+    """
+    Build a multipleOf check.
+
+    The divisor is converted to the exact fraction its decimal form spells
+    out, e.g. 0.1 becomes 1/10, so value is a multiple of num/den exactly
+    when value * den is an integer multiple of num. That is exact for
+    integers; floats may be off the integer by the rounding of value and
+    of the product, a few units in the last place of the product.
+
+    Args:
+        multiple_of: Divisor
+
+    Returns:
+        Predicate checking whether a number is a multiple of the divisor
+    """
+    try:
+        fraction = Fraction(str(multiple_of))
+    except (ValueError, ZeroDivisionError):
+        fraction = None
+    if fraction is None or fraction <= 0:
+        # Not a positive finite number; keep the plain float behaviour
+        return _float_multiple_check(multiple_of)
+
+    numerator, denominator = fraction.numerator, fraction.denominator
+    float_is_multiple = _float_multiple_check(multiple_of)
+
+    def is_multiple(value: Any) -> bool:
+        if type(value) is int:
+            return value * denominator % numerator == 0
+
+        scaled = value * denominator
+        if not math.isfinite(scaled):
+            # Too large to scale
+            return float_is_multiple(value)
+        nearest = round(scaled)
+        return nearest % numerator == 0 and abs(scaled - nearest) <= _MULTIPLE_ULPS * math.ulp(scaled)
+    return is_multiple
+
+
+# Live number constraints created through NumberConstraint.get(), keyed by
+# their settings
+_INSTANCES: "WeakValueDictionary[tuple, NumberConstraint]" = WeakValueDictionary()
+
+
+def _no_checks(value: Any, context: ValidationContext) -> bool:
+    """Type-specific validation for number constraints without any checks."""
+    return True
+
+
 class NumberConstraint(TypeConstraint):
     """
     Constraint for validating numeric values.
@@ -37,6 +118,134 @@ class NumberConstraint(TypeConstraint):
         self.exclusive_maximum = exclusive_maximum
         self.multiple_of = multiple_of
         self.integer_only = integer_only
+
+        # Only the checks this schema sets, with the exclusive bounds resolved
+        checks = []
+        if minimum is not None:
+            checks.append(self._check_exclusive_minimum if exclusive_minimum else self._check_minimum)
+        if maximum is not None:
+            checks.append(self._check_exclusive_maximum if exclusive_maximum else self._check_maximum)
+        if multiple_of is not None:
+            self._is_multiple = _multiple_check(multiple_of)
+            checks.append(self._check_multiple_of)
+        self._checks: Tuple[Callable[[Any, ValidationContext], bool], ...] = tuple(checks)
+
+        # Most schemas set a single check, which is called directly
+        if not checks:
+            self._validate_type_specific = _no_checks
+        elif len(checks) == 1:
+            self._validate_type_specific = checks[0]
+
+        super().__init__()
+    
+    @classmethod
+    def get(cls,
+            minimum: Optional[float] = None,
+            maximum: Optional[float] = None,
+            exclusive_minimum: bool = False,
+            exclusive_maximum: bool = False,
+            multiple_of: Optional[float] = None,
+            integer_only: bool = False) -> "NumberConstraint":
+        """
+        Get a number constraint with the given settings, sharing existing ones.
+
+        Number constraints are not changed after construction, so schemas
+        repeating the same checks can use one instance.
+
+        Args:
+            minimum: Minimum value
+            maximum: Maximum value
+            exclusive_minimum: Whether minimum is exclusive
+            exclusive_maximum: Whether maximum is exclusive
+            multiple_of: Value must be a multiple of this
+            integer_only: Whether only integers are allowed
+
+        Returns:
+            Number constraint
+        """
+        settings = (minimum, maximum, exclusive_minimum, exclusive_maximum,
+                    multiple_of, integer_only)
+
+        # Equal numbers of different types (1, 1.0, True) read differently
+        # in error messages, so the types are part of the key
+        key = (cls,) + tuple((type(setting), setting) for setting in settings)
+        try:
+            instance = _INSTANCES.get(key)
+        except TypeError:
+            # Unhashable settings from a malformed schema
+            return cls(*settings)
+
+        if instance is None:
+            instance = _INSTANCES[key] = cls(*settings)
+        return instance
+
+    @TypeConstraint.validation_order.setter
+    def validation_order(self, validation_order: Optional[Sequence[Constraint]]) -> None:
+        # Instances are shared between schemas, so the order one schema's
+        # compiler attaches must not reach the others. A number constraint
+        # has no children, so it validates the same without an order.
+        pass
+
+    @classmethod
+    def intersection(cls, constraints: Sequence["NumberConstraint"]) -> Optional["NumberConstraint"]:
+        """
+        Build a single constraint accepting exactly the numbers all given ones accept.
+
+        The tightest bounds win, and the multipleOf divisors are replaced by
+        their least common multiple.
+
+        Args:
+            constraints: Number constraints to intersect
+
+        Returns:
+            Intersected constraint, or None if the constraints cannot be
+            combined (a divisor that is not a positive finite number)
+        """
+        minimum = maximum = multiple = None
+        exclusive_minimum = exclusive_maximum = False
+
+        for constraint in constraints:
+            if constraint.minimum is not None:
+                if minimum is None or constraint.minimum > minimum:
+                    minimum, exclusive_minimum = constraint.minimum, constraint.exclusive_minimum
+                elif constraint.minimum == minimum:
+                    exclusive_minimum = exclusive_minimum or constraint.exclusive_minimum
+
+            if constraint.maximum is not None:
+                if maximum is None or constraint.maximum < maximum:
+                    maximum, exclusive_maximum = constraint.maximum, constraint.exclusive_maximum
+                elif constraint.maximum == maximum:
+                    exclusive_maximum = exclusive_maximum or constraint.exclusive_maximum
+
+            if constraint.multiple_of is not None:
+                try:
+                    fraction = Fraction(str(constraint.multiple_of))
+                except (ValueError, ZeroDivisionError):
+                    return None
+                if fraction <= 0:
+                    return None
+                if multiple is None:
+                    multiple = fraction
+                else:
+                    # lcm(a/b, c/d) = lcm(a, c) / gcd(b, d)
+                    multiple = Fraction(math.lcm(multiple.numerator, fraction.numerator),
+                                        math.gcd(multiple.denominator, fraction.denominator))
+
+        if multiple is None:
+            multiple_of = None
+        elif multiple.denominator == 1:
+            multiple_of = multiple.numerator
+        else:
+            multiple_of = float(multiple)
+
+        return cls(
+            minimum=minimum,
+            maximum=maximum,
+            exclusive_minimum=exclusive_minimum,
+            exclusive_maximum=exclusive_maximum,
+            multiple_of=multiple_of,
+            integer_only=any(constraint.integer_only for constraint in constraints)
+        )
     
     @property
     def json_type(self) -> str:
@@ -45,6 +254,9 @@ class NumberConstraint(TypeConstraint):
     def _validate_type_specific(self, value: Any, context: ValidationContext) -> bool:
         """
         Validate number-specific constraints.
+
+        Constraints with no checks or a single check replace this method in
+        __init__.
         
         Args:
             value: The number to validate (guaranteed to be a number)
@@ -54,65 +266,103 @@ class NumberConstraint(TypeConstraint):
             True if validation succeeds, False otherwise
         """
         valid = True
-        
-        # Check minimum
-        if self.minimum is not None:
-            if self.exclusive_minimum and value <= self.minimum:
-                context.add_error(
-                    ErrorCode.NUMBER_TOO_SMALL,
-                    f"Value {value} must be greater than {self.minimum}",
-                    value=value,
-                    constraint=self
-                )
+        for check in self._checks:
+            if not check(value, context):
                 valid = False
-            elif not self.exclusive_minimum and value < self.minimum:
-                context.add_error(
-                    ErrorCode.NUMBER_TOO_SMALL,
-                    f"Value {value} must be greater than or equal to {self.minimum}",
-                    value=value,
-                    constraint=self
-                )
-                valid = False
-        
-        # Check maximum
-        if self.maximum is not None:
-            if self.exclusive_maximum and value >= self.maximum:
-                context.add_error(
-                    ErrorCode.NUMBER_TOO_LARGE,
-                    f"Value {value} must be less than {self.maximum}",
-                    value=value,
-                    constraint=self
-                )
-                valid = False
-            elif not self.exclusive_maximum and value > self.maximum:
-                context.add_error(
-                    ErrorCode.NUMBER_TOO_LARGE,
-                    f"Value {value} must be less than or equal to {self.maximum}",
-                    value=value,
-                    constraint=self
-                )
-                valid = False
-        
-        # Check multiple_of
-        if self.multiple_of is not None:
-            # Handle floating point precision issues
-            if isinstance(value, float) or isinstance(self.multiple_of, float):
-                # For floating point, we need to consider precision
-                remainder = value % self.multiple_of
-                is_multiple = remainder < 1e-10 or abs(remainder - self.multiple_of) < 1e-10
-            else:
-                is_multiple = value % self.multiple_of == 0
-                
-            if not is_multiple:
-                context.add_error(
-                    ErrorCode.NUMBER_NOT_MULTIPLE,
-                    f"Value {value} is not a multiple of {self.multiple_of}",
-                    value=value,
-                    constraint=self
-                )
-                valid = False
-                
         return valid
+
+    def _check_minimum(self, value: Any, context: ValidationContext) -> bool:
+        """Check an inclusive minimum."""
+        if value >= self.minimum:
+            return True
+
+        context.add_error(
+            ErrorCode.NUMBER_TOO_SMALL,
+            lambda: f"Value {value} must be greater than or equal to {self.minimum}",
+            value=value,
+            constraint=self
+        )
+        return False
+
+    def _check_exclusive_minimum(self, value: Any, context: ValidationContext) -> bool:
+        """Check an exclusive minimum."""
+        if value > self.minimum:
+            return True
+
+        context.add_error(
+            ErrorCode.NUMBER_TOO_SMALL,
+            lambda: f"Value {value} must be greater than {self.minimum}",
+            value=value,
+            constraint=self
+        )
+        return False
+
+    def _check_maximum(self, value: Any, context: ValidationContext) -> bool:
+        """Check an inclusive maximum."""
+        if value <= self.maximum:
+            return True
+
+        context.add_error(
+            ErrorCode.NUMBER_TOO_LARGE,
+            lambda: f"Value {value} must be less than or equal to {self.maximum}",
+            value=value,
+            constraint=self
+        )
+        return False
+
+    def _check_exclusive_maximum(self, value: Any, context: ValidationContext) -> bool:
+        """Check an exclusive maximum."""
+        if value < self.maximum:
+            return True
+
+        context.add_error(
+            ErrorCode.NUMBER_TOO_LARGE,
+            lambda: f"Value {value} must be less than {self.maximum}",
+            value=value,
+            constraint=self
+        )
+        return False
+
+    def _check_multiple_of(self, value: Any, context: ValidationContext) -> bool:
+        """Check multipleOf."""
+        if self._is_multiple(value):
+            return True
+
+        context.add_error(
+            ErrorCode.NUMBER_NOT_MULTIPLE,
+            lambda: f"Value {value} is not a multiple of {self.multiple_of}",
+            value=value,
+            constraint=self
+        )
+        return False
+    
+    def _compile_type_specific(self) -> Optional[List[Predicate]]:
+        """
+        Compile the number-specific checks into predicates.
+
+        Returns:
+            List of predicates
+        """
+        checks = []
+
+        minimum = self.minimum
+        if minimum is not None:
+            if self.exclusive_minimum:
+                checks.append(lambda value: value > minimum)
+            else:
+                checks.append(lambda value: value >= minimum)
+
+        maximum = self.maximum
+        if maximum is not None:
+            if self.exclusive_maximum:
+                checks.append(lambda value: value < maximum)
+            else:
+                checks.append(lambda value: value <= maximum)
+
+        if self.multiple_of is not None:
+            checks.append(self._is_multiple)
+
+        return checks
     
     def __str__(self) -> str:
         """String representation of the constraint."""
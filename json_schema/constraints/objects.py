@@ -3,15 +3,39 @@ Object constraint implementation.
 """
 
 import re
-from typing import Any, Dict, List, Optional, Union
+import sys
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+from ._patterns import Matcher, compile_alternation_matcher, compile_matcher, match_any
 from .base import TypeConstraint, ValidationContext, Constraint
 from ..api import ErrorCode
 
 
+# Check of one group of object keywords against an object value
+_ObjectCheck = Callable[[Dict[str, Any], ValidationContext], bool]
+
+
+def _intern(name: Any) -> Any:
+    """
+    Intern a property name, so lookups of equal interned names compare by identity.
+
+    Args:
+        name: Property name from a schema
+
+    Returns:
+        Interned name, or the name itself if it is not a builtin string
+    """
+    return sys.intern(name) if type(name) is str else name
+
+
 class ObjectConstraint(TypeConstraint):
     """
     Constraint for validating object values.
+
+    The compiler fills in the keywords after construction. Once the
+    constraint first validates a value, its keyword collections are frozen;
+    use with_overrides() to derive a constraint with different keywords.
     """
     
     def __init__(self, 
@@ -45,14 +69,11 @@ class ObjectConstraint(TypeConstraint):
         self.max_properties = max_properties
         self.dependencies = dependencies or {}
         
-        # Compile the pattern property regexes
-        self._compiled_patterns = {}
-        for pattern in self.pattern_properties:
-            try:
-                self._compiled_patterns[pattern] = re.compile(pattern)
-            except re.error:
-                # We'll handle this during validation
-                pass
+        # Checks specialized to the keywords above, built on first use as
+        # the compiler fills in the keywords after construction
+        self._checks: Optional[Tuple[_ObjectCheck, ...]] = None
+
+        super().__init__()
     
     @property
     def json_type(self) -> str:
@@ -61,6 +82,9 @@ class ObjectConstraint(TypeConstraint):
     def _validate_type_specific(self, value: Any, context: ValidationContext) -> bool:
         """
         Validate object-specific constraints.
+
+        The checks are specialized to this constraint's keywords on first
+        use, so keywords that are not set cost nothing.
         
         Args:
             value: The object to validate (guaranteed to be an object)
@@ -69,124 +93,291 @@ class ObjectConstraint(TypeConstraint):
         Returns:
             True if validation succeeds, False otherwise
         """
+        checks = self._checks
+        if checks is None:
+            checks = self._checks = self._compile_checks()
+
         valid = True
-        
-        # Check min_properties
-        if self.min_properties is not None and len(value) < self.min_properties:
-            context.add_error(
-                ErrorCode.OBJECT_TOO_FEW_PROPERTIES,
-                f"Object has {len(value)} properties, but minimum is {self.min_properties}",
-                value=value,
-                constraint=self
-            )
-            valid = False
-            
-        # Check max_properties
-        if self.max_properties is not None and len(value) > self.max_properties:
-            context.add_error(
-                ErrorCode.OBJECT_TOO_MANY_PROPERTIES,
-                f"Object has {len(value)} properties, but maximum is {self.max_properties}",
-                value=value,
-                constraint=self
-            )
-            valid = False
-            
-        # Check required properties - do this first as it's a key validation
-        for prop in self.required:
-            if prop not in value:
-                context.add_error(
-                    ErrorCode.REQUIRED_PROPERTY_MISSING,
-                    f"Missing required property '{prop}'",
-                    value=value,
-                    constraint=self
-                )
+        for check in checks:
+            if not check(value, context):
+                if context.fail_fast:
+                    return False
                 valid = False
-        
-        # Check dependencies
-        for prop, deps in self.dependencies.items():
-            if prop in value:
-                for dep in deps:
-                    if dep not in value:
+        return valid
+
+    def _compile_checks(self) -> Tuple[_ObjectCheck, ...]:
+        """
+        Build the checks for the keywords of this constraint.
+
+        Only keywords that are set get a check, and each check captures its
+        keyword's settings, so validation does not look them up again. The
+        checks run in the order errors have always been reported in.
+
+        Returns:
+            Tuple of checks
+        """
+        # Later changes to the keywords would not reach the checks, so they
+        # are made impossible
+        self.properties = MappingProxyType({
+            _intern(prop): prop_constraint for prop, prop_constraint in self.properties.items()})
+        self.required = tuple(_intern(prop) for prop in self.required)
+        self.pattern_properties = MappingProxyType(dict(self.pattern_properties))
+        self.dependencies = MappingProxyType({
+            _intern(prop): deps for prop, deps in self.dependencies.items()})
+
+        checks: List[_ObjectCheck] = []
+        constraint = self
+
+        min_properties = self.min_properties
+        max_properties = self.max_properties
+        if min_properties is not None or max_properties is not None:
+            # One comparison covers both bounds; unset bounds never fail
+            lower = min_properties if min_properties is not None else 0
+            upper = max_properties if max_properties is not None else sys.maxsize
+
+            def check_property_count(value: Dict[str, Any], context: ValidationContext) -> bool:
+                count = len(value)
+                if lower <= count <= upper:
+                    return True
+
+                if count < lower:
+                    context.add_error(
+                        ErrorCode.OBJECT_TOO_FEW_PROPERTIES,
+                        lambda: f"Object has {count} properties, but minimum is {min_properties}",
+                        value=value,
+                        constraint=constraint
+                    )
+                    if context.fail_fast:
+                        return False
+                if count > upper:
+                    context.add_error(
+                        ErrorCode.OBJECT_TOO_MANY_PROPERTIES,
+                        lambda: f"Object has {count} properties, but maximum is {max_properties}",
+                        value=value,
+                        constraint=constraint
+                    )
+                return False
+            checks.append(check_property_count)
+
+        required = tuple(self.required)
+        if required:
+            def check_required(value: Dict[str, Any], context: ValidationContext) -> bool:
+                valid = True
+                for prop in required:
+                    if prop not in value:
                         context.add_error(
-                            ErrorCode.DEPENDENCY_MISSING,
-                            f"Property '{prop}' depends on '{dep}', which is missing",
+                            ErrorCode.REQUIRED_PROPERTY_MISSING,
+                            lambda prop=prop: f"Missing required property '{prop}'",
                             value=value,
-                            constraint=self
+                            constraint=constraint
                         )
+                        if context.fail_fast:
+                            return False
                         valid = False
-        
-        # Validate property names
-        if self.property_names is not None:
-            for prop in value:
-                with context.with_path(prop):
-                    if not self.property_names.validate(prop, context):
-                        valid = False
-                
-        # Track which properties have been validated by a schema
-        validated_props = set()
-        
-        # Add properties defined in this schema to parent properties
-        for prop in self.properties.keys():
-            context.add_parent_property(prop)
-        
-        # Validate specified properties
-        for prop, constraint in self.properties.items():
-            # Mark as validated even if not present in the value
-            validated_props.add(prop)
-            
-            if prop in value:
-                with context.with_path(prop):
-                    if not constraint.validate(value[prop], context):
-                        valid = False
-        
-        # Validate pattern properties
-        for pattern, constraint in self.pattern_properties.items():
-            # Compile the pattern if not already compiled
-            if pattern not in self._compiled_patterns:
-                try:
-                    self._compiled_patterns[pattern] = re.compile(pattern)
-                except re.error as e:
-                    context.add_error(
-                        ErrorCode.SCHEMA_INVALID,
-                        f"Invalid regex pattern '{pattern}': {str(e)}",
-                        value=pattern,
-                        constraint=self
-                    )
-                    valid = False
-                    continue
-            
-            compiled_pattern = self._compiled_patterns[pattern]
-            
-            # Check properties against the pattern
-            for prop in value:
-                if compiled_pattern.search(prop):
-                    validated_props.add(prop)
-                    with context.with_path(prop):
-                        if not constraint.validate(value[prop], context):
+                return valid
+            checks.append(check_required)
+
+        dependencies = tuple(
+            (prop, tuple(_intern(dep) for dep in deps)) for prop, deps in self.dependencies.items())
+        if dependencies:
+            def check_dependencies(value: Dict[str, Any], context: ValidationContext) -> bool:
+                valid = True
+                for prop, deps in dependencies:
+                    if prop in value:
+                        for dep in deps:
+                            if dep not in value:
+                                context.add_error(
+                                    ErrorCode.DEPENDENCY_MISSING,
+                                    lambda prop=prop, dep=dep: f"Property '{prop}' depends on '{dep}', which is missing",
+                                    value=value,
+                                    constraint=constraint
+                                )
+                                if context.fail_fast:
+                                    return False
+                                valid = False
+                return valid
+            checks.append(check_dependencies)
+
+        property_check = self._compile_property_check()
+        if property_check is not None:
+            checks.append(property_check)
+        return tuple(checks)
+
+    def _compile_property_check(self) -> Optional[_ObjectCheck]:
+        """
+        Build the check for the keywords that apply to each property.
+
+        The check makes a single pass over the object, checking each property
+        name against propertyNames and its value against the properties and
+        patternProperties constraints that apply to it. Properties no schema
+        applies to are checked against additionalProperties after the pass,
+        once the parent properties are complete.
+
+        Returns:
+            Check validating each property against the constraints that apply
+            to it, or None if no property needs checking
+        """
+        constraint = self
+        property_names = self.property_names
+        properties = self.properties
+        defined = frozenset(properties)
+
+        # Invalid patterns are reported on every validation, as before
+        invalid_patterns: List[Tuple[str, str]] = []
+
+        # Patterns sharing a constraint are matched as one, so a property
+        # matching several of them is validated against it once
+        pattern_groups: Dict[int, Tuple[Constraint, List[str]]] = {}
+        for pattern, pattern_constraint in self.pattern_properties.items():
+            try:
+                compile_matcher(pattern)
+            except re.error as e:
+                invalid_patterns.append((pattern, f"Invalid regex pattern '{pattern}': {str(e)}"))
+                continue
+            pattern_groups.setdefault(id(pattern_constraint), (pattern_constraint, []))[1].append(pattern)
+
+        matchers: List[Tuple[Matcher, Constraint]] = [
+            (compile_alternation_matcher(patterns), pattern_constraint)
+            for pattern_constraint, patterns in pattern_groups.values()]
+
+        # Additional properties allowed without a schema need no checking
+        additional_properties = self.additional_properties
+        check_additional = additional_properties is False or isinstance(additional_properties, Constraint)
+        if (property_names is None and not properties and not matchers
+                and not invalid_patterns and not check_additional):
+            return None
+
+        # Without propertyNames and patternProperties, properties that are
+        # not in properties can be found with set operations
+        simple = property_names is None and not matchers
+
+        def check_properties(value: Dict[str, Any], context: ValidationContext) -> bool:
+            valid = True
+
+            # Add properties defined in this schema to parent properties
+            context.add_parent_properties(defined)
+
+            for pattern, error in invalid_patterns:
+                context.add_error(
+                    ErrorCode.SCHEMA_INVALID,
+                    error,
+                    value=pattern,
+                    constraint=constraint
+                )
+                if context.fail_fast:
+                    return False
+                valid = False
+
+            if simple:
+                # Only the properties keyword applies to single properties,
+                # so the rest need not be visited one by one
+                if properties:
+                    for prop, prop_value in value.items():
+                        prop_constraint = properties.get(prop)
+                        if prop_constraint is None:
+                            continue
+
+                        context.push_path(prop)
+                        try:
+                            if not prop_constraint.validate(prop_value, context):
+                                valid = False
+                        finally:
+                            context.pop_path()
+
+                        if not valid and context.fail_fast:
+                            return False
+
+                if not check_additional:
+                    return valid
+
+                # Properties not validated by any schema, in object order
+                unmatched = value.keys() - defined
+                if unmatched:
+                    unmatched = [prop for prop in value if prop in unmatched]
+            else:
+                # Properties not validated by any schema
+                unmatched = []
+
+                for prop, prop_value in value.items():
+                    context.push_path(prop)
+                    try:
+                        if property_names is not None and not property_names.validate(prop, context):
                             valid = False
-        
-        # Check additional properties - do this last after all other validations
-        for prop in value:
-            if prop not in validated_props:
-                # Also check if the property is defined in a parent schema
+
+                        prop_constraint = properties.get(prop)
+                        matched = prop_constraint is not None
+                        if matched and not prop_constraint.validate(prop_value, context):
+                            valid = False
+
+                        for matcher, pattern_constraint in matchers:
+                            if matcher is match_any or matcher(prop):
+                                matched = True
+                                if not pattern_constraint.validate(prop_value, context):
+                                    valid = False
+                    finally:
+                        context.pop_path()
+
+                    if not valid and context.fail_fast:
+                        return False
+
+                    if not matched and check_additional:
+                        unmatched.append(prop)
+
+            # Check additional properties - do this last after all other validations
+            for prop in unmatched:
+                # Also skip properties defined in a parent schema
                 if prop in context.parent_properties:
-                    # This property is defined in a parent schema, so it's valid
                     continue
-                    
-                if self.additional_properties is False:
+
+                if additional_properties is False:
                     context.add_error(
                         ErrorCode.ADDITIONAL_PROPERTY_NOT_ALLOWED,
-                        f"Additional property '{prop}' not allowed",
+                        lambda prop=prop: f"Additional property '{prop}' not allowed",
                         value=value[prop],
-                        constraint=self
+                        constraint=constraint,
+                        property_name=prop
                     )
                     valid = False
-                elif isinstance(self.additional_properties, Constraint):
-                    with context.with_path(prop):
-                        if not self.additional_properties.validate(value[prop], context):
+                else:
+                    context.push_path(prop)
+                    try:
+                        if not additional_properties.validate(value[prop], context):
                             valid = False
-        
-        return valid
+                    finally:
+                        context.pop_path()
+
+                if not valid and context.fail_fast:
+                    return False
+
+            return valid
+
+        return check_properties
+    
+    def with_overrides(self, **overrides: Any) -> "ObjectConstraint":
+        """
+        Create a constraint with the keywords of this one, except for some.
+
+        The keyword collections are shared with this constraint, not copied.
+
+        Args:
+            **overrides: Arguments of the constructor to use instead of the
+                keywords of this constraint
+
+        Returns:
+            New object constraint
+        """
+        settings = {
+            "properties": self.properties,
+            "required": self.required,
+            "additional_properties": self.additional_properties,
+            "pattern_properties": self.pattern_properties,
+            "property_names": self.property_names,
+            "min_properties": self.min_properties,
+            "max_properties": self.max_properties,
+            "dependencies": self.dependencies
+        }
+        settings.update(overrides)
+        return type(self)(**settings)
     
     def __str__(self) -> str:
         """String representation of the constraint."""
@@ -194,7 +385,7 @@ class ObjectConstraint(TypeConstraint):
         if self.properties:
             parts.append(f"properties={list(self.properties.keys())}")
         if self.required:
-            parts.append(f"required={self.required}")
+            parts.append(f"required={list(self.required)}")
         if self.additional_properties is not True:
             ap_str = str(self.additional_properties) if isinstance(self.additional_properties, Constraint) else str(self.additional_properties)
             parts.append(f"additional_properties={ap_str}")
@@ -207,7 +398,7 @@ class ObjectConstraint(TypeConstraint):
         if self.max_properties is not None:
             parts.append(f"max_properties={self.max_properties}")
         if self.dependencies:
-            parts.append(f"dependencies={self.dependencies}")
+            parts.append(f"dependencies={dict(self.dependencies)}")
         
         return f"ObjectConstraint({', '.join(parts)})"
     
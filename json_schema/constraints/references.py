@@ -7,7 +7,7 @@ from typing import Any, Optional, Callable, Dict, Set
 from .base import Constraint, ValidationContext, TypeConstraint
 from .objects import ObjectConstraint
 from ..api import ErrorCode
-from ..utils import JsonPointer
+from ..utils import SchemaPropertyIndex
 
 
 class ReferenceConstraint(Constraint):
@@ -15,18 +15,32 @@ class ReferenceConstraint(Constraint):
     Constraint that references another schema.
     """
     
-    def __init__(self, reference: str, resolver: Optional[Callable[[str], Constraint]] = None):
+    def __init__(self, reference: str, resolver: Optional[Callable[[str], Constraint]] = None,
+                 property_index: Optional[SchemaPropertyIndex] = None):
         """
         Initialize a new reference constraint.
         
         Args:
             reference: JSON Pointer reference
             resolver: Optional resolver function to resolve the reference
+            property_index: Optional property index of the root schema,
+                shared with the other references compiled from it
         """
         self.reference = reference
         self.resolver = resolver
         self.resolved_constraint: Optional[Constraint] = None
         self.extracted_properties: Set[str] = set()
+
+        # Whether extracted_properties has been looked up, as it may be empty
+        self._properties_extracted = False
+
+        # Replaced by an index of the validated root schema if it is not the
+        # one this index was built for
+        self._property_index = property_index
+
+        # Copy of the resolved object constraint that allows additional
+        # properties, built on first use by the root additionalProperties case
+        self._open_object_constraint: Optional[ObjectConstraint] = None
         
     def _extract_properties_from_schema(self, root_schema: Dict[str, Any], ref_path: str) -> Set[str]:
         """
@@ -42,36 +56,10 @@ class ReferenceConstraint(Constraint):
         Returns:
             Set of property names defined in the referenced schema
         """
-        try:
-            # Resolve the reference
-            ref_schema = JsonPointer.resolve(root_schema, ref_path)
-            if not isinstance(ref_schema, dict):
-                return set()
-                
-            properties = set()
-            
-            # Extract properties from the main schema
-            if 'properties' in ref_schema and isinstance(ref_schema['properties'], dict):
-                properties.update(ref_schema['properties'].keys())
-                
-            # Extract properties from logical combinations
-            for op in ['allOf', 'anyOf', 'oneOf']:
-                if op in ref_schema and isinstance(ref_schema[op], list):
-                    for branch in ref_schema[op]:
-                        if isinstance(branch, dict) and 'properties' in branch:
-                            properties.update(branch['properties'].keys())
-                            
-                            # Also handle nested logical operators (new)
-                            for nested_op in ['allOf', 'anyOf', 'oneOf']:
-                                if nested_op in branch and isinstance(branch[nested_op], list):
-                                    for nested_branch in branch[nested_op]:
-                                        if isinstance(nested_branch, dict) and 'properties' in nested_branch:
-                                            properties.update(nested_branch['properties'].keys())
-                            
-            return properties
-        except Exception:
-            # If anything goes wrong, return an empty set
-            return set()
+        index = self._property_index
+        if index is None or index.root_schema is not root_schema:
+            index = self._property_index = SchemaPropertyIndex(root_schema)
+        return set(index.get(ref_path))
     
     def validate(self, value: Any, context: ValidationContext) -> bool:
         """
@@ -92,7 +80,7 @@ class ReferenceConstraint(Constraint):
             if self.resolver is None:
                 context.add_error(
                     ErrorCode.REFERENCE_RESOLUTION_FAILED,
-                    f"No resolver provided for reference '{self.reference}'",
+                    lambda: f"No resolver provided for reference '{self.reference}'",
                     value=value,
                     constraint=self
                 )
@@ -103,16 +91,17 @@ class ReferenceConstraint(Constraint):
             except Exception as e:
                 context.add_error(
                     ErrorCode.REFERENCE_RESOLUTION_FAILED,
-                    f"Failed to resolve reference '{self.reference}': {str(e)}",
+                    lambda e=e: f"Failed to resolve reference '{self.reference}': {str(e)}",
                     value=value,
                     constraint=self
                 )
                 return False
         
         # Extract properties from the referenced schema if not done already
-        if not self.extracted_properties and context.root_schema and self.reference.startswith('#/'):
+        if not self._properties_extracted and context.root_schema and self.reference.startswith('#/'):
             ref_path = self.reference[1:]  # Remove the leading #
             self.extracted_properties = self._extract_properties_from_schema(context.root_schema, ref_path)
+            self._properties_extracted = True
             
             # Add these properties to parent_properties for use during validation
             if self.extracted_properties:
@@ -129,82 +118,81 @@ class ReferenceConstraint(Constraint):
             # For this special pattern, completely bypass the additionalProperties validation
             # Instead, validate each property individually against the referenced schema
             valid = True
+            prop_constraint = self._open_object_constraint
+            if prop_constraint is None and isinstance(self.resolved_constraint, ObjectConstraint):
+                # Create a modified constraint that allows all properties,
+                # shared by every property of every validated object
+                prop_constraint = self._open_object_constraint = self.resolved_constraint.with_overrides(
+                    additional_properties=True  # Allow additional properties for this validation
+                )
+
             for prop_name, prop_value in value.items():
                 with context.with_path(prop_name):
-                    # Create a copy of the resolved constraint specifically for this property
-                    if isinstance(self.resolved_constraint, ObjectConstraint):
-                        # Create a modified constraint that allows all properties
-                        prop_constraint = ObjectConstraint(
-                            properties=self.resolved_constraint.properties.copy(),
-                            required=self.resolved_constraint.required.copy() if self.resolved_constraint.required else [],
-                            additional_properties=True,  # Allow additional properties for this validation
-                            pattern_properties=self.resolved_constraint.pattern_properties.copy() if self.resolved_constraint.pattern_properties else {},
-                            property_names=self.resolved_constraint.property_names,
-                            min_properties=self.resolved_constraint.min_properties,
-                            max_properties=self.resolved_constraint.max_properties,
-                            dependencies=self.resolved_constraint.dependencies.copy() if self.resolved_constraint.dependencies else {}
-                        )
-                        
-                        # Create validation context
-                        sub_context = ValidationContext(verbose=context.verbose)
-                        sub_context.path_parts = context.path_parts.copy()
-                        sub_context.schema_path_parts = context.schema_path_parts.copy()
-                        sub_context.root_schema = context.root_schema
-                        
-                        # Validate with modified constraint
-                        if not prop_constraint.validate(prop_value, sub_context):
-                            valid = False
-                            # Copy non-additionalProperties errors
-                            for error in sub_context.errors:
-                                if error.code != ErrorCode.ADDITIONAL_PROPERTY_NOT_ALLOWED:
-                                    context.add_error(error.code, error.message, error.value, error.constraint)
-                    else:
-                        # Use standard validation
-                        sub_context = ValidationContext(verbose=context.verbose)
-                        if not self.resolved_constraint.validate(prop_value, sub_context):
-                            valid = False
-                            for error in sub_context.errors:
-                                context.add_error(error.code, error.message, error.value, error.constraint)
+                    # Get a validation context, reusing a released one if possible
+                    sub_context = ValidationContext.acquire(verbose=context.verbose, fail_fast=context.fail_fast)
+                    try:
+                        if prop_constraint is not None:
+                            sub_context.path_parts = context.path_parts.copy()
+                            sub_context.schema_path_parts = context.schema_path_parts.copy()
+                            sub_context.root_schema = context.root_schema
+                            
+                            # Validate with modified constraint
+                            if not prop_constraint.validate(prop_value, sub_context):
+                                valid = False
+                                # Copy non-additionalProperties errors
+                                for error in sub_context.errors:
+                                    if error.code != ErrorCode.ADDITIONAL_PROPERTY_NOT_ALLOWED:
+                                        context.add_error(error.code, error.message, error.value, error.constraint, error.property_name)
+                        else:
+                            # Use standard validation
+                            if not self.resolved_constraint.validate(prop_value, sub_context):
+                                valid = False
+                                for error in sub_context.errors:
+                                    context.add_error(error.code, error.message, error.value, error.constraint, error.property_name)
+                    finally:
+                        sub_context.release()
             
             return valid
         
         # Standard validation against the resolved constraint
         with context.with_schema_path(f"$ref:{self.reference}"):
-            # Create a sub-context with parent properties included
-            sub_context = ValidationContext(verbose=context.verbose)
-            sub_context.path_parts = context.path_parts.copy()
-            sub_context.schema_path_parts = context.schema_path_parts.copy()
-            sub_context.root_schema = context.root_schema
-            sub_context.parent_properties = context.parent_properties.copy()
-            sub_context.add_parent_properties(self.extracted_properties)
-            
-            # Propagate type hints
-            for hint_path, type_hint in context.type_hints.items():
-                sub_context.add_type_hint(hint_path, type_hint)
-            
-            # Validate using the sub-context
-            if hasattr(self.resolved_constraint, "validation_order") and getattr(self.resolved_constraint, "validation_order"):
-                # Use validation order if available
-                result = True
-                for sub_constraint in self.resolved_constraint.validation_order:
-                    if not sub_constraint.validate(value, sub_context):
-                        result = False
-                        break
-            else:
-                # Standard validation
-                result = self.resolved_constraint.validate(value, sub_context)
+            # Validate in place and take the errors back out for filtering
+            result, sub_errors = context.validate_isolated(self._validate_resolved, value)
 
             # Copy errors to the main context, filtering out additionalProperty errors for known properties
-            for error in sub_context.errors:
+            for error in sub_errors:
                 if error.code == ErrorCode.ADDITIONAL_PROPERTY_NOT_ALLOWED:
-                    import re
-                    match = re.search(r"'([^']+)'", error.message)
-                    if match and (match.group(1) in self.extracted_properties or 
-                                match.group(1) in context.parent_properties):
+                    if (error.property_name in self.extracted_properties or
+                            error.property_name in context.parent_properties):
                         continue
-                context.add_error(error.code, error.message, error.value, error.constraint)
+                context.add_error(error.code, error.message, error.value, error.constraint, error.property_name)
             
             return result
+
+    def _validate_resolved(self, value: Any, context: ValidationContext) -> bool:
+        """
+        Validate a value against the resolved constraint.
+
+        Args:
+            value: Value to validate
+            context: Validation context, isolated from the caller's
+
+        Returns:
+            True if validation succeeds, False otherwise
+        """
+        # Properties of the referenced schema count as parent properties
+        context.add_parent_properties(self.extracted_properties)
+
+        validation_order = self.resolved_constraint.validation_order
+        if validation_order is not None:
+            # Use validation order if available
+            for sub_constraint in validation_order:
+                if not sub_constraint.validate(value, context):
+                    return False
+            return True
+
+        # Standard validation
+        return self.resolved_constraint.validate(value, context)
     
     def __str__(self) -> str:
         """String representation of the constraint."""
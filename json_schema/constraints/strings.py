@@ -3,9 +3,11 @@ String constraint implementation.
 """
 
 import re
-from typing import Any, Optional, Pattern
+import sys
+from typing import Any, List, Optional
 
-from .base import TypeConstraint, ValidationContext
+from ._patterns import Matcher, compile_matcher, match_any
+from .base import Predicate, TypeConstraint, ValidationContext
 from ..api import ErrorCode
 
 
@@ -29,15 +31,22 @@ class StringConstraint(TypeConstraint):
         self.min_length = min_length
         self.max_length = max_length
         self.pattern = pattern
-        self._compiled_pattern: Optional[Pattern] = None
+        self._pattern_matcher: Optional[Matcher] = None
+
+        # Length range accepted, so that one comparison covers both bounds
+        self._length_range = (
+            min_length if min_length is not None else 0,
+            max_length if max_length is not None else sys.maxsize)
         
         # Compile the pattern if provided
         if pattern:
             try:
-                self._compiled_pattern = re.compile(pattern)
+                self._pattern_matcher = compile_matcher(pattern)
             except re.error:
                 # We'll handle this during validation
                 pass
+
+        super().__init__()
     
     @property
     def json_type(self) -> str:
@@ -56,44 +65,50 @@ class StringConstraint(TypeConstraint):
         """
         valid = True
         
-        # Check min_length
-        if self.min_length is not None and len(value) < self.min_length:
-            context.add_error(
-                ErrorCode.STRING_TOO_SHORT,
-                f"String length is {len(value)}, but minimum is {self.min_length}",
-                value=value,
-                constraint=self
-            )
-            valid = False
-            
-        # Check max_length
-        if self.max_length is not None and len(value) > self.max_length:
-            context.add_error(
-                ErrorCode.STRING_TOO_LONG,
-                f"String length is {len(value)}, but maximum is {self.max_length}",
-                value=value,
-                constraint=self
-            )
-            valid = False
+        # Check min_length and max_length, which rarely fail
+        length = len(value)
+        min_length, max_length = self._length_range
+        if not min_length <= length <= max_length:
+            if length < min_length:
+                context.add_error(
+                    ErrorCode.STRING_TOO_SHORT,
+                    lambda: f"String length is {length}, but minimum is {self.min_length}",
+                    value=value,
+                    constraint=self
+                )
+                if context.fail_fast:
+                    return False
+                valid = False
+                
+            if length > max_length:
+                context.add_error(
+                    ErrorCode.STRING_TOO_LONG,
+                    lambda: f"String length is {length}, but maximum is {self.max_length}",
+                    value=value,
+                    constraint=self
+                )
+                if context.fail_fast:
+                    return False
+                valid = False
             
         # Check pattern
         if self.pattern is not None:
-            if self._compiled_pattern is None:
+            if self._pattern_matcher is None:
                 try:
-                    self._compiled_pattern = re.compile(self.pattern)
+                    self._pattern_matcher = compile_matcher(self.pattern)
                 except re.error as e:
                     context.add_error(
                         ErrorCode.SCHEMA_INVALID,
-                        f"Invalid regex pattern: {str(e)}",
+                        lambda e=e: f"Invalid regex pattern: {str(e)}",
                         value=value,
                         constraint=self
                     )
                     return False
                     
-            if not self._compiled_pattern.search(value):
+            if not self._pattern_matcher(value):
                 context.add_error(
                     ErrorCode.PATTERN_MISMATCH,
-                    f"String '{value}' does not match pattern '{self.pattern}'",
+                    lambda: f"String '{value}' does not match pattern '{self.pattern}'",
                     value=value,
                     constraint=self
                 )
@@ -101,6 +116,33 @@ class StringConstraint(TypeConstraint):
                 
         return valid
     
+    def _compile_type_specific(self) -> Optional[List[Predicate]]:
+        """
+        Compile the string-specific checks into predicates.
+
+        Returns:
+            List of predicates, or None if the pattern is not a valid regex
+        """
+        checks = []
+
+        min_length = self.min_length
+        if min_length is not None:
+            checks.append(lambda value: len(value) >= min_length)
+
+        max_length = self.max_length
+        if max_length is not None:
+            checks.append(lambda value: len(value) <= max_length)
+
+        if self.pattern is not None:
+            matcher = self._pattern_matcher
+            if matcher is None:
+                # Leave reporting the invalid pattern to validate()
+                return None
+            if matcher is not match_any:
+                checks.append(matcher)
+
+        return checks
+    
     def __str__(self) -> str:
         """String representation of the constraint."""
         parts = []
@@ -2,12 +2,25 @@
 Type constraint implementation.
 """
 
-from typing import Any, List, Union
+from typing import Any, FrozenSet, List, Optional, Union
 
-from .base import Constraint, ValidationContext
+from .base import Constraint, Predicate, ValidationContext
 from ..api import ErrorCode
 from ..utils import TypeUtils
 
+# JSON types that TypeUtils.get_json_type reports for JSON values
+_JSON_TYPES = ("null", "boolean", "integer", "number", "string", "array", "object")
+
+# Python type of a single accepted JSON type that one isinstance call checks
+# exactly; integers need bool excluded, so they go through the type mask
+_ISINSTANCE_TYPES = {
+    "null": type(None),
+    "boolean": bool,
+    "string": str,
+    "array": list,
+    "object": dict,
+}
+
 
 class TypeConstraintImpl(Constraint):
     """
@@ -26,6 +39,17 @@ class TypeConstraintImpl(Constraint):
         
         # Get all effective types considering the type hierarchy
         self.effective_types = TypeUtils.get_effective_types(self.specified_types)
+
+        # Types reported by TypeUtils.get_json_type that are accepted, with
+        # the type hierarchy and its compatibility fallback resolved once
+        self._accepted_types = frozenset(
+            json_type for json_type in _JSON_TYPES + ("unknown",) if self._accepts(json_type))
+
+        # Type error messages only differ in the actual type
+        self._error_prefix = f"Expected {', '.join(sorted(self.specified_types))}, got "
+
+        # Type check specialized to the accepted types
+        self._check = self._compile_check()
     
     def validate(self, value: Any, context: ValidationContext) -> bool:
         """
@@ -38,29 +62,80 @@ class TypeConstraintImpl(Constraint):
         Returns:
             True if validation succeeds, False otherwise
         """
-        # Get the actual JSON type of the value
-        actual_type = TypeUtils.get_json_type(value)
-        
-        # Check if the actual type is among the effective types
-        if actual_type in self.effective_types:
-            return True
-        
-        # Type doesn't match - check if it's compatible in the reverse direction
-        # (e.g., if the value is an integer but we're looking for a number)
-        compatible_types = TypeUtils.get_compatible_types(actual_type)
-        if any(t in self.specified_types for t in compatible_types):
+        if self._check(value):
             return True
         
         # Type doesn't match
-        types_list = sorted(self.specified_types)  # Sort for consistent error messages
         context.add_error(
             ErrorCode.TYPE_ERROR,
-            f"Expected {', '.join(types_list)}, got {actual_type}",
+            self._error_prefix + TypeUtils.get_json_type(value),
             value=value,
             constraint=self
         )
         return False
     
+    def _compile_check(self) -> Predicate:
+        """
+        Build a check for the accepted types.
+
+        A single type is checked with one isinstance call. Anything else is
+        checked by and-ing the value's type bit with the mask of accepted
+        types, which costs the same however many types are accepted.
+
+        Returns:
+            Predicate that is true if the value's type is accepted
+        """
+        accepted_types = self._accepted_types
+        if len(accepted_types) == 1:
+            (json_type,) = accepted_types
+            python_type = _ISINSTANCE_TYPES.get(json_type)
+            if python_type is not None:
+                return lambda value: isinstance(value, python_type)
+
+        mask = TypeUtils.get_types_mask(accepted_types)
+        class_bit = TypeUtils.CLASS_TYPE_BITS.get
+        json_type_bit = TypeUtils.get_json_type_bit
+        # Builtin types are looked up directly, subclasses go the long way
+        return lambda value: (class_bit(type(value)) or json_type_bit(value)) & mask != 0
+
+    def _accepts(self, json_type: str) -> bool:
+        """
+        Check whether values of a JSON type are accepted.
+
+        Args:
+            json_type: JSON type name
+
+        Returns:
+            True if the type is among the effective types or compatible
+            with one of the specified types
+        """
+        # Check if the type is among the effective types
+        if json_type in self.effective_types:
+            return True
+        
+        # Type doesn't match - check if it's compatible in the reverse direction
+        # (e.g., if the value is an integer but we're looking for a number)
+        compatible_types = TypeUtils.get_compatible_types(json_type)
+        return any(t in self.specified_types for t in compatible_types)
+
+    def accepted_json_types(self) -> Optional[FrozenSet[str]]:
+        """
+        Get the JSON types of the values this constraint can accept.
+
+        Returns:
+            Set of JSON type names
+        """
+        return self._accepted_types.difference(("unknown",))
+
+    def compile_predicate(self) -> Optional[Predicate]:
+        """
+        Compile this constraint into a verdict-only predicate.
+
+        Returns:
+            Predicate checking the value's type
+        """
+        return self._check
+    
     def __str__(self) -> str:
         """String representation of the constraint."""
         types_list = sorted(self.specified_types)  # Sort for consistent string representation
@@ -5,33 +5,91 @@ This module provides classes for modeling the dependency relationships
 between constraints and determining their proper validation order.
 """
 
-from typing import Dict, List, Set, Any, Optional, TypeVar, Generic
+import heapq
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Tuple, TypeVar, Generic
 
 from .constraints import Constraint, ValidationContext
 
 # Type variable for the node class
 T = TypeVar('T')
 
+# Slot of each JSON Schema type in ConstraintDependencyGraph.type_nodes
+_TYPE_INDEX = {
+    "null": 0,
+    "boolean": 1,
+    "integer": 2,
+    "number": 3,
+    "string": 4,
+    "array": 5,
+    "object": 6,
+}
+
+
+class CycleError(Exception):
+    """
+    Raised when a dependency graph cannot be sorted because of a cycle.
+
+    Attributes:
+        remaining: Keys of the nodes on or behind a cycle, in the order
+            they were added
+        partial_order: Items of the other nodes, in dependency order
+    """
+
+    def __init__(self, remaining: List[str], partial_order: List[Any]):
+        """
+        Initialize a new cycle error.
+
+        Args:
+            remaining: Keys of the nodes that could not be sorted
+            partial_order: Items that were sorted
+        """
+        super().__init__(f"Cyclic dependencies between {', '.join(remaining)}")
+        self.remaining = remaining
+        self.partial_order = partial_order
+
 
 class DependencyNode(Generic[T]):
     """
     A node in a dependency graph.
 
-    Each node contains an item and its dependencies.
+    Nodes are views of the graph's per-node lists, identified by the
+    node's index in them.
     """
 
-    def __init__(self, item: T, key: str):
+    __slots__ = ("graph", "index")
+
+    def __init__(self, graph: "DependencyGraph[T]", index: int):
         """
         Initialize a new dependency node.
 
         Args:
-            item: The item this node contains
-            key: A unique identifier for this node
+            graph: Graph the node belongs to
+            index: Index of the node in the graph
         """
-        self.item = item
-        self.key = key
-        self.dependencies: Set[DependencyNode[T]] = set()
-        self.dependents: Set[DependencyNode[T]] = set()
+        self.graph = graph
+        self.index = index
+
+    @property
+    def item(self) -> T:
+        """The item this node contains."""
+        return self.graph.items[self.index]
+
+    @property
+    def key(self) -> str:
+        """The unique identifier of this node."""
+        return self.graph.keys[self.index]
+
+    @property
+    def dependencies(self) -> List["DependencyNode[T]"]:
+        """Nodes this node depends on."""
+        graph = self.graph
+        return [DependencyNode(graph, i) for i in graph.dependencies[self.index]]
+
+    @property
+    def dependents(self) -> List["DependencyNode[T]"]:
+        """Nodes that depend on this node."""
+        graph = self.graph
+        return [DependencyNode(graph, i) for i in graph.dependents[self.index]]
 
     def add_dependency(self, node: 'DependencyNode[T]') -> None:
         """
@@ -40,9 +98,7 @@ class DependencyNode(Generic[T]):
         Args:
             node: Node this node depends on
         """
-        if node not in self.dependencies:
-            self.dependencies.add(node)
-            node.dependents.add(self)
+        self.graph.link(self.index, node.index)
 
     def remove_dependency(self, node: 'DependencyNode[T]') -> None:
         """
@@ -51,13 +107,18 @@ class DependencyNode(Generic[T]):
         Args:
             node: Node to remove as a dependency
         """
-        if node in self.dependencies:
-            self.dependencies.remove(node)
-            node.dependents.remove(self)
+        self.graph.unlink(self.index, node.index)
+
+    def __eq__(self, other: Any) -> bool:
+        return (isinstance(other, DependencyNode)
+                and other.graph is self.graph and other.index == self.index)
+
+    def __hash__(self) -> int:
+        return hash((id(self.graph), self.index))
 
     def __repr__(self) -> str:
         """Detailed representation of the node."""
-        return f"DependencyNode(key={self.key}, item={self.item}, dependencies={len(self.dependencies)})"
+        return f"DependencyNode(key={self.key}, item={self.item}, dependencies={len(self.graph.dependencies[self.index])})"
 
 
 class DependencyGraph(Generic[T]):
@@ -66,11 +127,38 @@ class DependencyGraph(Generic[T]):
 
     This graph can be used to determine the order in which items should
     be processed based on their dependencies.
+
+    Nodes are numbered in the order they are added, and each attribute of
+    a node is kept at its number in a list of that attribute, so edges are
+    ordered collections of node numbers.
     """
 
+    __slots__ = ("items", "keys", "dependencies", "dependents", "key_to_index", "edge_count",
+                 "backward_edge_count")
+
     def __init__(self):
         """Initialize a new dependency graph."""
-        self.nodes: Dict[str, DependencyNode[T]] = {}
+        self.items: List[T] = []
+        self.keys: List[str] = []
+
+        # Indices of the nodes each node depends on, and of its dependents;
+        # dicts keep edges in insertion order with constant-time membership
+        self.dependencies: List[Dict[int, None]] = []
+        self.dependents: List[Dict[int, None]] = []
+
+        # Node key -> node index
+        self.key_to_index: Dict[str, int] = {}
+
+        # Number of dependencies between nodes, and of those on a node added
+        # no earlier than its dependent; without the latter, the nodes are
+        # already in topological order
+        self.edge_count = 0
+        self.backward_edge_count = 0
+
+    @property
+    def nodes(self) -> Dict[str, DependencyNode[T]]:
+        """Nodes of the graph by key, in the order they were added."""
+        return {key: DependencyNode(self, i) for key, i in self.key_to_index.items()}
 
     def add_node(self, item: T, key: str) -> DependencyNode[T]:
         """
@@ -83,12 +171,14 @@ class DependencyGraph(Generic[T]):
         Returns:
             The created node
         """
-        if key in self.nodes:
-            return self.nodes[key]
-
-        node = DependencyNode(item, key)
-        self.nodes[key] = node
-        return node
+        index = self.key_to_index.get(key)
+        if index is None:
+            index = self.key_to_index[key] = len(self.items)
+            self.items.append(item)
+            self.keys.append(key)
+            self.dependencies.append({})
+            self.dependents.append({})
+        return DependencyNode(self, index)
 
     def add_dependency(self, dependent_key: str, dependency_key: str) -> None:
         """
@@ -98,53 +188,123 @@ class DependencyGraph(Generic[T]):
             dependent_key: Key of the dependent node
             dependency_key: Key of the dependency node
         """
-        if dependent_key not in self.nodes or dependency_key not in self.nodes:
+        dependent = self.key_to_index.get(dependent_key)
+        dependency = self.key_to_index.get(dependency_key)
+        if dependent is None or dependency is None:
+            return
+
+        self.link(dependent, dependency)
+
+    def link(self, dependent: int, dependency: int) -> None:
+        """
+        Make a node depend on another.
+
+        Args:
+            dependent: Index of the dependent node
+            dependency: Index of the dependency node
+        """
+        dependencies = self.dependencies[dependent]
+        if dependency not in dependencies:
+            dependencies[dependency] = None
+            self.dependents[dependency][dependent] = None
+            self.edge_count += 1
+            if dependency >= dependent:
+                self.backward_edge_count += 1
+
+    def link_many(self, dependent: int, dependencies: Iterable[int]) -> None:
+        """
+        Make a node depend on several others.
+
+        Args:
+            dependent: Index of the dependent node
+            dependencies: Indices of the dependency nodes
+        """
+        existing = self.dependencies[dependent]
+        added = [dependency for dependency in dict.fromkeys(dependencies) if dependency not in existing]
+        if not added:
             return
 
-        dependent = self.nodes[dependent_key]
-        dependency = self.nodes[dependency_key]
-        dependent.add_dependency(dependency)
+        existing.update(dict.fromkeys(added))
+        self.edge_count += len(added)
+
+        dependents = self.dependents
+        for dependency in added:
+            dependents[dependency][dependent] = None
+            if dependency >= dependent:
+                self.backward_edge_count += 1
+
+    def unlink(self, dependent: int, dependency: int) -> None:
+        """
+        Remove the dependency of a node on another.
+
+        Args:
+            dependent: Index of the dependent node
+            dependency: Index of the dependency node
+        """
+        dependencies = self.dependencies[dependent]
+        if dependency in dependencies:
+            del dependencies[dependency]
+            del self.dependents[dependency][dependent]
+            self.edge_count -= 1
+            if dependency >= dependent:
+                self.backward_edge_count -= 1
 
     def topological_sort(self) -> List[T]:
         """
         Sort the items in topological order.
 
+        Uses Kahn's algorithm, so deep dependency chains need no recursion.
+        Of the items whose dependencies are all sorted, the one added first
+        comes first. When every item was added after its dependencies, as
+        when type constraints come before the keywords depending on them,
+        that is the insertion order, which is returned without sorting.
+
         Returns:
             List of items in dependency order
-        """
-        result: List[T] = []
-        visited: Set[str] = set()
-        temp_visited: Set[str] = set()
 
-        def visit(node: DependencyNode[T]) -> None:
-            """
-            Visit a node and its dependencies recursively.
+        Raises:
+            CycleError: If some items depend on each other
+        """
+        items = self.items
+        if not self.backward_edge_count:
+            # Already sorted, as in most schemas
+            return list(items)
 
-            Args:
-                node: Node to visit
-            """
-            if node.key in visited:
-                return
-            if node.key in temp_visited:
-                # Cyclic dependency detected
-                return
+        dependents = self.dependents
 
-            temp_visited.add(node.key)
+        # Number of unsorted dependencies of each node; node indices are
+        # the order in which nodes were added
+        in_degree = [len(dependencies) for dependencies in self.dependencies]
+        ready = [i for i, degree in enumerate(in_degree) if degree == 0]
 
-            # Visit dependencies first
-            for dependency in node.dependencies:
-                visit(dependency)
+        result: List[T] = []
+        while ready:
+            index = heapq.heappop(ready)
+            result.append(items[index])
+            for dependent in dependents[index]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    heapq.heappush(ready, dependent)
+
+        if len(result) < len(items):
+            # Cyclic dependencies detected
+            raise CycleError(
+                [key for key, degree in zip(self.keys, in_degree) if degree > 0], result)
 
-            temp_visited.remove(node.key)
-            visited.add(node.key)
-            result.append(node.item)
+        return result
 
-        # Visit all nodes
-        for node in self.nodes.values():
-            if node.key not in visited:
-                visit(node)
+    def try_topological_sort(self) -> Optional[List[T]]:
+        """
+        Sort the items in topological order, if they have no cycle.
 
-        return result
+        Returns:
+            List of items in dependency order, or None if some items
+            depend on each other
+        """
+        try:
+            return self.topological_sort()
+        except CycleError:
+            return None
 
 
 class ConstraintDependencyGraph:
@@ -153,25 +313,59 @@ class ConstraintDependencyGraph:
 
     This graph automatically determines dependencies between constraints
     based on their types and relationships.
+
+    Constraints and dependencies are recorded as they are added, and the
+    underlying DependencyGraph is only built once the graph is accessed,
+    so schemas that are compiled but never ordered do not pay for it.
     """
 
+    __slots__ = ("_graph", "_pending", "type_nodes", "_order_cache", "_reverse_order_cache")
+
     def __init__(self):
         """Initialize a new constraint dependency graph."""
-        self.graph = DependencyGraph[Constraint]()
-        self.type_nodes: Dict[str, DependencyNode[Constraint]] = {}
+        self._graph = DependencyGraph[Constraint]()
+
+        # Additions not applied to the graph yet, as (method, arguments)
+        self._pending: List[Tuple[Callable[..., None], Tuple[Any, ...]]] = []
+
+        # Index of the node of the latest type constraint of each type,
+        # in the slots of _TYPE_INDEX; filled in as the graph is built
+        self.type_nodes: List[Optional[int]] = [None] * len(_TYPE_INDEX)
+
+        # Validation order, sorted on first request until the graph changes
+        self._order_cache: Optional[Tuple[Constraint, ...]] = None
+        self._reverse_order_cache: Optional[Tuple[Constraint, ...]] = None
+
+    @property
+    def graph(self) -> DependencyGraph[Constraint]:
+        """The dependency graph, with every pending addition applied."""
+        pending = self._pending
+        if pending:
+            self._pending = []
+            for apply, args in pending:
+                apply(*args)
+        return self._graph
+
+    def _defer(self, apply: Callable[..., None], *args: Any) -> None:
+        """
+        Record an addition to apply when the graph is built.
+
+        Args:
+            apply: Method applying the addition
+            *args: Arguments of the method
+        """
+        self._pending.append((apply, args))
+        self._order_cache = self._reverse_order_cache = None
 
-    def add_constraint(self, constraint: Constraint, path: str) -> DependencyNode[Constraint]:
+    def add_constraint(self, constraint: Constraint, path: str) -> None:
         """
         Add a constraint to the graph.
 
         Args:
             constraint: Constraint to add
             path: JSON path to the constraint
-
-        Returns:
-            The node for the added constraint
         """
-        return self.graph.add_node(constraint, path)
+        self._defer(self._graph.add_node, constraint, path)
 
     def add_type_constraint(self, constraint: Constraint, path: str, json_type: str) -> None:
         """
@@ -182,8 +376,14 @@ class ConstraintDependencyGraph:
             path: JSON path to the constraint
             json_type: JSON Schema type
         """
-        node = self.add_constraint(constraint, path)
-        self.type_nodes[json_type] = node
+        self._defer(self._add_type_constraint, constraint, path, json_type)
+
+    def _add_type_constraint(self, constraint: Constraint, path: str, json_type: str) -> None:
+        node = self._graph.add_node(constraint, path)
+        type_index = _TYPE_INDEX.get(json_type)
+        if type_index is not None:
+            # Constraints can only depend on known types
+            self.type_nodes[type_index] = node.index
 
     def add_constraint_with_dependencies(self, constraint: Constraint, path: str,
                                          depends_on_types: Optional[List[str]] = None) -> None:
@@ -195,12 +395,19 @@ class ConstraintDependencyGraph:
             path: JSON path to the constraint
             depends_on_types: List of JSON Schema types this constraint depends on
         """
-        node = self.add_constraint(constraint, path)
+        self._defer(self._add_constraint_with_dependencies, constraint, path,
+                    list(depends_on_types) if depends_on_types else None)
+
+    def _add_constraint_with_dependencies(self, constraint: Constraint, path: str,
+                                          depends_on_types: Optional[List[str]]) -> None:
+        node = self._graph.add_node(constraint, path)
 
         if depends_on_types:
-            for type_name in depends_on_types:
-                if type_name in self.type_nodes:
-                    node.add_dependency(self.type_nodes[type_name])
+            type_nodes = self.type_nodes
+            type_indices = [_TYPE_INDEX.get(type_name) for type_name in depends_on_types]
+            self._graph.link_many(node.index, [
+                type_nodes[type_index] for type_index in type_indices
+                if type_index is not None and type_nodes[type_index] is not None])
 
     def add_dependency(self, dependent_path: str, dependency_path: str) -> None:
         """
@@ -210,13 +417,98 @@ class ConstraintDependencyGraph:
             dependent_path: Path of the dependent constraint
             dependency_path: Path of the dependency constraint
         """
-        self.graph.add_dependency(dependent_path, dependency_path)
+        self._defer(self._graph.add_dependency, dependent_path, dependency_path)
+
+    def add_dependencies(self, dependent_path: str, dependency_paths: Iterable[str]) -> None:
+        """
+        Add dependencies of a constraint on several others.
+
+        Duplicate edges are dropped in one dict update rather than checked
+        one by one.
+
+        Args:
+            dependent_path: Path of the dependent constraint
+            dependency_paths: Paths of the dependency constraints
+        """
+        self._defer(self._add_dependencies, dependent_path, list(dependency_paths))
+
+    def _add_dependencies(self, dependent_path: str, dependency_paths: List[str]) -> None:
+        graph = self._graph
+        key_to_index = graph.key_to_index
+        dependent = key_to_index.get(dependent_path)
+        if dependent is None:
+            return
+
+        graph.link_many(dependent, [
+            key_to_index[path] for path in dependency_paths if path in key_to_index])
+
+    def _sorted_order(self) -> Tuple[Constraint, ...]:
+        """
+        Get the cached validation order, sorting the graph if it changed.
+
+        Recursive schemas make constraints depend on each other; those come
+        last, in the order they were added.
+
+        Returns:
+            Tuple of constraints in dependency order
+        """
+        order = self._order_cache
+        if order is None:
+            graph = self.graph
+            try:
+                sorted_items = graph.topological_sort()
+            except CycleError as e:
+                sorted_items = e.partial_order
+                sorted_items.extend(graph.items[graph.key_to_index[key]] for key in e.remaining)
+            order = self._order_cache = tuple(sorted_items)
+        return order
 
     def get_validation_order(self) -> List[Constraint]:
         """
         Get constraints in topological order for validation.
 
+        The order is sorted once and reused until the graph changes, but
+        each call returns a new list; callers that only iterate it should
+        use iter_validation_order() or freeze() instead.
+
         Returns:
             List of constraints in dependency order
         """
-        return self.graph.topological_sort()
+        return list(self._sorted_order())
+
+    def iter_validation_order(self) -> Iterator[Constraint]:
+        """
+        Iterate over constraints in topological order, without copying it.
+
+        Returns:
+            Iterator over constraints in dependency order
+        """
+        return iter(self._sorted_order())
+
+    def freeze(self) -> Tuple[Constraint, ...]:
+        """
+        Get the validation order as a shared tuple, and build the reverse.
+
+        Constraints store their validation order as a tuple, so handing
+        them this one spares a copy.
+
+        Returns:
+            Tuple of constraints in dependency order
+        """
+        self.get_reverse_validation_order()
+        return self._sorted_order()
+
+    def get_reverse_validation_order(self) -> Tuple[Constraint, ...]:
+        """
+        Get constraints in reverse topological order, dependents first.
+
+        Like the validation order, this is built once and reused until the
+        graph changes.
+
+        Returns:
+            Tuple of constraints in reverse dependency order
+        """
+        order = self._reverse_order_cache
+        if order is None:
+            order = self._reverse_order_cache = tuple(reversed(self._sorted_order()))
+        return order
@@ -22,8 +22,8 @@ from .constraints import (
     TypeConstraintImpl,
     CombinedConstraint
 )
-from .graph import ConstraintDependencyGraph, DependencyNode
-from .utils import SchemaKeywords, JsonPointer
+from .graph import ConstraintDependencyGraph
+from .utils import SchemaKeywords, SchemaPropertyIndex, JsonPointer
 
 
 class ConstraintBuilder:
@@ -41,6 +41,7 @@ class ConstraintBuilder:
         self.schema_cache = {}  # Path -> Schema mapping
         self.ref_cache = {}    # Reference path -> Constraint mapping
         self.root_schema = None  # Root schema for reference resolution
+        self.property_index = None  # Property index of the root schema, shared by references
 
         # Dependency graph for constraint ordering
         self.dependency_graph = ConstraintDependencyGraph()
@@ -65,6 +66,7 @@ class ConstraintBuilder:
         self.schema_cache = {}
         self.ref_cache = {}
         self.root_schema = schema
+        self.property_index = SchemaPropertyIndex(schema)
         self.dependency_graph = ConstraintDependencyGraph()
         self.type_constraints = {}
         self.logical_constraints = {}
@@ -83,8 +85,8 @@ class ConstraintBuilder:
         # Phase 4: Attach validation order to the root constraint
         root_constraint = self.constraints.get("")
         if root_constraint:
-            validation_order = self.dependency_graph.get_validation_order()
-            setattr(root_constraint, "validation_order", validation_order)
+            validation_order = self.dependency_graph.freeze()
+            root_constraint.validation_order = validation_order
 
         # Return the root constraint
         return root_constraint
@@ -124,69 +126,74 @@ class ConstraintBuilder:
 
     def _cache_schema_paths(self, schema: Dict[str, Any], path: str) -> None:
         """
-        Recursively cache all schemas by their JSON paths.
+        Cache all schemas by their JSON paths.
+
+        Sub-schemas are walked with an explicit stack, so deeply nested
+        schemas do not hit the recursion limit.
 
         Args:
             schema: Schema to process
             path: JSON path to this schema
         """
-        # Store this schema at its path
-        self.schema_cache[path] = schema
+        stack = [(schema, path)]
+        while stack:
+            schema, path = stack.pop()
 
-        # Handle properties if it's an object schema
-        if SchemaKeywords.PROPERTIES in schema:
-            for prop, prop_schema in schema[SchemaKeywords.PROPERTIES].items():
-                if isinstance(prop_schema, dict):
-                    self._cache_schema_paths(
-                        prop_schema, f"{path}/properties/{prop}")
-
-        # Handle additionalProperties if it's an object schema
-        if SchemaKeywords.ADDITIONAL_PROPERTIES in schema and isinstance(schema[SchemaKeywords.ADDITIONAL_PROPERTIES], dict):
-            self._cache_schema_paths(
-                schema[SchemaKeywords.ADDITIONAL_PROPERTIES], f"{path}/additionalProperties")
-
-        # Handle items if it's an array schema
-        if SchemaKeywords.ITEMS in schema and isinstance(schema[SchemaKeywords.ITEMS], dict):
-            self._cache_schema_paths(
-                schema[SchemaKeywords.ITEMS], f"{path}/items")
-
-        # Handle pattern properties if it's an object schema
-        if SchemaKeywords.PATTERN_PROPERTIES in schema:
-            for pattern, pattern_schema in schema[SchemaKeywords.PATTERN_PROPERTIES].items():
-                if isinstance(pattern_schema, dict):
-                    self._cache_schema_paths(
-                        pattern_schema, f"{path}/patternProperties/{pattern}")
+            # Store this schema at its path
+            self.schema_cache[path] = schema
+            children = []
 
-        # Handle property names if it's an object schema
-        if SchemaKeywords.PROPERTY_NAMES in schema and isinstance(schema[SchemaKeywords.PROPERTY_NAMES], dict):
-            self._cache_schema_paths(
-                schema[SchemaKeywords.PROPERTY_NAMES], f"{path}/propertyNames")
+            # Handle properties if it's an object schema
+            if SchemaKeywords.PROPERTIES in schema:
+                for prop, prop_schema in schema[SchemaKeywords.PROPERTIES].items():
+                    if isinstance(prop_schema, dict):
+                        children.append((prop_schema, f"{path}/properties/{prop}"))
 
-        # Handle allOf, anyOf, oneOf, not
-        if SchemaKeywords.ALL_OF in schema:
-            for i, sub_schema in enumerate(schema[SchemaKeywords.ALL_OF]):
-                if isinstance(sub_schema, dict):
-                    self._cache_schema_paths(sub_schema, f"{path}/allOf/{i}")
+            # Handle additionalProperties if it's an object schema
+            if SchemaKeywords.ADDITIONAL_PROPERTIES in schema and isinstance(schema[SchemaKeywords.ADDITIONAL_PROPERTIES], dict):
+                children.append((schema[SchemaKeywords.ADDITIONAL_PROPERTIES], f"{path}/additionalProperties"))
 
-        if SchemaKeywords.ANY_OF in schema:
-            for i, sub_schema in enumerate(schema[SchemaKeywords.ANY_OF]):
-                if isinstance(sub_schema, dict):
-                    self._cache_schema_paths(sub_schema, f"{path}/anyOf/{i}")
+            # Handle items if it's an array schema
+            if SchemaKeywords.ITEMS in schema and isinstance(schema[SchemaKeywords.ITEMS], dict):
+                children.append((schema[SchemaKeywords.ITEMS], f"{path}/items"))
 
-        if SchemaKeywords.ONE_OF in schema:
-            for i, sub_schema in enumerate(schema[SchemaKeywords.ONE_OF]):
-                if isinstance(sub_schema, dict):
-                    self._cache_schema_paths(sub_schema, f"{path}/oneOf/{i}")
+            # Handle pattern properties if it's an object schema
+            if SchemaKeywords.PATTERN_PROPERTIES in schema:
+                for pattern, pattern_schema in schema[SchemaKeywords.PATTERN_PROPERTIES].items():
+                    if isinstance(pattern_schema, dict):
+                        children.append((pattern_schema, f"{path}/patternProperties/{pattern}"))
 
-        if SchemaKeywords.NOT in schema and isinstance(schema[SchemaKeywords.NOT], dict):
-            self._cache_schema_paths(schema[SchemaKeywords.NOT], f"{path}/not")
+            # Handle property names if it's an object schema
+            if SchemaKeywords.PROPERTY_NAMES in schema and isinstance(schema[SchemaKeywords.PROPERTY_NAMES], dict):
+                children.append((schema[SchemaKeywords.PROPERTY_NAMES], f"{path}/propertyNames"))
 
-        # Handle definitions
-        if "definitions" in schema:
-            for def_name, def_schema in schema["definitions"].items():
-                if isinstance(def_schema, dict):
-                    self._cache_schema_paths(
-                        def_schema, f"{path}/definitions/{def_name}")
+            # Handle allOf, anyOf, oneOf, not
+            if SchemaKeywords.ALL_OF in schema:
+                for i, sub_schema in enumerate(schema[SchemaKeywords.ALL_OF]):
+                    if isinstance(sub_schema, dict):
+                        children.append((sub_schema, f"{path}/allOf/{i}"))
+
+            if SchemaKeywords.ANY_OF in schema:
+                for i, sub_schema in enumerate(schema[SchemaKeywords.ANY_OF]):
+                    if isinstance(sub_schema, dict):
+                        children.append((sub_schema, f"{path}/anyOf/{i}"))
+
+            if SchemaKeywords.ONE_OF in schema:
+                for i, sub_schema in enumerate(schema[SchemaKeywords.ONE_OF]):
+                    if isinstance(sub_schema, dict):
+                        children.append((sub_schema, f"{path}/oneOf/{i}"))
+
+            if SchemaKeywords.NOT in schema and isinstance(schema[SchemaKeywords.NOT], dict):
+                children.append((schema[SchemaKeywords.NOT], f"{path}/not"))
+
+            # Handle definitions
+            if "definitions" in schema:
+                for def_name, def_schema in schema["definitions"].items():
+                    if isinstance(def_schema, dict):
+                        children.append((def_schema, f"{path}/definitions/{def_name}"))
+
+            # Pushed in reverse, so schemas are cached in document order
+            stack.extend(reversed(children))
 
     def _create_constraint_tree(self, schema: Dict[str, Any], path: str) -> None:
         """
@@ -206,7 +213,7 @@ class ConstraintBuilder:
         self.constraints[path] = constraint
 
         # Add the constraint to the dependency graph
-        node = self.dependency_graph.add_constraint(constraint, path)
+        self.dependency_graph.add_constraint(constraint, path)
 
         # Register the constraint in the appropriate category
         self._categorize_constraint(constraint, path, schema)
@@ -577,7 +584,7 @@ class ConstraintBuilder:
 
                 # Create a reference constraint
                 ref_constraint = ReferenceConstraint(
-                    ref, self._create_resolver())
+                    ref, self._create_resolver(), self.property_index)
                 self.constraints[path] = ref_constraint
                 self.ref_cache[ref] = ref_constraint
 
@@ -651,20 +658,18 @@ class ConstraintBuilder:
             parent_path = logical_path.rsplit(
                 '/', 1)[0] if '/' in logical_path else ""
 
-            # Find type constraints in the same parent scope
-            for type_path, (type_constraint, json_type) in self.type_constraints.items():
-                if type_path.startswith(parent_path):
-                    # Type constraint is in the same scope, establish dependency
-                    self.dependency_graph.add_dependency(
-                        logical_path, type_path)
+            # Find type constraints in the same parent scope, and establish
+            # dependencies on them
+            self.dependency_graph.add_dependencies(logical_path, [
+                type_path for type_path in self.type_constraints if type_path.startswith(parent_path)])
 
             # Special handling for NOT constraints
             if logical_type == "not":
-                # NOT constraints should be validated last
-                for other_path in self.constraints:
-                    if other_path != logical_path and other_path.startswith(parent_path):
-                        self.dependency_graph.add_dependency(
-                            logical_path, other_path)
+                # NOT constraints should be validated last; edges already
+                # added for type constraints are skipped by the graph
+                self.dependency_graph.add_dependencies(logical_path, [
+                    other_path for other_path in self.constraints
+                    if other_path != logical_path and other_path.startswith(parent_path)])
 
     def _resolve_json_pointer(self, document: Any, pointer: str) -> Any:
         """
@@ -739,9 +744,9 @@ class ConstraintBuilder:
                 if type_value == "string":
                     constraints.append(StringConstraint())
                 elif type_value == "integer":
-                    constraints.append(NumberConstraint(integer_only=True))
+                    constraints.append(NumberConstraint.get(integer_only=True))
                 elif type_value == "number":
-                    constraints.append(NumberConstraint())
+                    constraints.append(NumberConstraint.get())
                 elif type_value == "boolean":
                     constraints.append(BooleanConstraint())
                 elif type_value == "null":
@@ -882,7 +887,7 @@ class ConstraintBuilder:
         multiple_of = schema.get(SchemaKeywords.MULTIPLE_OF)
         integer_only = schema.get(SchemaKeywords.TYPE) == "integer"
 
-        return NumberConstraint(
+        return NumberConstraint.get(
             minimum=minimum,
             maximum=maximum,
             exclusive_minimum=exclusive_minimum,
@@ -915,6 +920,7 @@ class ConstraintBuilder:
                 # Create a new builder just for this reference
                 temp_builder = ConstraintBuilder()
                 temp_builder.root_schema = self.root_schema
+                temp_builder.property_index = self.property_index
                 constraint = temp_builder._create_constraint(ref_schema, "")
 
                 return constraint
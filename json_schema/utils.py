@@ -2,7 +2,8 @@
 Utility classes and functions for the Enhanced JSON Schema Validator.
 """
 
-from typing import Any, Dict, List, Optional, Union, Tuple, Set
+import sys
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Union, Tuple, Set
 
 
 class JsonPointer:
@@ -133,6 +134,30 @@ class TypeUtils:
         "null": type(None)
     }
     
+    # Bit of each type reported by get_json_type, so that a set of types
+    # can be held in an int mask
+    TYPE_BITS = {
+        "null": 1,
+        "boolean": 2,
+        "integer": 4,
+        "number": 8,
+        "string": 16,
+        "array": 32,
+        "object": 64,
+        "unknown": 128
+    }
+
+    # Map from builtin Python types to the bits of their JSON types
+    CLASS_TYPE_BITS = {
+        type(None): 1,
+        bool: 2,
+        int: 4,
+        float: 8,
+        str: 16,
+        list: 32,
+        dict: 64
+    }
+    
     # Map of type relationships (type -> set of compatible types)
     TYPE_HIERARCHY = {
         "number": {"number", "integer"}
@@ -200,6 +225,39 @@ class TypeUtils:
             # Best effort for custom types
             return "unknown"
     
+    @staticmethod
+    def get_json_type_bit(value: Any) -> int:
+        """
+        Get the bit of the JSON Schema type for a Python value.
+        
+        Args:
+            value: Python value
+            
+        Returns:
+            Bit of the type get_json_type reports, from TYPE_BITS
+        """
+        bit = TypeUtils.CLASS_TYPE_BITS.get(type(value))
+        if bit is None:
+            # Subclasses of the builtin types and custom types
+            bit = TypeUtils.TYPE_BITS[TypeUtils.get_json_type(value)]
+        return bit
+    
+    @staticmethod
+    def get_types_mask(types: Iterable[str]) -> int:
+        """
+        Get the mask of a set of JSON Schema types.
+        
+        Args:
+            types: JSON Schema type names, as reported by get_json_type
+            
+        Returns:
+            Bitwise or of the bits of the types
+        """
+        mask = 0
+        for t in types:
+            mask |= TypeUtils.TYPE_BITS[t]
+        return mask
+    
     @staticmethod
     def get_compatible_types(schema_type: str) -> Set[str]:
         """
@@ -422,4 +480,78 @@ class SchemaKeywords:
         }:
             return "object"
             
-        return None
\ No newline at end of file
+        return None
+
+
+class SchemaPropertyIndex:
+    """
+    Index of the property names defined by the subschemas of a root schema.
+
+    A subschema defines the names in its properties, plus those defined by
+    the subschemas of its allOf, anyOf and oneOf keywords, to any depth.
+    Each subschema is walked once, on the first lookup of its pointer.
+    """
+
+    def __init__(self, root_schema: Dict[str, Any]):
+        """
+        Initialize a new property index.
+
+        Args:
+            root_schema: The root schema document
+        """
+        self.root_schema = root_schema
+        self._properties: Dict[str, FrozenSet[str]] = {}
+
+    def get(self, pointer: str) -> FrozenSet[str]:
+        """
+        Get the property names defined by a subschema.
+
+        Args:
+            pointer: JSON Pointer to the subschema
+
+        Returns:
+            Set of property names, empty if the pointer does not resolve
+            to a schema
+        """
+        properties = self._properties.get(pointer)
+        if properties is None:
+            properties = self._properties[pointer] = self._collect(pointer)
+        return properties
+
+    def _collect(self, pointer: str) -> FrozenSet[str]:
+        """
+        Collect the property names defined by a subschema.
+
+        Args:
+            pointer: JSON Pointer to the subschema
+
+        Returns:
+            Set of property names
+        """
+        try:
+            schema = JsonPointer.resolve(self.root_schema, pointer)
+        except Exception:
+            return frozenset()
+
+        properties: Set[str] = set()
+        seen: Set[int] = set()
+        stack = [schema]
+        while stack:
+            schema = stack.pop()
+            if not isinstance(schema, dict) or id(schema) in seen:
+                continue
+            seen.add(id(schema))
+
+            if isinstance(schema.get(SchemaKeywords.PROPERTIES), dict):
+                # Interned like the property names of object constraints
+                properties.update(
+                    sys.intern(name) if type(name) is str else name
+                    for name in schema[SchemaKeywords.PROPERTIES])
+
+            # Properties of logical combinations belong to the schema too
+            for keyword in (SchemaKeywords.ALL_OF, SchemaKeywords.ANY_OF, SchemaKeywords.ONE_OF):
+                branches = schema.get(keyword)
+                if isinstance(branches, list):
+                    stack.extend(branches)
+
+        return frozenset(properties)
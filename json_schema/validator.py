@@ -5,6 +5,7 @@ Validator implementation with topological constraint ordering.
 from typing import Any, Dict, List, Optional
 
 from .constraints import Constraint, ValidationContext, ArrayConstraint, ObjectConstraint
+from .constraints.base import _ShortCircuit
 from .api import ValidationResult, ErrorCode
 
 
@@ -28,36 +29,79 @@ class Validator:
         """
         self.verbose = verbose
 
-    def validate(self, data: Any, constraint: Constraint) -> ValidationResult:
+    def validate(self, data: Any, constraint: Constraint,
+                 collect_errors: bool = True,
+                 fail_fast: bool = False) -> ValidationResult:
         """
         Validate data against a compiled constraint.
 
         Args:
             data: Data to validate
             constraint: Compiled constraint to validate against
+            collect_errors: Whether to collect errors; if False, validation
+                stops at the first error and no errors are reported
+            fail_fast: Whether constraints may stop checking a value after
+                its first error, so only some of the errors are reported
 
         Returns:
             ValidationResult containing validation status and errors
         """
-        # Create a validation context
-        context = ValidationContext(verbose=self.verbose)
+        # Only the verdict is needed, so use the compiled predicate if the
+        # whole constraint tree could be compiled
+        if not collect_errors:
+            predicate = constraint.predicate()
+            if predicate is not None:
+                return ValidationResult(valid=predicate(data), errors=[])
+
+        # Get a validation context, reusing a released one if possible
+        context = ValidationContext.acquire(
+            verbose=self.verbose, collect_errors=collect_errors, fail_fast=fail_fast)
+
+        try:
+            try:
+                valid = self._validate_root(data, constraint, context)
+            except _ShortCircuit:
+                valid = False
+
+            # Contexts only allocate an errors list once an error is added
+            errors = context.errors or []
+        finally:
+            context.release()
+
+        # Build the deferred messages of the errors that are reported
+        for error in errors:
+            error.message = error.formatted
+
+        # Create and return the validation result
+        return ValidationResult(
+            valid=valid,
+            errors=errors
+        )
+
+    def _validate_root(self, data: Any, constraint: Constraint, context: ValidationContext) -> bool:
+        """
+        Validate data against the root constraint of a compiled schema.
 
+        Args:
+            data: Data to validate
+            constraint: Root constraint
+            context: Validation context
+
+        Returns:
+            True if validation succeeds, False otherwise
+        """
         # Determine which validation approach to use
         if self._is_logical_operator(constraint):
             # Delegate to the logical operator's own validate method
             valid = constraint.validate(data, context)
-        elif hasattr(constraint, "validation_order") and getattr(constraint, "validation_order"):
+        elif constraint.validation_order is not None:
             # Use hierarchical validation that respects structure
             valid = self._validate_hierarchically(data, constraint, context)
         else:
             # Standard validation for simple constraints
             valid = constraint.validate(data, context)
 
-        # Create and return the validation result
-        return ValidationResult(
-            valid=valid,
-            errors=context.errors
-        )
+        return valid
 
     def _is_logical_operator(self, constraint: Constraint) -> bool:
         """
@@ -120,7 +164,7 @@ class Validator:
             True if validation succeeds, False otherwise
         """
         # Get the validation order
-        validation_order = getattr(constraint, "validation_order")
+        validation_order = constraint.validation_order
 
         # Track path -> type errors mapping
         type_errors = {}
@@ -61,6 +61,21 @@ class TestArrayValidation:
         assert result.errors[0].code == ErrorCode.TYPE_ERROR
         assert "string" in result.errors[0].message
 
+    def test_unique_items_mixed_types(self):
+        """Test uniqueness of items with mixed and nested types."""
+        schema = {"type": "array", "uniqueItems": True}
+
+        # Values with the same string form but different types are distinct
+        assert self.validator.validate([1, "1", True], schema).valid
+
+        # Nested objects are compared by value, regardless of key order
+        result = self.validator.validate([{"a": 1, "b": 2}, {"b": 2, "a": 1}], schema)
+        assert not result.valid
+        assert result.errors[0].code == ErrorCode.ARRAY_ITEMS_NOT_UNIQUE
+
+        assert self.validator.validate([[1, 2], [2, 1]], schema).valid
+        assert not self.validator.validate([[1, 2], [1, 2]], schema).valid
+
     def test_array_in_object(self):
         """Test array validation within an object."""
         schema = {
@@ -2,12 +2,16 @@
 """
 Tests for basic validation features like types, enums, and const values.
 """
+from collections import OrderedDict
+from enum import Enum
+
 import pytest
 
 # autopep8: off
 from utils import setup
 setup()
 from json_schema import ErrorCode, JsonValidator
+from json_schema.constraints import NullConstraint
 # autopep8: on
 
 
@@ -54,6 +58,38 @@ class TestBasicValidation:
         assert result.errors[0].code == ErrorCode.ENUM_MISMATCH
         assert "not in enumeration" in result.errors[0].message
 
+    def test_enum_mixed_values(self):
+        """Test enumerations mixing booleans, numbers and structured values."""
+        schema = {"enum": [1, False, [1, 2], {"a": 1}]}
+
+        assert self.validator.validate(1, schema).valid
+        assert self.validator.validate(1.0, schema).valid
+        assert self.validator.validate(False, schema).valid
+        assert self.validator.validate([1, 2], schema).valid
+        assert self.validator.validate({"a": 1}, schema).valid
+
+        # Booleans and numbers are distinct JSON values
+        assert not self.validator.validate(True, schema).valid
+        assert not self.validator.validate(0, schema).valid
+        assert not self.validator.validate([2, 1], schema).valid
+
+    def test_enum_subclass_values(self):
+        """Test enumerations with values of subclasses of the builtin types."""
+        class Color(str, Enum):
+            RED = "a"
+
+        class Level(int, Enum):
+            LOW = 1
+
+        schema = {"enum": ["a", "b", 1]}
+        assert self.validator.validate(Color.RED, schema).valid
+        assert self.validator.is_valid(Level.LOW, schema)
+        assert not self.validator.validate(Level.LOW, {"enum": [True]}).valid
+
+        # Subclass members match equal builtin values
+        assert self.validator.validate("a", {"enum": [Color.RED]}).valid
+        assert not self.validator.validate("b", {"enum": [Color.RED]}).valid
+
     def test_const_validation(self):
         """Test validation against a constant value."""
         schema = {"const": 42}
@@ -70,6 +106,12 @@ class TestBasicValidation:
         assert result.errors[0].code == ErrorCode.CONST_MISMATCH
         assert "Expected constant value" in result.errors[0].message
 
+        # Booleans and numbers are distinct JSON values
+        assert not self.validator.validate(True, {"const": 1}).valid
+        assert not self.validator.validate(0, {"const": False}).valid
+        assert self.validator.validate(False, {"const": False}).valid
+        assert self.validator.validate(42.0, schema).valid
+
     def test_multiple_types(self):
         """Test validation against multiple types."""
         schema = {"type": ["string", "number"]}
@@ -88,6 +130,21 @@ class TestBasicValidation:
         assert len(result.errors) == 1
         assert result.errors[0].code == ErrorCode.TYPE_ERROR
 
+    def test_shared_null_constraint(self):
+        """Test that schemas sharing the null constraint do not affect each other."""
+        null_schema = {"type": "null"}
+        one_of_schema = {"oneOf": [{"type": "null"}, {"type": "string"}]}
+
+        assert self.validator.compile(null_schema) is NullConstraint.INSTANCE
+        assert self.validator.validate(None, null_schema).valid
+        assert not self.validator.validate(0, null_schema).valid
+
+        assert self.validator.validate(None, one_of_schema).valid
+        assert self.validator.validate("a", one_of_schema).valid
+        result = self.validator.validate(1, one_of_schema)
+        assert not result.valid
+        assert result.errors[0].code == ErrorCode.ONE_OF_NO_MATCH
+
     def test_type_edge_cases(self):
         """Test edge cases in type validation."""
         # Boolean vs number/integer distinction
@@ -131,6 +188,24 @@ class TestBasicValidation:
         result = self.validator.validate(3.14, schema_boolean)
         assert not result.valid
 
+    def test_builtin_subclasses(self):
+        """Test that subclasses of the builtin types are accepted as their JSON types."""
+        class Color(str, Enum):
+            RED = "red"
+
+        class Level(int, Enum):
+            LOW = 1
+
+        for value, schema in [
+            (OrderedDict(a=1), {"type": "object", "properties": {"a": {"type": "integer"}}}),
+            (OrderedDict(), {"type": ["object", "null"]}),
+            (Color.RED, {"type": "string", "minLength": 1}),
+            (Level.LOW, {"type": "integer", "minimum": 1}),
+            (Level.LOW, {"type": ["integer", "null"]}),
+        ]:
+            assert self.validator.validate(value, schema).valid
+            assert self.validator.is_valid(value, schema)
+
     def test_reference_resolution(self):
         """Test resolution of schema references."""
         schema = {
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for the constraint dependency graph.
+"""
+import pytest
+
+# autopep8: off
+from utils import setup
+setup()
+from json_schema.graph import CycleError, DependencyGraph
+# autopep8: on
+
+
+class TestDependencyGraph:
+    """Tests for DependencyGraph class."""
+
+    def setup_method(self):
+        """Set up the test environment."""
+        self.graph = DependencyGraph()
+        for key in ["a", "b", "c", "d"]:
+            self.graph.add_node(key.upper(), key)
+
+    def test_topological_sort(self):
+        """Test sorting items after their dependencies, in insertion order otherwise."""
+        assert self.graph.edge_count == 0
+        assert self.graph.topological_sort() == ["A", "B", "C", "D"]
+
+        self.graph.add_dependency("a", "c")
+        self.graph.add_dependency("b", "d")
+        self.graph.add_dependency("b", "d")  # Duplicate edges are ignored
+        self.graph.add_dependency("a", "missing")  # Unknown keys are ignored
+        assert self.graph.edge_count == 2
+        assert self.graph.topological_sort() == ["C", "A", "D", "B"]
+
+        self.graph.nodes["a"].remove_dependency(self.graph.nodes["c"])
+        assert self.graph.topological_sort() == ["A", "C", "D", "B"]
+
+    def test_insertion_order(self):
+        """Test that dependencies on earlier nodes keep the insertion order."""
+        self.graph.add_dependency("b", "a")
+        self.graph.add_dependency("d", "a")
+        assert self.graph.backward_edge_count == 0
+        assert self.graph.topological_sort() == ["A", "B", "C", "D"]
+
+        self.graph.add_dependency("b", "c")
+        assert self.graph.backward_edge_count == 1
+        assert self.graph.topological_sort() == ["A", "C", "B", "D"]
+
+        self.graph.nodes["b"].remove_dependency(self.graph.nodes["c"])
+        assert self.graph.backward_edge_count == 0
+
+    def test_cycle(self):
+        """Test that cyclic dependencies are reported."""
+        self.graph.add_dependency("a", "b")
+        self.graph.add_dependency("b", "a")
+        self.graph.add_dependency("d", "b")
+
+        with pytest.raises(CycleError) as excinfo:
+            self.graph.topological_sort()
+        assert excinfo.value.remaining == ["a", "b", "d"]
+        assert excinfo.value.partial_order == ["C"]
+
+        assert self.graph.try_topological_sort() is None
+
+    def test_link_many(self):
+        """Test adding several dependencies of a node at once."""
+        graph = self.graph
+        graph.link_many(graph.key_to_index["a"], [graph.key_to_index["d"], graph.key_to_index["c"]])
+        graph.link_many(graph.key_to_index["a"], [graph.key_to_index["c"]])
+        assert [node.key for node in graph.nodes["a"].dependencies] == ["d", "c"]
+        assert [node.key for node in graph.nodes["c"].dependents] == ["a"]
+        assert graph.topological_sort() == ["B", "C", "D", "A"]
+
+    def test_deep_chain(self):
+        """Test that long dependency chains are sorted without recursion."""
+        graph = DependencyGraph()
+        for i in range(5000):
+            graph.add_node(i, str(i))
+            if i:
+                graph.add_dependency(str(i - 1), str(i))
+
+        assert graph.topological_sort() == list(range(4999, -1, -1))
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
@@ -122,6 +122,58 @@ class TestIntegration:
         result = validator.validate([1, "2", 3], array_schema)
         assert not result.valid
 
+    def test_compiled_schema_reuse(self):
+        """Test that compiled schemas are cached and can be reused directly."""
+        validator = JsonValidator()
+        schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+
+        # The same schema object compiles to the same constraint tree
+        compiled = validator.compile(schema)
+        assert validator.compile(schema) is compiled
+
+        # A structurally equal copy reuses the same constraint tree
+        copy = json.loads(json.dumps(schema))
+        assert validator.compile(copy) is compiled
+
+        # A structurally different schema gets its own constraint tree
+        assert validator.compile({"type": "string"}) is not compiled
+
+        # A compiled schema can be passed to validate directly
+        assert validator.validate({"id": 1}, compiled).valid
+        assert not validator.validate({"id": "1"}, compiled).valid
+        assert validator.validate({"id": 1}, schema).valid
+
+    def test_is_valid_matches_validate(self):
+        """Test that is_valid agrees with validate, including logical branches."""
+        validator = JsonValidator()
+        cases = [
+            ({"type": "string", "minLength": 2}, ["ab", "a", 1]),
+            ({"type": "array", "items": {"type": "integer"}}, [[1, 2], [1, "2"], "x"]),
+            ({"anyOf": [{"type": "string"}, {"type": "integer"}]}, ["a", 1, 1.5]),
+            ({"oneOf": [{"type": "integer"}, {"minimum": 0}]}, [-1, 1, 0.5]),
+            ({"not": {"type": "string"}}, [1, "a"]),
+            ({"not": {"type": "integer", "minimum": 3}}, [1, 5, 5.5, "a"]),
+            ({"not": {"not": {"type": "string", "maxLength": 1}}}, ["a", "ab", 1]),
+            ({"type": "number", "minimum": 0, "exclusiveMaximum": 10, "multipleOf": 0.5},
+             [0, 2.5, 10, -1, 0.3, True]),
+            ({"type": "integer", "multipleOf": 3}, [9, 9.0, 10, "9"]),
+            ({"type": "string", "maxLength": 3, "pattern": "^[a-z]+$"}, ["abc", "abcd", "AB", None]),
+            ({"type": "array", "uniqueItems": True, "minItems": 1,
+              "items": {"enum": [1, 2, [3]]}}, [[1, 2], [], [1, 1], [[3]], [True]]),
+            ({"type": ["string", "null"]}, ["a", None, 1]),
+            ({"const": {"a": [1]}}, [{"a": [1]}, {"a": [2]}]),
+            ({"type": "object", "required": ["a"], "additionalProperties": False,
+              "properties": {"a": {"type": "integer"}}}, [{"a": 1}, {"a": 1, "b": 2}, {}]),
+            ({"allOf": [{"minimum": 0}, {"type": "integer", "exclusiveMaximum": True, "maximum": 10},
+                        {"multipleOf": 0.5}, {"multipleOf": 0.75}, {"minimum": 0, "exclusiveMinimum": True}]},
+             [0, 1.5, 3, 4.5, 6, 9, 10, 12, -3, 3.0, "3", True]),
+        ]
+
+        for schema, values in cases:
+            for value in values:
+                expected = validator.validate(value, schema).valid
+                assert validator.is_valid(value, schema) == expected
+
     @pytest.mark.skip(reason="discovered a design flaw; addressed in v0.3.0")
     def test_project_json(self):
         """Test validation of a project.json configuration similar to the original use case."""
@@ -206,6 +206,39 @@ class TestLogicalValidation:
         assert result.errors[0].code == ErrorCode.ONE_OF_MULTIPLE_MATCHES
         assert "matches" in result.errors[0].message and "schemas" in result.errors[0].message
 
+    def test_one_of_stops_after_second_match(self):
+        """Test that only verbose oneOf validation counts every matching schema."""
+        schema = {"oneOf": [{"type": "integer"}, {"minimum": 0}, {"maximum": 100}]}
+
+        result = self.validator.validate(5, schema)
+        assert not result.valid
+        assert "at least 2 schemas" in result.errors[0].message
+        assert result.errors[1].message == "Matching schema indices: [0, 1]"
+
+        result = JsonValidator(verbose=True).validate(5, schema)
+        assert not result.valid
+        assert "matches 3 schemas" in result.errors[0].message
+        assert result.errors[1].message == "Matching schema indices: [0, 1, 2]"
+
+        # Matching the last two schemas leaves nothing unchecked
+        result = self.validator.validate(5.5, schema)
+        assert "matches 2 schemas" in result.errors[0].message
+
+    def test_branches_of_other_types(self):
+        """Test that skipping branches of other types does not change the result."""
+        verbose_validator = JsonValidator(verbose=True)
+        schemas = [
+            {"anyOf": [{"type": "string"}, {"type": "number", "minimum": 3},
+                       {"type": ["null", "integer"]}, {"enum": [[1]]}]},
+            {"oneOf": [{"type": "integer"}, {"type": "number", "maximum": 3},
+                       {"type": "string"}, {"const": 2.5}]},
+        ]
+        for schema in schemas:
+            for value in [None, 1, 2.5, 4.5, "a", [1], [2], {}, True]:
+                expected = verbose_validator.validate(value, schema).valid
+                assert self.validator.validate(value, schema).valid == expected
+                assert self.validator.is_valid(value, schema) == expected
+
     def test_not_validation(self):
         """Test 'not' validation."""
         schema = {
@@ -293,6 +326,54 @@ class TestLogicalValidation:
         assert len(result.errors) >= 1
         assert result.errors[0].code == ErrorCode.ANY_OF_NO_MATCH
 
+    def test_branch_errors_are_not_leaked(self):
+        """Test that errors from branches are only reported through the logical operator."""
+        schema = {
+            "allOf": [
+                {"anyOf": [{"type": "string"}, {"type": "integer"}]},
+                {"not": {"minimum": 10}},
+                {"maximum": 5}
+            ]
+        }
+
+        # Valid - the failed anyOf branch and the matched not schema leave no errors
+        result = self.validator.validate(3, schema)
+        assert result.valid
+        assert result.errors == []
+
+        # Invalid - only the failing allOf branch is reported, with its prefix
+        result = self.validator.validate(7, schema)
+        assert not result.valid
+        assert len(result.errors) == 1
+        assert result.errors[0].message.startswith("allOf[2]: ")
+        assert not self.validator.is_valid(7, schema)
+        assert not self.validator.is_valid(12, schema)
+        assert self.validator.is_valid(3, schema)
+
+    def test_any_of_branch_reordering(self):
+        """Test that anyOf results and error order do not depend on past matches."""
+        validator = JsonValidator(verbose=True)
+        schema = {
+            "anyOf": [
+                {"type": "string"},
+                {"type": "integer", "minimum": 10},
+                {"type": "boolean"}
+            ]
+        }
+
+        # Make the last branch the most frequent match
+        for _ in range(5):
+            assert validator.validate(True, schema).valid
+        assert validator.validate("a", schema).valid
+        assert validator.validate(12, schema).valid
+
+        result = validator.validate(3, schema)
+        assert not result.valid
+        assert result.errors[0].code == ErrorCode.ANY_OF_NO_MATCH
+        prefixes = [error.message.split(":")[0] for error in result.errors[1:]]
+        assert prefixes == sorted(prefixes)
+        assert prefixes[0] == "anyOf[0]" and prefixes[-1] == "anyOf[2]"
+
 
 if __name__ == "__main__":
     pytest.main(["-xvs", __file__])
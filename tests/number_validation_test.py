@@ -89,6 +89,25 @@ class TestNumberValidation:
         assert result.errors[0].code == ErrorCode.NUMBER_TOO_LARGE
         assert "less than" in result.errors[0].message
 
+    def test_single_and_combined_checks(self):
+        """Test schemas setting one number check, and several failing at once."""
+        result = self.validator.validate(-1, {"type": "number", "minimum": 0})
+        assert not result.valid
+        assert result.errors[0].code == ErrorCode.NUMBER_TOO_SMALL
+        assert self.validator.validate(0, {"type": "number", "minimum": 0}).valid
+
+        schema = {"type": "number", "maximum": 5, "exclusiveMaximum": True}
+        assert self.validator.validate(4.5, schema).valid
+        result = self.validator.validate(5, schema)
+        assert not result.valid
+        assert result.errors[0].code == ErrorCode.NUMBER_TOO_LARGE
+
+        # Every failing check is reported
+        result = self.validator.validate(7, {"type": "integer", "maximum": 5, "multipleOf": 2})
+        assert not result.valid
+        assert [error.code for error in result.errors] == [
+            ErrorCode.NUMBER_TOO_LARGE, ErrorCode.NUMBER_NOT_MULTIPLE]
+
     def test_integer_only(self):
         """Test integer-only validation."""
         schema = {
@@ -131,6 +150,73 @@ class TestNumberValidation:
         assert result.errors[0].code == ErrorCode.NUMBER_NOT_MULTIPLE
         assert "multiple of" in result.errors[0].message
 
+    def test_repeated_values(self):
+        """Test that values seen before report the same outcome and errors."""
+        schema = {"type": "array", "items": {"type": "number", "maximum": 5, "multipleOf": 2}}
+        result = self.validator.validate([4, 7, 4, 7, 7.0, 8], schema)
+        assert not result.valid
+        assert [(error.path, error.code) for error in result.errors] == [
+            ("/1", ErrorCode.NUMBER_TOO_LARGE), ("/1", ErrorCode.NUMBER_NOT_MULTIPLE),
+            ("/3", ErrorCode.NUMBER_TOO_LARGE), ("/3", ErrorCode.NUMBER_NOT_MULTIPLE),
+            ("/4", ErrorCode.NUMBER_TOO_LARGE), ("/4", ErrorCode.NUMBER_NOT_MULTIPLE),
+            ("/5", ErrorCode.NUMBER_TOO_LARGE),
+        ]
+        assert self.validator.validate([4, 2, 4], schema).valid
+
+    def test_shared_constraints(self):
+        """Test that equal number schemas share a constraint without mixing up bounds."""
+        schema = {
+            "type": "object",
+            "properties": {
+                "a": {"type": "integer", "minimum": 1},
+                "b": {"type": "integer", "minimum": 1},
+                "c": {"type": "number", "minimum": 1.0}
+            }
+        }
+        properties = self.validator.compile(schema).properties
+        assert properties["a"] is properties["b"]
+        assert properties["c"] is not properties["a"]
+
+        result = self.validator.validate({"a": 0, "c": 0}, schema)
+        assert [error.message for error in result.errors] == [
+            "Value 0 must be greater than or equal to 1",
+            "Value 0 must be greater than or equal to 1.0",
+        ]
+
+        # A shared constraint at the root keeps working elsewhere
+        assert not self.validator.validate(0, {"type": "integer", "minimum": 1}).valid
+        assert self.validator.validate({"a": 2, "b": 3}, schema).valid
+
+    def test_decimal_multiple_of(self):
+        """Test multipleOf with decimal divisors and large values."""
+        schema = {"type": "number", "multipleOf": 0.01}
+        for value in [19.99, 0.07, 1000000.01, 5]:
+            assert self.validator.validate(value, schema).valid
+            assert self.validator.is_valid(value, schema)
+        for value in [0.015, 19.995]:
+            assert not self.validator.validate(value, schema).valid
+            assert not self.validator.is_valid(value, schema)
+
+        # Large integers are checked exactly
+        schema = {"type": "integer", "multipleOf": 0.5}
+        assert self.validator.validate(10**20 + 1, schema).valid
+        assert not self.validator.validate(10**20 + 1, {"type": "integer", "multipleOf": 2}).valid
+
+    def test_large_float_multiple_of(self):
+        """Test that large floats are not accepted as multiples within a tolerance."""
+        cases = [
+            ({"type": "number", "multipleOf": 0.5}, [1000000000.25], [1000000000.5, 2.0**60]),
+            ({"type": "number", "multipleOf": 0.01}, [5000000.005, 123456789012.345], [123456789012.34]),
+            ({"allOf": [{"multipleOf": 0.5}, {"multipleOf": 0.25}]}, [1000000000.25], [1000000000.5]),
+        ]
+        for schema, invalid, valid in cases:
+            for value in invalid:
+                assert not self.validator.validate(value, schema).valid
+                assert not self.validator.is_valid(value, schema)
+            for value in valid:
+                assert self.validator.validate(value, schema).valid
+                assert self.validator.is_valid(value, schema)
+
     def test_standalone_constraints(self):
         """Test number constraints without explicit type."""
         schema = {
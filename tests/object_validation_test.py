@@ -200,6 +200,7 @@ class TestObjectValidation:
         assert len(result.errors) == 1
         assert result.errors[0].code == ErrorCode.ADDITIONAL_PROPERTY_NOT_ALLOWED
         assert "Additional property" in result.errors[0].message
+        assert result.errors[0].property_name == "extra"
 
         # Test with additionalProperties schema
         schema = {
@@ -351,6 +352,100 @@ class TestObjectValidation:
         assert result.errors[0].code == ErrorCode.TYPE_ERROR
         assert "Expected object, got str" in result.errors[0].message
 
+    def test_error_order(self):
+        """Test that object keyword errors come first, then property errors in property order."""
+        schema = {
+            "type": "object",
+            "minProperties": 4,
+            "required": ["a", "b"],
+            "dependencies": {"c": ["d"]},
+            "properties": {"a": {"type": "integer"}},
+            "patternProperties": {"^x": {"type": "string"}, "(": {}},
+            "additionalProperties": {"type": "boolean"}
+        }
+
+        result = self.validator.validate({"a": "1", "c": 1, "x1": 2}, schema)
+        assert not result.valid
+        assert [error.code for error in result.errors] == [
+            ErrorCode.OBJECT_TOO_FEW_PROPERTIES,
+            ErrorCode.REQUIRED_PROPERTY_MISSING,
+            ErrorCode.DEPENDENCY_MISSING,
+            ErrorCode.SCHEMA_INVALID,
+            ErrorCode.TYPE_ERROR,
+            ErrorCode.TYPE_ERROR,
+            ErrorCode.TYPE_ERROR
+        ]
+        assert [error.path for error in result.errors[4:]] == ["/a", "/x1", "/c"]
+
+        # The same constraint validates other values alike
+        result = self.validator.validate({"a": 1, "b": False, "x": "y", "z": True}, schema)
+        assert not result.valid
+        assert [error.code for error in result.errors] == [ErrorCode.SCHEMA_INVALID]
+
+    def test_fail_fast(self):
+        """Test that fail-fast validation stops at the first error of an object."""
+        schema = {
+            "type": "object",
+            "required": ["a", "b"],
+            "properties": {"a": {}, "b": {}, "c": {"type": "string", "minLength": 2}},
+            "additionalProperties": False
+        }
+        value = {"c": "x", "d": 1}
+
+        result = self.validator.validate(value, schema)
+        assert not result.valid
+        assert len(result.errors) == 4
+
+        result = self.validator.validate(value, schema, fail_fast=True)
+        assert not result.valid
+        assert [error.code for error in result.errors] == [ErrorCode.REQUIRED_PROPERTY_MISSING]
+
+        result = self.validator.validate({"a": 1, "b": 2, "c": "x"}, schema, fail_fast=True)
+        assert not result.valid
+        assert [error.code for error in result.errors] == [ErrorCode.STRING_TOO_SHORT]
+
+        # Valid data is unaffected
+        assert self.validator.validate({"a": 1, "b": 2}, schema, fail_fast=True).valid
+
+    def test_frozen_keywords(self):
+        """Test that keywords are frozen once validation begins and can be overridden."""
+        schema = {
+            "type": "object",
+            "properties": {"a": {"type": "integer"}},
+            "required": ["a"],
+            "additionalProperties": False
+        }
+        constraint = self.validator.compile(schema)
+        assert not self.validator.validate({"a": 1, "b": 2}, constraint).valid
+
+        with pytest.raises(TypeError):
+            constraint.properties["b"] = constraint.properties["a"]
+
+        # A derived constraint shares the keywords of the original
+        open_constraint = constraint.with_overrides(additional_properties=True)
+        assert open_constraint.properties is constraint.properties
+        assert self.validator.validate({"a": 1, "b": 2}, open_constraint).valid
+        assert not self.validator.validate({"b": 2}, open_constraint).valid
+
+    def test_shared_pattern_constraint(self):
+        """Test that patterns sharing a constraint validate a property once."""
+        constraint = self.validator.compile({
+            "type": "object",
+            "patternProperties": {"^x-": {"type": "integer"}},
+            "additionalProperties": False
+        })
+        integer = constraint.pattern_properties["^x-"]
+        shared = constraint.with_overrides(
+            pattern_properties={"^x-": integer, "-id$": integer, "^[a-z]+_[0-9]+$": integer})
+
+        assert self.validator.validate({"x-a": 1, "b-id": 2, "c_3": 3}, shared).valid
+
+        # "x-id" matches two patterns, but is reported once
+        result = self.validator.validate({"x-id": "1", "other": 1}, shared)
+        assert not result.valid
+        assert [error.code for error in result.errors] == [
+            ErrorCode.TYPE_ERROR, ErrorCode.ADDITIONAL_PROPERTY_NOT_ALLOWED]
+
 
 if __name__ == "__main__":
     pytest.main(["-xvs", __file__])
@@ -2,6 +2,7 @@
 """
 Tests for string-specific validation features.
 """
+import re
 import pytest
 
 # autopep8: off
@@ -97,6 +98,31 @@ class TestStringValidation:
         assert result.errors[0].code == ErrorCode.SCHEMA_INVALID
         assert "Invalid regex pattern" in result.errors[0].message
 
+    def test_simple_patterns(self):
+        """Test that simple patterns match exactly like the regex would."""
+        cases = {
+            ".*": ["", "\n", "abc"],
+            ".+": ["", "\n", "\na", "abc"],
+            "^x-": ["x-", "x-a", "ax-", "X-"],
+            "^x-.*": ["x-\n", "y-"],
+            "^.{2,3}$": ["a", "ab", "ab\n", "a\nb", "abcd"],
+            "^.{2}$": ["ab", "abc"],
+            "^.{2,}$": ["a", "abcd", "abcd\n\n"]
+        }
+
+        for pattern, values in cases.items():
+            schema = {"type": "string", "pattern": pattern}
+            for value in values:
+                expected = re.search(pattern, value) is not None
+                assert self.validator.validate(value, schema).valid == expected
+                assert self.validator.is_valid(value, schema) == expected
+
+        # Pattern properties take the same shortcuts
+        schema = {"type": "object", "patternProperties": {"^x-": {"type": "integer"}, ".*": {"minimum": 0}}}
+        assert self.validator.validate({"x-a": 1, "b": 2}, schema).valid
+        assert not self.validator.validate({"x-a": "1"}, schema).valid
+        assert not self.validator.validate({"b": -1}, schema).valid
+
     def test_standalone_constraints(self):
         """Test string constraints without explicit type."""
         schema = {
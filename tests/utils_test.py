@@ -8,7 +8,7 @@ import pytest
 from utils import setup
 setup()
 from json_schema import JsonPointer
-from json_schema.utils import TypeUtils
+from json_schema.utils import SchemaPropertyIndex, TypeUtils
 from json_schema.schema_compiler import SchemaKeywords
 # autopep8: on
 
@@ -142,6 +142,18 @@ class TestTypeUtils:
 
         assert TypeUtils.get_json_type(CustomClass()) == "unknown"
 
+    def test_get_json_type_bit(self):
+        """Test getting JSON Schema type bits from Python values."""
+        from collections import OrderedDict
+
+        for value in (None, True, 42, 3.14, "hello", [1], {"foo": "bar"}, OrderedDict(), object()):
+            assert TypeUtils.get_json_type_bit(value) == TypeUtils.TYPE_BITS[TypeUtils.get_json_type(value)]
+
+        mask = TypeUtils.get_types_mask({"integer", "number"})
+        assert TypeUtils.get_json_type_bit(42) & mask
+        assert TypeUtils.get_json_type_bit(3.14) & mask
+        assert not TypeUtils.get_json_type_bit(True) & mask
+
 
 class TestSchemaKeywords:
     """Tests for SchemaKeywords class."""
@@ -220,5 +232,33 @@ class TestSchemaKeywords:
         assert SchemaKeywords.get_implied_type("not") is None
 
 
+class TestSchemaPropertyIndex:
+    """Tests for SchemaPropertyIndex class."""
+
+    def test_get(self):
+        """Test looking up the properties defined by subschemas."""
+        schema = {
+            "definitions": {
+                "A": {
+                    "properties": {"a": {}},
+                    "allOf": [
+                        {"properties": {"b": {}}},
+                        {"anyOf": [{"oneOf": [{"properties": {"c": {}}}]}]}
+                    ]
+                },
+                "B": {"type": "string"}
+            }
+        }
+
+        index = SchemaPropertyIndex(schema)
+        assert index.get("/definitions/A") == {"a", "b", "c"}
+        assert index.get("/definitions/A/allOf/0") == {"b"}
+        assert index.get("/definitions/B") == frozenset()
+        assert index.get("/definitions/C") == frozenset()
+
+        # Subschemas are walked once
+        assert index.get("/definitions/A") is index.get("/definitions/A")
+
+
 if __name__ == "__main__":
     pytest.main(["-xvs", __file__])